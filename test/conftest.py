@@ -3,10 +3,13 @@
 from __future__ import annotations
 
 from pathlib import Path
-from typing import Generator
+from typing import Callable, Generator, Optional, Union
 
 import pytest
 
+# A ``{i}`` template or a callable of the row/sentence index.
+Row = Union[str, Callable[[int], str]]
+
 
 def pytest_addoption(parser: pytest.Parser) -> None:
     parser.addoption(
@@ -35,3 +38,57 @@ def _cleanup_dataset_root(dataset_root: Path) -> Generator[None, None, None]:
         import shutil
 
         shutil.rmtree(dataset_root, ignore_errors=True)
+
+
+def _cell(value: Row, i: int) -> str:
+    return value(i) if callable(value) else value.format(i=i)
+
+
+@pytest.fixture
+def write_news_csv(tmp_path: Path) -> Callable[..., Path]:
+    """Return a writer of ``title,text,tags,target`` CSV files (``train.csv`` in ``tmp_path``).
+
+    Row ``i`` is ``t{i},<text>,<tags>,<labels[i % len(labels)]>``; ``text`` and
+    ``tags`` are ``{i}`` templates or callables of the row index.
+    """
+
+    def write(
+        rows: int,
+        *,
+        text: Row = "text {i}",
+        tags: Row = "tag",
+        labels: str = "XY",
+        path: Optional[Path] = None,
+    ) -> Path:
+        path = path or tmp_path / "train.csv"
+        path.parent.mkdir(parents=True, exist_ok=True)
+        lines = ["title,text,tags,target"] + [
+            f"t{i},{_cell(text, i)},{_cell(tags, i)},{labels[i % len(labels)]}" for i in range(rows)
+        ]
+        path.write_text("\n".join(lines) + "\n", encoding="utf8")
+        return path
+
+    return write
+
+
+@pytest.fixture
+def write_conllu(tmp_path: Path) -> Callable[..., Path]:
+    """Return a writer of CoNLL-U files (``pos.conllu`` in ``tmp_path``).
+
+    Sentence ``i`` defaults to the tokens ``w{i} v{i}`` tagged ``A B``; pass a
+    ``{i}`` template or callable as ``sentence`` to change it.
+    """
+
+    def write(
+        sentences: int,
+        *,
+        sentence: Row = "1\tw{i}\t_\tA\n2\tv{i}\t_\tB\n",
+        path: Optional[Path] = None,
+    ) -> Path:
+        path = path or tmp_path / "pos.conllu"
+        path.parent.mkdir(parents=True, exist_ok=True)
+        text = "\n".join(_cell(sentence, i) for i in range(sentences))
+        path.write_text(text, encoding="utf8")
+        return path
+
+    return write
@@ -0,0 +1,143 @@
+import asyncio
+import threading
+from pathlib import Path
+from typing import List
+
+import pytest
+
+from ua_datasets import MovaInstitutePOSDataset, NewsClassificationDataset, UaSquadDataset, aio
+from ua_datasets.aio import adownload_text_with_retries, fetch_bytes, gather_limited
+from ua_datasets.benchmarks.server import serve_directory
+from ua_datasets.bundle import write_bundle
+from ua_datasets.text_classification.news_classification import DownloadError
+from ua_datasets.utils import DownloadFailure
+
+NEWS = "title,text,tags,target\nt1,body one,a,X\nt2,body two,b,Y\n"
+POS = "1\tw\t_\tA\n2\tv\t_\tB\n\n1\tx\t_\tC\n"
+SQUAD = '{"data": [{"question": "q?", "context": "c a", "answer": "a"}]}'
+
+
+@pytest.fixture
+def served(tmp_path: Path):
+    remote = tmp_path / "remote"
+    remote.mkdir()
+    (remote / "train.csv").write_text(NEWS, encoding="utf8")
+    (remote / "test.csv").write_text(NEWS, encoding="utf8")
+    (remote / "pos.conllu").write_text(POS, encoding="utf8")
+    (remote / "val.json").write_text(SQUAD, encoding="utf8")
+    with serve_directory(remote) as base_url:
+        yield base_url
+
+
+def test_aload_downloads_and_parses_concurrently(served: str, tmp_path: Path) -> None:
+    root = tmp_path / "local"
+    on_loop_thread: List[bool] = []
+
+    async def main():
+        limiter = asyncio.Semaphore(2)
+        loop_thread = threading.get_ident()
+
+        async def ticker() -> None:  # the loop keeps running while datasets load
+            on_loop_thread.append(threading.get_ident() == loop_thread)
+
+        return await gather_limited(
+            [
+                NewsClassificationDataset.aload(root, base_url=served, limiter=limiter),
+                NewsClassificationDataset.aload(
+                    root, split="test", base_url=served, limiter=limiter
+                ),
+                MovaInstitutePOSDataset.aload(
+                    root, data_file=f"{served}pos.conllu", file_name="pos.conllu"
+                ),
+                UaSquadDataset.aload(root, split="val", base_url=served),
+                ticker(),
+            ],
+            limit=3,
+        )
+
+    train, test, pos, squad, _ = asyncio.run(main())
+    assert on_loop_thread == [True]
+    assert list(train) == list(NewsClassificationDataset(root=root, download=False))
+    assert len(test) == 2
+    assert list(pos) == [(["w", "v"], ["A", "B"]), (["x"], ["C"])]
+    assert squad[0]["answers"]["text"] == ["a"]
+    assert (root / "val.json").read_text(encoding="utf8") == SQUAD
+    assert train.download is False
+
+
+def test_aload_missing_file_raises_download_error(served: str, tmp_path: Path) -> None:
+    with pytest.raises(DownloadError, match="HTTP 404"):
+        asyncio.run(
+            NewsClassificationDataset.aload(
+                tmp_path / "local", split="missing", base_url=served, max_retries=1
+            )
+        )
+
+
+def _serve(responses: List[bytes]):
+    """asyncio server answering successive requests with the given raw responses."""
+    requests: List[bytes] = []
+
+    async def handle(reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        requests.append(await reader.readuntil(b"\r\n\r\n"))
+        writer.write(responses.pop(0))
+        await writer.drain()
+        writer.close()
+
+    return handle, requests
+
+
+def test_redirect_chunked_and_retry() -> None:
+    payload = "прив".encode()
+    responses = [
+        b"HTTP/1.1 503 Unavailable\r\nContent-Length: 0\r\n\r\n",
+        b"HTTP/1.1 302 Found\r\nLocation: /final?x=1\r\nContent-Length: 0\r\n\r\n",
+        b"HTTP/1.1 200 OK\r\nTransfer-Encoding: chunked\r\n\r\n"
+        + b"3\r\n"
+        + payload[:3]
+        + b"\r\n"
+        + f"{len(payload) - 3:x}\r\n".encode()
+        + payload[3:]
+        + b"\r\n0\r\n\r\n",
+    ]
+    handle, requests = _serve(responses)
+
+    async def main() -> str:
+        server = await asyncio.start_server(handle, "127.0.0.1", 0)
+        port = server.sockets[0].getsockname()[1]
+        async with server:
+            return await adownload_text_with_retries(
+                f"http://127.0.0.1:{port}/start", backoff_factor=0.01
+            )
+
+    assert asyncio.run(main()) == payload.decode()
+    assert [r.split(b" ")[1] for r in requests] == [b"/start", b"/start", b"/final?x=1"]
+
+
+def test_retries_exhausted_and_fatal_errors() -> None:
+    calls: List[str] = []
+
+    async def flaky(url: str, *, timeout: float) -> bytes:
+        calls.append(url)
+        raise ConnectionResetError("reset")
+
+    with pytest.raises(DownloadFailure, match="after 3 attempts: reset"):
+        asyncio.run(adownload_text_with_retries("http://x/", fetch=flaky, backoff_factor=0))
+    assert len(calls) == 3
+    with pytest.raises(ValueError, match="Unsupported URL"):
+        asyncio.run(fetch_bytes("ftp://example.org/file"))
+    with pytest.raises(ValueError, match="limit must be positive"):
+        asyncio.run(gather_limited([], limit=0))
+
+
+def test_aload_from_bundle_skips_download(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    (tmp_path / "train.csv").write_text(NEWS, encoding="utf8")
+    news = NewsClassificationDataset(root=tmp_path, download=False)
+    bundle = write_bundle(tmp_path / "corpora.uab", {"news": news})
+
+    async def no_download(url: str, **kwargs: object) -> str:
+        raise AssertionError(f"unexpected download of {url}")
+
+    monkeypatch.setattr(aio, "adownload_text_with_retries", no_download)
+    loaded = asyncio.run(NewsClassificationDataset.aload(Path("news"), bundle=bundle))
+    assert list(loaded) == list(news)
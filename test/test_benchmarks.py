@@ -0,0 +1,61 @@
+import json
+from pathlib import Path
+
+import pytest
+
+from ua_datasets import MovaInstitutePOSDataset, NewsClassificationDataset
+from ua_datasets.benchmarks import (
+    CORPORA,
+    compare_to_baseline,
+    load_report,
+    main,
+    run_benchmarks,
+    write_conllu,
+    write_news_csv,
+)
+
+
+def test_generators_are_deterministic(tmp_path: Path) -> None:
+    a = write_news_csv(tmp_path / "a.csv", 40, seed=3).read_bytes()
+    b = write_news_csv(tmp_path / "b.csv", 40, seed=3).read_bytes()
+    assert a == b
+    assert a != write_news_csv(tmp_path / "c.csv", 40, seed=4).read_bytes()
+
+
+def test_generated_corpora_load(tmp_path: Path) -> None:
+    write_news_csv(tmp_path / "train.csv", 50)
+    news = NewsClassificationDataset(root=tmp_path, download=False)
+    assert len(news) == 50
+    assert any("\n" in text for _, text, _, _ in news)
+    write_conllu(tmp_path / "pos.conllu", 25)
+    pos = MovaInstitutePOSDataset(
+        root=tmp_path, download=False, file_name="pos.conllu", fields=("feats",)
+    )
+    assert len(pos) == 25
+
+
+def test_run_benchmarks_report(tmp_path: Path) -> None:
+    report = run_benchmarks(scale=0.001, repeat=1, workdir=tmp_path)
+    results = report["results"]
+    assert {(r["corpus"], r["phase"]) for r in results} == {
+        (name, phase) for name in CORPORA for phase in ("download", "parse", "iterate", "stats")
+    }
+    assert all(r["wall_time"] > 0 and r["peak_traced"] is not None for r in results)
+    assert json.loads(json.dumps(report)) == report
+    assert compare_to_baseline(report, report) == []
+    slower = json.loads(json.dumps(report))
+    slower["results"][0]["wall_time"] *= 2
+    assert len(compare_to_baseline(slower, report, threshold=0.5)) == 1
+    with pytest.raises(ValueError, match="scale"):
+        compare_to_baseline(report, {**report, "meta": {**report["meta"], "scale": 1.0}})
+
+
+def test_main_fails_on_regression(tmp_path: Path) -> None:
+    args = ["--corpora", "news", "--scale", "0.001", "--repeat", "1", "--no-memory"]
+    out = tmp_path / "report.json"
+    assert main([*args, "--output", str(out)]) == 0
+    baseline = load_report(out)
+    for r in baseline["results"]:
+        r["wall_time"] /= 1000
+    (tmp_path / "baseline.json").write_text(json.dumps(baseline), "utf8")
+    assert main([*args, "--baseline", str(tmp_path / "baseline.json")]) == 1
@@ -0,0 +1,86 @@
+import json
+import pickle
+from pathlib import Path
+from typing import Callable
+
+import pytest
+
+from ua_datasets import MovaInstitutePOSDataset, NewsClassificationDataset, UaSquadDataset
+from ua_datasets.bundle import Bundle, BundleError, write_bundle
+from ua_datasets.text_classification import news_classification
+from ua_datasets.token_classification import part_of_speech
+
+
+@pytest.fixture
+def root(
+    tmp_path: Path, write_news_csv: Callable[..., Path], write_conllu: Callable[..., Path]
+) -> Path:
+    data = tmp_path / "data"
+    write_news_csv(40, path=data / "train.csv")
+    write_conllu(60, path=data / "pos.conllu")
+    (data / "extra.conllu").write_text("1\tx\t_\tC\n", encoding="utf8")
+    squad = {"data": [{"question": "Q?", "context": "C.", "answer": "C"}]}
+    (data / "val.json").write_text(json.dumps(squad), encoding="utf8")
+    return data
+
+
+@pytest.fixture
+def bundle(root: Path, tmp_path: Path) -> Bundle:
+    path = write_bundle(
+        tmp_path / "corpora.uab",
+        {
+            "news": NewsClassificationDataset(root=root, download=False, return_tags=True),
+            "squad": UaSquadDataset(root=root, split="val", download=False),
+            "pos": MovaInstitutePOSDataset(
+                root=root,
+                download=False,
+                file_name="pos.conllu",
+                extra_files=("extra.conllu",),
+            ),
+        },
+    )
+    return Bundle(path)
+
+
+def test_round_trip_matches_sources(root: Path, bundle: Bundle) -> None:
+    news = bundle.load("news")
+    assert news.return_tags
+    assert list(news) == list(
+        NewsClassificationDataset(root=root, download=False, return_tags=True)
+    )
+    assert bundle.load("squad")[0]["question"] == "Q?"
+    pos = bundle.load("pos")
+    assert len(pos) == 61
+    assert pos[60] == (["x"], ["C"])
+    assert "pos/pos.conllu.sentidx" in bundle
+    assert bundle.file("pos/pos.conllu").offset % (1 << 16) == 0
+
+
+def test_mapped_and_parallel_reads_from_bundle(
+    root: Path, bundle: Bundle, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    expected = list(bundle.load("pos"))
+    lazy = bundle.load("pos", lazy=True)
+    assert list(lazy) == expected
+    clone = pickle.loads(pickle.dumps(lazy))
+    assert clone[5] == expected[5]
+    monkeypatch.setattr(part_of_speech, "_MIN_CHUNK_BYTES", 256)
+    assert list(bundle.load("pos", parse_workers=3)) == expected
+    shards = [bundle.load("pos", load_shard=(3, i)) for i in range(3)]
+    assert sorted(s for shard in shards for s in shard) == sorted(expected)
+    monkeypatch.setattr(news_classification, "_MIN_CHUNK_BYTES", 128)
+    assert list(bundle.load("news", parse_workers=3)) == list(bundle.load("news"))
+
+
+def test_invalid_bundles(bundle: Bundle, tmp_path: Path) -> None:
+    with pytest.raises(KeyError, match="available"):
+        bundle.load("missing")
+    with pytest.raises(FileNotFoundError, match="not in bundle"):
+        bundle.file("news/test.csv")
+    bad = tmp_path / "bad.uab"
+    bad.write_bytes(b"not a bundle at all, nope")
+    with pytest.raises(BundleError, match="not a ua-datasets bundle"):
+        Bundle(bad)
+    with pytest.raises(BundleError, match="Invalid dataset name"):
+        write_bundle(tmp_path / "x.uab", {"../up": bundle.load("squad")})
+    assert not (tmp_path / "x.uab.tmp").exists()
@@ -0,0 +1,90 @@
+import json
+from pathlib import Path
+from typing import Callable
+
+import pytest
+
+from ua_datasets.benchmarks import runner
+from ua_datasets.bundle import Bundle
+from ua_datasets.cli import Target, main, parse_targets
+
+
+@pytest.fixture
+def root(
+    tmp_path: Path, write_news_csv: Callable[..., Path], write_conllu: Callable[..., Path]
+) -> Path:
+    write_news_csv(5, text="текст {i}", path=tmp_path / "ua_news" / "train.csv")
+    write_conllu(7, path=tmp_path / "mova_pos" / "mova_institute_pos_dataset.txt")
+    return tmp_path
+
+
+def test_parse_targets() -> None:
+    assert parse_targets(["news:test", "pos", "news"]) == [
+        Target("news", "test"),
+        Target("pos"),
+        Target("news", "train"),
+    ]
+    assert len(parse_targets([])) == 5
+    with pytest.raises(ValueError, match="Unknown split"):
+        parse_targets(["squad:test"])
+
+
+def test_build_cache_writes_index_and_bundle(
+    root: Path, tmp_path: Path, capsys: pytest.CaptureFixture[str]
+) -> None:
+    bundle_path = tmp_path / "out.uab"
+    argv = ["build-cache", "news:train", "pos", "--root", str(root), "--bundle", str(bundle_path)]
+    assert main(argv) == 0
+    assert (root / "mova_pos" / "mova_institute_pos_dataset.txt.sentidx").exists()
+    bundle = Bundle(bundle_path)
+    assert sorted(bundle.datasets) == ["news/train", "pos"]
+    assert len(bundle.load("pos")) == 7
+    assert "pos" in capsys.readouterr().out
+    assert (
+        main(["build-cache", "news:test", "--root", str(root), "--bundle", str(bundle_path)]) == 1
+    )
+    assert "news:test" in capsys.readouterr().err
+    assert main(["build-cache", "news", "--root", str(root)]) == 2
+    assert "only pos" in capsys.readouterr().err
+
+
+def test_convert_jsonl(root: Path, tmp_path: Path) -> None:
+    out = tmp_path / "jsonl"
+    argv = ["convert", "news:train", "pos", "--root", str(root), "--output", str(out)]
+    assert main([*argv, "--records-per-file", "3"]) == 0
+    files = sorted(p.name for p in out.iterdir())
+    assert files == [f"news_train_0000{i}.jsonl" for i in range(2)] + [
+        f"pos_0000{i}.jsonl" for i in range(3)
+    ]
+    first = json.loads((out / "news_train_00000.jsonl").read_text(encoding="utf8").splitlines()[0])
+    assert first == {"title": "t0", "text": "текст 0", "tags": "tag", "target": "X"}
+    with (root / "ua_news" / "train.csv").open("a", encoding="utf8") as fh:
+        fh.write("long,row,tag,X,surplus\n")
+    assert main(["convert", "news:train", "--root", str(root), "--output", str(out)]) == 0
+    last = (out / "news_train_00000.jsonl").read_text(encoding="utf8").splitlines()[-1]
+    assert json.loads(last) == {"title": "long", "text": "row", "tags": "tag", "target": "X"}
+    pos = (out / "pos_00000.jsonl").read_text(encoding="utf8").splitlines()
+    assert json.loads(pos[1]) == {"tokens": ["w1", "v1"], "tags": ["A", "B"]}
+    assert (
+        main(["convert", "pos", "--root", str(root), "--output", str(out), "--format", "shards"])
+        == 2
+    )
+    assert main([*argv, "--format", "shards", "--tokenizer", "builtins:list"]) == 1  # str ids
+
+
+def test_bench_forwards_arguments(monkeypatch: pytest.MonkeyPatch) -> None:
+    calls = []
+    monkeypatch.setattr(runner, "main", lambda argv, prog: calls.append((argv, prog)) or 0)
+    assert main(["bench", "--scale", "0.1", "--no-memory"]) == 0
+    assert calls == [(["--scale", "0.1", "--no-memory"], "ua-datasets bench")]
+    with pytest.raises(SystemExit):
+        main(["prefetch", "--bogus"])
+    with pytest.raises(SystemExit):
+        main(["prefetch", "--workers", "0"])  # a zero-slot limiter would never download
+
+
+def test_prefetch_skips_present_files(root: Path, capsys: pytest.CaptureFixture[str]) -> None:
+    assert main(["prefetch", "news:train", "pos", "--root", str(root), "--quiet"]) == 0
+    out = capsys.readouterr().out
+    assert "news:train" in out
+    assert "7 records" in out
@@ -0,0 +1,95 @@
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Iterator, List
+from urllib.error import HTTPError, URLError
+
+import pytest
+
+from ua_datasets.http_pool import HTTPConnectionPool
+from ua_datasets.utils import DownloadFailure, download_text_with_retries
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    connections: List[int] = []  # noqa: RUF012 - shared by all handler instances
+
+    def setup(self) -> None:
+        super().setup()
+        self.connections.append(id(self.connection))
+
+    def do_GET(self) -> None:
+        if self.path.startswith("/redirect"):
+            self._reply(302, b"", Location="/file-a")
+        elif self.path == "/missing":
+            self._reply(404, b"not found")
+        elif self.path == "/close":
+            self._reply(200, b"closing", Connection="close")
+        else:
+            self._reply(200, f"payload {self.path}".encode())
+
+    def _reply(self, status: int, body: bytes, **headers: str) -> None:
+        self.send_response(status)
+        self.send_header("Content-Length", str(len(body)))
+        for name, value in headers.items():
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format: str, *args: Any) -> None:
+        pass
+
+
+@pytest.fixture
+def base_url() -> Iterator[str]:
+    _Handler.connections.clear()
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _Handler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_address[1]}"
+    server.shutdown()
+    server.server_close()
+    thread.join()
+
+
+def test_requests_and_redirects_reuse_one_connection(base_url: str) -> None:
+    with HTTPConnectionPool() as pool:
+        bodies = []
+        for path in ("/file-a", "/file-b", "/redirect", "/file-c"):
+            with pool.urlopen(base_url + path, timeout=5) as resp:
+                bodies.append(resp.read())
+                final_url = resp.url
+        assert bodies == [
+            b"payload /file-a",
+            b"payload /file-b",
+            b"payload /file-a",
+            b"payload /file-c",
+        ]
+        assert final_url == base_url + "/file-c"
+        assert pool.requests == 5
+        assert pool.connections_opened == 1
+    assert len(_Handler.connections) == 1
+
+
+def test_errors_match_urlopen_and_bad_connections_are_dropped(base_url: str) -> None:
+    pool = HTTPConnectionPool()
+    with pytest.raises(HTTPError, match="404"):
+        pool.urlopen(base_url + "/missing")
+    with pool.urlopen(base_url + "/close") as resp:
+        assert resp.read() == b"closing"
+    with pool.urlopen(base_url + "/file-a") as resp:
+        resp.read(3)  # abandoned mid-body: the connection cannot be reused
+    with pool.urlopen(base_url + "/file-a") as resp:
+        assert resp.read() == b"payload /file-a"
+    assert pool.connections_opened == 3
+    with pytest.raises(URLError, match="unsupported URL"):
+        pool.urlopen("ftp://example.org/")
+    pool.close()
+    with pytest.raises(URLError, match="refused"):
+        pool.urlopen("http://127.0.0.1:9/")
+
+
+def test_download_helper_retries_through_default_pool(base_url: str) -> None:
+    text = download_text_with_retries(base_url + "/redirect", max_retries=1)
+    assert text == "payload /file-a"
+    with pytest.raises(DownloadFailure, match="HTTP Error 404"):
+        download_text_with_retries(base_url + "/missing", max_retries=2, backoff_factor=0)
@@ -0,0 +1,48 @@
+import subprocess
+import sys
+from typing import Set
+
+import pytest
+
+# Modules that only downloads, parallel parsing or other datasets should load.
+HEAVY = ("urllib.request", "http.client", "ssl", "email", "concurrent.futures", "hashlib")
+
+
+def _loaded_after(statement: str) -> Set[str]:
+    """Module names present in a fresh interpreter after running ``statement``."""
+    code = f"import sys\n{statement}\nprint(' '.join(sys.modules))"
+    out = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True, check=True
+    ).stdout
+    return set(out.split())
+
+
+def test_bare_import_loads_no_submodules() -> None:
+    loaded = _loaded_after("import ua_datasets")
+    assert {m for m in loaded if m.startswith("ua_datasets.")} == set()
+    assert not {"typing", "dataclasses", *HEAVY} & loaded
+
+
+@pytest.mark.parametrize(
+    ("name", "unrelated"),
+    [
+        ("UaSquadDataset", "csv"),
+        ("NewsClassificationDataset", "ua_datasets.text_classification.features"),
+        ("MovaInstitutePOSDataset", "json"),
+    ],
+)
+def test_dataset_import_defers_networking(name: str, unrelated: str) -> None:
+    loaded = _loaded_after(f"from ua_datasets import {name}")
+    assert not set(HEAVY) & loaded
+    assert unrelated not in loaded
+
+
+def test_lazy_attributes_resolve() -> None:
+    import ua_datasets
+    from ua_datasets.text_classification import StratifiedSplitter, splits
+
+    assert ua_datasets.UaSquadDataset.__name__ == "UaSquadDataset"
+    assert StratifiedSplitter is splits.StratifiedSplitter
+    assert set(ua_datasets.__all__) <= set(dir(ua_datasets))
+    with pytest.raises(AttributeError, match="no attribute 'Missing'"):
+        ua_datasets.Missing  # noqa: B018
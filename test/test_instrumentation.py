@@ -0,0 +1,78 @@
+import io
+from pathlib import Path
+from typing import Any, Callable
+
+import pytest
+
+from ua_datasets import MovaInstitutePOSDataset, NewsClassificationDataset
+from ua_datasets.instrumentation import _NOOP, add_observer, observe, span
+from ua_datasets.utils import DownloadFailure, atomic_write_text, download_text_with_retries
+
+
+@pytest.fixture
+def root(
+    tmp_path: Path, write_news_csv: Callable[..., Path], write_conllu: Callable[..., Path]
+) -> Path:
+    write_news_csv(30, tags="a|b")
+    write_conllu(12)
+    return tmp_path
+
+
+def test_span_is_noop_without_observers() -> None:
+    assert span("parse", records=1) is _NOOP
+    remove = add_observer(lambda event: None)
+    try:
+        assert span("parse").enabled
+    finally:
+        remove()
+    assert span("parse") is _NOOP
+
+
+def test_dataset_phases_are_reported(root: Path) -> None:
+    with observe() as events:
+        news = NewsClassificationDataset(root=root, download=False, return_tags=True)
+        news[0]
+    assert [e.name for e in events] == ["parse", "stats", "index"]
+    parse = events[0]
+    assert parse.attrs["records"] == 30
+    assert parse.attrs["bytes"] == (root / "train.csv").stat().st_size
+    assert parse.duration >= 0
+    assert parse.error is None
+
+
+def test_download_verify_and_write_spans(tmp_path: Path) -> None:
+    calls = []
+
+    def opener(url: str, timeout: int) -> Any:
+        calls.append(url)
+        if len(calls) == 1:
+            raise TimeoutError("slow")
+        return io.BytesIO("дані".encode())
+
+    with observe() as events:
+        text = download_text_with_retries("http://x/f", opener=opener, backoff_factor=0)
+        atomic_write_text(tmp_path / "f.txt", text)
+    assert [(e.name, e.error) for e in events] == [
+        ("download", "TimeoutError"),
+        ("download", None),
+        ("verify", None),
+        ("write", None),
+    ]
+    assert events[1].attrs == {"url": "http://x/f", "attempt": 2, "bytes": 8}
+    assert events[3].attrs["bytes"] == 8
+    with observe() as events, pytest.raises(DownloadFailure, match="SHA256"):
+        download_text_with_retries("http://x/f", opener=opener, expected_sha256="0", max_retries=1)
+    assert (events[-1].name, events[-1].error) == ("verify", "DownloadFailure")
+
+
+def test_memory_usage_breakdown(root: Path) -> None:
+    news = NewsClassificationDataset(root=root, download=False)
+    usage = news.memory_usage()
+    assert usage["total"] == sum(usage[k] for k in ("strings", "containers", "buffers", "other"))
+    assert usage["field._rows"] > usage["field._label_cache"] > 0
+    before = usage["caches"]
+    news.label_positions()
+    assert news.memory_usage()["caches"] > before
+    lazy = MovaInstitutePOSDataset(root=root, download=False, file_name="pos.conllu", lazy=True)
+    assert lazy.memory_usage()["shared"] == (root / "pos.conllu").stat().st_size
+    lazy.close()
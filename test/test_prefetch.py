@@ -0,0 +1,61 @@
+import itertools
+import threading
+from pathlib import Path
+from typing import Callable, Iterator
+
+import pytest
+
+from ua_datasets import MovaInstitutePOSDataset, NewsClassificationDataset
+from ua_datasets.prefetch import prefetch
+
+
+@pytest.fixture
+def root(
+    tmp_path: Path, write_news_csv: Callable[..., Path], write_conllu: Callable[..., Path]
+) -> Path:
+    write_news_csv(25)
+    write_conllu(23)
+    return tmp_path
+
+
+def _prefetch_threads() -> int:
+    return sum(t.name == "ua-datasets-prefetch" for t in threading.enumerate())
+
+
+def test_thread_prefetch_preserves_order(root: Path) -> None:
+    news = NewsClassificationDataset(root=root, download=False)
+    assert list(news.prefetch(4)) == list(news)
+    batches = list(news.prefetch(2, batch_size=10))
+    assert [len(b) for b in batches] == [10, 10, 5]
+    assert [s for b in batches for s in b] == list(news)
+    assert _prefetch_threads() == 0
+
+
+def test_errors_propagate_in_order() -> None:
+    def source() -> Iterator[int]:
+        yield from range(3)
+        raise KeyError("broken record")
+
+    it = prefetch(source(), 2)
+    assert [next(it) for _ in range(3)] == [0, 1, 2]
+    with pytest.raises(KeyError, match="broken record"):
+        next(it)
+
+
+def test_early_exit_stops_producer() -> None:
+    it = prefetch(itertools.count(), 3)
+    assert next(it) == 0
+    it.close()
+    assert _prefetch_threads() == 0
+    with pytest.raises(ValueError, match="n must be positive"):
+        prefetch([], 0)
+
+
+def test_process_prefetch_lazy_pos(root: Path) -> None:
+    pos = MovaInstitutePOSDataset(root=root, download=False, file_name="pos.conllu", lazy=True)
+    assert list(pos.prefetch(8, num_workers=2)) == list(pos)
+    batches = list(pos.prefetch(3, batch_size=5, num_workers=2))
+    assert [s for b in batches for s in b] == list(pos)
+    with pytest.raises(TypeError, match="indexing"):
+        prefetch(iter(pos), 4, num_workers=2)
+    pos.close()
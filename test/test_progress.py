@@ -0,0 +1,97 @@
+import asyncio
+import io
+from pathlib import Path
+from typing import Any, List, Optional, Tuple
+
+import pytest
+
+from ua_datasets.aio import adownload_text_with_retries
+from ua_datasets.benchmarks.server import serve_directory
+from ua_datasets.progress import ConsoleProgress, ProgressReporter, resolve_reporter
+from ua_datasets.utils import download_text_with_retries
+
+
+class Recorder(ProgressReporter):
+    __slots__ = ("events",)
+
+    def __init__(self) -> None:
+        self.events: List[Tuple[str, Any]] = []
+
+    def start(self, url: str, total: Optional[int]) -> None:
+        self.events.append(("start", total))
+
+    def advance(self, url: str, nbytes: int) -> None:
+        self.events.append(("advance", nbytes))
+
+    def finish(self, url: str) -> None:
+        self.events.append(("finish", None))
+
+
+class FakeResponse:
+    def __init__(self) -> None:
+        self.headers = {"Content-Length": "10"}
+        self._data = io.BytesIO(b"0123456789")
+
+    def read(self, size: int = -1) -> bytes:
+        return self._data.read(size)
+
+    def __enter__(self) -> "FakeResponse":
+        return self
+
+    def __exit__(self, *exc: object) -> None:
+        pass
+
+
+def test_console_progress_throttles_and_aggregates() -> None:
+    out = io.StringIO()
+    console = ConsoleProgress(out, interval=3600)
+    console.start("http://host/a.csv", 1000)
+    for _ in range(100):
+        console.advance("http://host/a.csv", 5)
+    assert out.getvalue().count("\r") == 1  # only the initial draw; updates are throttled
+    console.start("http://host/b.csv", 1000)
+    console.advance("http://host/b.csv", 500)
+    status = console.status(now=console._started + 2.0)
+    assert status.startswith("Downloading 2 files [")
+    assert "50.0% 1.0 KB/2.0 KB 500 B/s ETA 0:02" in status
+    console.finish("http://host/a.csv")
+    console.finish("http://host/b.csv")
+    assert out.getvalue().endswith("\n")
+    assert out.getvalue().count("\n") == 1
+
+
+def test_progress_is_quiet_without_tty(capsys: pytest.CaptureFixture[str]) -> None:
+    assert resolve_reporter(True) is None
+    assert resolve_reporter(False) is None
+    text = download_text_with_retries(
+        "http://host/x", opener=lambda url, timeout: FakeResponse(), show_progress=True
+    )
+    assert text == "0123456789"
+    assert capsys.readouterr().out == ""
+
+
+def test_custom_reporter_receives_sync_and_async_transfers(tmp_path: Path) -> None:
+    recorder = Recorder()
+    download_text_with_retries(
+        "http://host/x",
+        opener=lambda url, timeout: FakeResponse(),
+        show_progress=recorder,
+        chunk_size=4,
+    )
+    assert recorder.events == [
+        ("start", 10),
+        ("advance", 4),
+        ("advance", 4),
+        ("advance", 2),
+        ("finish", None),
+    ]
+    (tmp_path / "data.txt").write_bytes(b"x" * 200_000)
+    recorder.events.clear()
+    with serve_directory(tmp_path) as base_url:
+        text = asyncio.run(
+            adownload_text_with_retries(f"{base_url}data.txt", show_progress=recorder)
+        )
+    assert len(text) == 200_000
+    assert recorder.events[0] == ("start", 200_000)
+    assert recorder.events[-1] == ("finish", None)
+    assert sum(n for kind, n in recorder.events if kind == "advance") == 200_000
@@ -0,0 +1,76 @@
+import json
+from pathlib import Path
+from typing import Callable
+
+import pytest
+
+from ua_datasets import MovaInstitutePOSDataset, NewsClassificationDataset, UaSquadDataset
+from ua_datasets.sharding import ShardedIterable, shard_indices
+
+
+@pytest.fixture
+def root(
+    tmp_path: Path, write_news_csv: Callable[..., Path], write_conllu: Callable[..., Path]
+) -> Path:
+    write_news_csv(
+        57, text=lambda i: f'"line one\nline ""{i}"" two"' if i % 4 == 0 else f"plain {i}"
+    )
+    write_conllu(41, sentence="# id {i}\n1\tw{i}\t_\tA\n2\tv{i}\t_\tB\n")
+    return tmp_path
+
+
+@pytest.mark.parametrize("contiguous", [True, False])
+def test_shard_indices_partition(contiguous: bool) -> None:
+    shards = [list(shard_indices(10, 4, k, contiguous=contiguous)) for k in range(4)]
+    assert sorted(i for s in shards for i in s) == list(range(10))
+    assert sorted(len(s) for s in shards) == [2, 2, 3, 3]
+    with pytest.raises(ValueError, match="index must be"):
+        shard_indices(10, 4, 4)
+
+
+def test_dataset_shard_views(root: Path) -> None:
+    news = NewsClassificationDataset(root=root, download=False)
+    views = [news.shard(3, k) for k in range(3)]
+    assert sum(len(v) for v in views) == len(news)
+    assert views[1][0] == news[1]
+    assert list(news.shard(3, 2, contiguous=True)) == [news[i] for i in range(38, 57)]
+    pos = MovaInstitutePOSDataset(root=root, download=False, file_name="pos.conllu", lazy=True)
+    assert list(pos.shard(4, 3)) == [pos[i] for i in range(3, 41, 4)]
+
+
+def test_news_load_shard_reads_disjoint_byte_ranges(root: Path) -> None:
+    full = NewsClassificationDataset(root=root, download=False)
+    parts = [
+        NewsClassificationDataset(root=root, download=False, load_shard=(4, k)) for k in range(4)
+    ]
+    assert all(0 < len(p) < len(full) for p in parts)
+    assert [row for p in parts for row in p.data] == full.data
+
+
+@pytest.mark.parametrize("lazy", [False, True])
+def test_pos_load_shard_covers_corpus(root: Path, lazy: bool) -> None:
+    kwargs = {"root": root, "download": False, "file_name": "pos.conllu", "lazy": lazy}
+    full = MovaInstitutePOSDataset(**kwargs)
+    parts = [MovaInstitutePOSDataset(**kwargs, load_shard=(3, k)) for k in range(3)]
+    assert all(len(p) < len(full) for p in parts)
+    assert [s for p in parts for s in p] == list(full)
+    for p in parts:
+        assert [p[i] for i in range(len(p))] == list(p)
+        assert p.data == [tokens for tokens, _ in p]
+
+
+def test_squad_load_shard(tmp_path: Path) -> None:
+    data = [{"question": f"q{i}", "context": f"c{i} a", "answer": "a"} for i in range(7)]
+    (tmp_path / "train.json").write_text(json.dumps({"data": data}), "utf8")
+    parts = [UaSquadDataset(root=tmp_path, download=False, load_shard=(2, k)) for k in range(2)]
+    assert [len(p) for p in parts] == [3, 4]
+    assert parts[1][0]["question"] == "q3"
+
+
+def test_sharded_iterable_uses_rank(monkeypatch: pytest.MonkeyPatch, root: Path) -> None:
+    news = NewsClassificationDataset(root=root, download=False)
+    monkeypatch.setenv("RANK", "1")
+    monkeypatch.setenv("WORLD_SIZE", "2")
+    assert list(ShardedIterable(news)) == list(news.shard(2, 1))
+    fixed = ShardedIterable(news, contiguous=True, num_shards=3, index=0)
+    assert list(fixed) == list(news.shard(3, 0, contiguous=True))
@@ -0,0 +1,65 @@
+from pathlib import Path
+from typing import Callable, List
+
+import pytest
+
+from ua_datasets.shards import TokenShardReader, export_token_shards
+from ua_datasets.text_classification import NewsClassificationDataset
+from ua_datasets.token_classification import MovaInstitutePOSDataset
+
+
+def _word_lengths(text: str) -> List[int]:
+    return [len(w) for w in text.split()]
+
+
+@pytest.fixture
+def news(tmp_path: Path, write_news_csv: Callable[..., Path]) -> NewsClassificationDataset:
+    write_news_csv(
+        40, text=lambda i: " ".join("x" * (j + 1) for j in range(i % 7)), tags="", labels="A"
+    )
+    return NewsClassificationDataset(root=tmp_path, split="train", download=False)
+
+
+def test_export_and_read_roundtrip(news: NewsClassificationDataset, tmp_path: Path) -> None:
+    paths = export_token_shards(news, _word_lengths, tmp_path / "out" / "news", dtype="H")
+    assert [p.name for p in paths] == ["news_00000.bin"]
+    with TokenShardReader(paths) as reader:
+        assert reader.dtype == "H"
+        assert len(reader) == 40
+        assert reader[3].tolist() == [1, 2, 3]
+        assert reader[-1].tolist() == [1, 2, 3, 4]
+        assert [d.tolist() for d in reader] == [_word_lengths(row[1]) for row in news.data]
+        assert reader.num_tokens == sum(i % 7 for i in range(40))
+
+
+def test_parallel_sharded_export_matches_serial(
+    news: NewsClassificationDataset, tmp_path: Path
+) -> None:
+    serial = export_token_shards(news, _word_lengths, tmp_path / "a", eos_id=0, batch_size=6)
+    sharded = export_token_shards(
+        news,
+        _word_lengths,
+        tmp_path / "b",
+        eos_id=0,
+        batch_size=6,
+        num_workers=2,
+        max_shard_tokens=50,
+    )
+    assert len(sharded) > 1
+    one, many = TokenShardReader(serial), TokenShardReader(sharded)
+    assert len(one) == len(many) == 40
+    assert [d.tolist() for d in one] == [d.tolist() for d in many]
+    assert all(d.tolist()[-1] == 0 for d in many)
+    windows = list(one.iter_sequences(8, stride=4))
+    assert len(windows) == (one.num_tokens - 8) // 4 + 1
+    assert all(len(w) == 8 for w in windows)
+
+
+def test_pos_sentences_and_bad_index(tmp_path: Path) -> None:
+    (tmp_path / "pos.conllu").write_text("1\taa\t_\tA\n2\tb\t_\tB\n\n1\tccc\t_\tA\n", "utf8")
+    pos = MovaInstitutePOSDataset(root=tmp_path, download=False, file_name="pos.conllu")
+    paths = export_token_shards(pos, _word_lengths, tmp_path / "pos")
+    assert [d.tolist() for d in TokenShardReader(paths)] == [[2, 1], [3]]
+    paths[0].with_suffix(".idx").write_bytes(b"garbage!")
+    with pytest.raises(ValueError, match="not a token shard index"):
+        TokenShardReader(paths)
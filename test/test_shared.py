@@ -0,0 +1,112 @@
+import json
+import multiprocessing
+import pickle
+import sys
+import threading
+from array import array
+from multiprocessing import resource_tracker
+from pathlib import Path
+from typing import Any, Callable, List
+
+import pytest
+
+from ua_datasets import MovaInstitutePOSDataset, NewsClassificationDataset, UaSquadDataset, shared
+from ua_datasets.shared import SharedArray, SharedStringGroups
+
+
+def _items(ds: Any) -> List[Any]:
+    return [ds[i] for i in range(len(ds))]
+
+
+@pytest.fixture
+def root(
+    tmp_path: Path, write_news_csv: Callable[..., Path], write_conllu: Callable[..., Path]
+) -> Path:
+    write_news_csv(20, tags="a|b{i}")
+    write_conllu(15)
+    data = [{"question": f"q{i}?", "context": f"c {i} ans", "answer": "ans"} for i in range(5)]
+    (tmp_path / "train.json").write_text(json.dumps({"data": data}), encoding="utf8")
+    return tmp_path
+
+
+def _datasets(root: Path) -> List[Any]:
+    pos = {"root": root, "download": False, "file_name": "pos.conllu"}
+    return [
+        NewsClassificationDataset(root=root, download=False, return_tags=True),
+        UaSquadDataset(root=root, download=False),
+        MovaInstitutePOSDataset(**pos),
+        MovaInstitutePOSDataset(**pos, encoded=True),
+        MovaInstitutePOSDataset(**pos, lazy=True),
+    ]
+
+
+def test_shared_datasets_pickle_by_reference(root: Path) -> None:
+    for ds in _datasets(root):
+        expected = _items(ds)
+        ds.share_memory()
+        assert _items(ds) == expected
+        payload = pickle.dumps(ds)
+        assert len(payload) < 4096
+        clone = pickle.loads(payload)
+        assert _items(clone) == expected
+        assert len(clone) == len(ds)
+
+
+def _first_items(ds: Any) -> Any:
+    return ds[0], ds[-1], len(ds)
+
+
+def test_spawned_worker_reads_shared_memory(root: Path) -> None:
+    datasets = _datasets(root)
+    for ds in datasets:
+        ds.share_memory()
+    with multiprocessing.get_context("spawn").Pool(1) as pool:
+        results = pool.map(_first_items, datasets)
+    assert results == [_first_items(ds) for ds in datasets]
+    # The owner's blocks survive the worker exiting.
+    assert _items(datasets[0])[3][3] == ["a", "b3"]
+
+
+def test_shared_containers() -> None:
+    groups = SharedStringGroups.from_groups([["a", "bc"], [], ["ї"]])
+    assert [groups[i] for i in range(3)] == [["a", "bc"], [], ["ї"]]
+    assert groups[1:] == [[], ["ї"]]
+    with pytest.raises(IndexError, match="out of range"):
+        groups[3]
+    from array import array
+
+    shared = SharedArray.from_array(array("H", [1, 2, 3]))
+    clone = pickle.loads(pickle.dumps(shared))
+    assert clone.view.tolist() == [1, 2, 3]
+    clone.close()
+    shared.close()
+
+
+@pytest.mark.skipif(sys.version_info >= (3, 13), reason="attaches with track=False")
+def test_attach_keeps_concurrent_registrations(monkeypatch: pytest.MonkeyPatch) -> None:
+    registered: List[str] = []
+    unregistered: List[str] = []
+    monkeypatch.setattr(resource_tracker, "register", lambda name, rtype: registered.append(name))
+    monkeypatch.setattr(
+        resource_tracker, "unregister", lambda name, rtype: unregistered.append(name)
+    )
+    owner = SharedArray.from_array(array("Q", [1, 2]))
+    real = shared.SharedMemory
+    created: List[Any] = []
+    # Another thread (not going through this module) creates a block mid-attach.
+    creator = threading.Thread(target=lambda: created.append(real(create=True, size=8)))
+
+    def attach_slowly(*args: Any, **kwargs: Any) -> Any:
+        creator.start()
+        creator.join()
+        return real(*args, **kwargs)
+
+    monkeypatch.setattr(shared, "SharedMemory", attach_slowly)
+    attached = pickle.loads(pickle.dumps(owner))
+    assert list(attached.view) == [1, 2]
+    assert created[0]._name in registered
+    assert registered.count(owner._shm._name) == 1  # the owner's, kept
+    assert not unregistered
+    attached.close()
+    created[0].close()
+    created[0].unlink()
@@ -0,0 +1,52 @@
+import random
+from pathlib import Path
+
+import pytest
+
+from ua_datasets import MovaInstitutePOSDataset
+from ua_datasets.shuffle import ShuffledIterable, buffer_shuffle
+
+
+def test_deterministic_per_epoch_and_shard() -> None:
+    data = list(range(1000))
+    stream = ShuffledIterable(data, seed=7, block_size=16, buffer_size=64)
+    first = list(stream)
+    assert sorted(first) == data
+    assert first != data
+    assert list(ShuffledIterable(data, seed=7, block_size=16, buffer_size=64)) == first
+    stream.set_epoch(1)
+    assert list(stream) != first
+    stream.set_epoch(0)
+    assert list(stream.iter_indices()) == first
+
+    shards = [
+        list(ShuffledIterable(data, seed=7, block_size=16, num_shards=3, index=i)) for i in range(3)
+    ]
+    assert sorted(x for shard in shards for x in shard) == data
+    assert shards[1] == list(ShuffledIterable(data, seed=7, block_size=16, num_shards=3, index=1))
+
+
+def test_blocks_are_sequential_runs() -> None:
+    stream = ShuffledIterable(list(range(100)), seed=3, block_size=10, buffer_size=1)
+    order = list(stream)
+    runs = [order[i : i + 10] for i in range(0, 100, 10)]
+    assert all(run == list(range(run[0], run[0] + 10)) for run in runs)
+    assert [r[0] for r in runs] == [b.start for b in stream.blocks()]
+    with pytest.raises(ValueError, match="must be positive"):
+        ShuffledIterable([], block_size=0)
+
+
+def test_buffer_shuffle_bounds_displacement() -> None:
+    out = list(buffer_shuffle(iter(range(500)), 8, random.Random(0)))
+    assert sorted(out) == list(range(500))
+    # An item cannot be emitted before the buffer has received it.
+    assert all(x <= pos + 8 for pos, x in enumerate(out))
+
+
+def test_lazy_pos_shuffled(tmp_path: Path) -> None:
+    sentences = [f"1\tw{i}\t_\tA\n" for i in range(50)]
+    (tmp_path / "pos.conllu").write_text("\n".join(sentences), encoding="utf8")
+    pos = MovaInstitutePOSDataset(root=tmp_path, download=False, file_name="pos.conllu", lazy=True)
+    stream = pos.shuffled(seed=1, block_size=4, buffer_size=8)
+    assert sorted(tokens[0] for tokens, _ in stream) == sorted(tokens[0] for tokens, _ in pos)
+    assert list(stream) == [pos[i] for i in stream.iter_indices()]
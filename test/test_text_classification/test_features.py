@@ -0,0 +1,72 @@
+from pathlib import Path
+
+import pytest
+
+from ua_datasets.text_classification import (
+    HashingFeaturizer,
+    NewsClassificationDataset,
+)
+
+
+@pytest.fixture
+def news(tmp_path: Path) -> NewsClassificationDataset:
+    lines = ["title,text,tags,target"]
+    for i in range(25):
+        lines.append(f"Заголовок {i},М’ясо та мʼясо {i} — сво́я ціна,,{'AB'[i % 2]}")  # noqa: RUF001
+    (tmp_path / "train.csv").write_text("\n".join(lines) + "\n", encoding="utf8")
+    return NewsClassificationDataset(root=tmp_path, split="train", download=False)
+
+
+def test_normalization_unifies_apostrophes_and_stress() -> None:
+    assert HashingFeaturizer.tokenize("М’ЯСО мʼясо сво́я") == ["м'ясо", "м'ясо", "своя"]  # noqa: RUF001
+
+
+def test_rows_are_sorted_and_normalized() -> None:
+    feat = HashingFeaturizer(n_features=1024)
+    idx, vals = feat.transform_one(["Київ столиця", "Київ"])
+    assert list(idx) == sorted(idx)
+    assert all(0 <= i < 1024 for i in idx)
+    assert sum(v * v for v in vals) == pytest.approx(1.0, rel=1e-5)
+
+
+def test_batches_parallel_and_cached_match_serial(
+    news: NewsClassificationDataset, tmp_path: Path
+) -> None:
+    feat = HashingFeaturizer(n_features=4096, char_ngram_range=None)
+    serial = list(feat.iter_batches(news, batch_size=10))
+    assert [len(b) for b in serial] == [10, 10, 5]
+    assert serial[0].targets[:2] == ["A", "B"]
+
+    parallel = list(feat.iter_batches(news, batch_size=10, num_workers=2))
+    cache_dir = tmp_path / "cache"
+    first = list(feat.iter_batches(news, batch_size=10, cache_dir=cache_dir))
+    replay = list(feat.iter_batches(news, batch_size=10, cache_dir=cache_dir))
+    for other in (parallel, first, replay):
+        assert [(b.indptr, b.indices, b.data, b.targets) for b in other] == [
+            (b.indptr, b.indices, b.data, b.targets) for b in serial
+        ]
+    assert len(list(cache_dir.iterdir())) == 1
+
+
+def test_unknown_field_rejected(news: NewsClassificationDataset) -> None:
+    with pytest.raises(ValueError, match="summary"):
+        next(HashingFeaturizer(fields=("summary",)).iter_batches(news))
+
+
+def test_cache_keyed_by_loaded_subset(news: NewsClassificationDataset, tmp_path: Path) -> None:
+    feat = HashingFeaturizer(n_features=1024, char_ngram_range=None)
+    cache_dir = tmp_path / "cache"
+    subsets = [
+        news,
+        NewsClassificationDataset(
+            root=tmp_path, download=False, where=lambda r: r["target"] == "A"
+        ),
+        NewsClassificationDataset(
+            root=tmp_path, download=False, where=lambda r: r["target"] == "B"
+        ),
+        NewsClassificationDataset(root=tmp_path, download=False, load_shard=(2, 1)),
+    ]
+    for ds in subsets:
+        cached = list(feat.iter_batches(ds, batch_size=10, cache_dir=cache_dir))
+        assert [t for b in cached for t in b.targets] == [row[-1] for row in ds.data]
+    assert len(list(cache_dir.iterdir())) == len(subsets)
@@ -0,0 +1,54 @@
+import csv
+import io
+import mmap
+import random
+from pathlib import Path
+
+import pytest
+
+from ua_datasets.text_classification import news_classification
+from ua_datasets.text_classification.news_classification import NewsClassificationDataset
+
+
+def _write_tricky_csv(path: Path, n_rows: int) -> None:
+    rng = random.Random(0)
+    buf = io.StringIO(newline="")
+    writer = csv.writer(buf, lineterminator="\r\n")
+    writer.writerow(["title", "text", "tags", "target"])
+    for i in range(n_rows):
+        text = f"Рядок {i}"
+        if i % 3 == 0:
+            text += '\nз "лапками", комами\r\nі переносами'  # noqa: RUF001
+        if i % 7 == 0:
+            buf.write("\n")  # blank line between records
+        if i % 11 == 0:
+            buf.write(f'T{i},5" screen,\n')  # literal quote in unquoted field, short row
+            continue
+        writer.writerow([f"T{i}", text, "a|b", rng.choice(["x", "y", "z"])])
+    path.write_text(buf.getvalue(), encoding="utf8", newline="")
+
+
+def test_parallel_rows_match_serial(monkeypatch: pytest.MonkeyPatch, tmp_path: Path) -> None:
+    _write_tricky_csv(tmp_path / "train.csv", 500)
+    monkeypatch.setattr(news_classification, "_MIN_CHUNK_BYTES", 256)
+    serial = NewsClassificationDataset(root=tmp_path, split="train", download=False)
+    parallel = NewsClassificationDataset(
+        root=tmp_path, split="train", download=False, parse_workers=4
+    )
+    assert parallel.data == serial.data
+    assert parallel.labels == serial.labels
+
+
+def test_boundaries_skip_quoted_newlines() -> None:
+    data = b'h1,h2\n"a\nb",1\nc,2\n'
+    with mmap.mmap(-1, len(data)) as buf:
+        buf.write(data)
+        bounds = news_classification._find_record_boundaries(buf, 6, [7])
+    assert bounds == [14]
+
+
+def test_small_file_falls_back_to_serial(tmp_path: Path) -> None:
+    content = "title,text,tags,target\nT1,Body one,,A\nT2,Body two,,B\n"
+    (tmp_path / "train.csv").write_text(content, encoding="utf8")
+    ds = NewsClassificationDataset(root=tmp_path, split="train", download=False, parse_workers=4)
+    assert len(ds) == 2
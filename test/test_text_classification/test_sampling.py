@@ -0,0 +1,73 @@
+import random
+from collections import Counter
+from pathlib import Path
+
+import pytest
+
+from ua_datasets.text_classification import (
+    AliasTable,
+    LabelBalancedSampler,
+    NewsClassificationDataset,
+)
+
+
+@pytest.fixture
+def skewed(tmp_path: Path) -> NewsClassificationDataset:
+    labels = ["A"] * 90 + ["B"] * 9 + ["C"]
+    body = "".join(f"T{i},Body,,{lab}\n" for i, lab in enumerate(labels))
+    (tmp_path / "train.csv").write_text("title,text,tags,target\n" + body, encoding="utf8")
+    return NewsClassificationDataset(root=tmp_path, split="train", download=False)
+
+
+def test_label_positions(skewed: NewsClassificationDataset) -> None:
+    positions = skewed.label_positions()
+    assert {k: len(v) for k, v in positions.items()} == skewed.label_frequencies()
+    assert list(positions["C"]) == [99]
+
+
+def test_alias_table_matches_weights() -> None:
+    table = AliasTable([1.0, 3.0, 0.0, 4.0])
+    rng = random.Random(0)
+    counts = Counter(table.draw(rng) for _ in range(40_000))
+    assert counts[2] == 0
+    assert counts[3] / 40_000 == pytest.approx(0.5, abs=0.02)
+
+
+def test_balanced_draws_and_probabilities(skewed: NewsClassificationDataset) -> None:
+    sampler = LabelBalancedSampler(skewed, strategy="balanced", num_samples=30_000, seed=1)
+    assert sampler.label_probabilities() == pytest.approx({"A": 1 / 3, "B": 1 / 3, "C": 1 / 3})
+    counts = Counter(skewed[i][2] for i in sampler)
+    assert counts["C"] / 30_000 == pytest.approx(1 / 3, abs=0.02)
+
+
+def test_inverse_power_and_custom(skewed: NewsClassificationDataset) -> None:
+    inverse = LabelBalancedSampler(skewed, strategy="inverse", power=0.0)
+    assert inverse.label_probabilities()["A"] == pytest.approx(0.9)
+    custom = LabelBalancedSampler(skewed, strategy="custom", weights={"B": 1.0})
+    assert {skewed[i][2] for i in custom} == {"B"}
+    per_row = LabelBalancedSampler(skewed, strategy="custom", weights=[0.0] * 99 + [1.0])
+    assert set(per_row) == {99}
+
+
+def test_reproducible_per_epoch_and_rank(skewed: NewsClassificationDataset) -> None:
+    sampler = LabelBalancedSampler(skewed, seed=7, num_samples=11)
+    first = list(sampler)
+    assert list(LabelBalancedSampler(skewed, seed=7, num_samples=11)) == first
+    sampler.set_epoch(1)
+    assert list(sampler) != first
+    shards = [list(sampler.iter_indices(rank=r, world_size=3)) for r in range(3)]
+    assert [len(s) for s in shards] == [4, 4, 3]
+    batches = list(sampler.iter_batches(4, rank=0, world_size=3))
+    assert [list(b) for b in batches] == [shards[0]]
+
+
+def test_invalid_strategy(skewed: NewsClassificationDataset) -> None:
+    with pytest.raises(ValueError, match="Unknown strategy"):
+        LabelBalancedSampler(skewed, strategy="oversample")
+    with pytest.raises(ValueError, match="weights"):
+        LabelBalancedSampler(skewed, strategy="custom")
+    for bad in (-1.0, float("nan"), float("inf")):
+        with pytest.raises(ValueError, match="'B' must be finite"):
+            LabelBalancedSampler(skewed, strategy="custom", weights={"A": 1.0, "B": bad})
+    with pytest.raises(ValueError, match="finite"):
+        LabelBalancedSampler(skewed, strategy="custom", weights=[float("nan")] + [1.0] * 99)
@@ -0,0 +1,82 @@
+from collections import Counter
+from pathlib import Path
+from typing import Callable
+
+import pytest
+
+from ua_datasets.text_classification import NewsClassificationDataset, StratifiedSplitter
+
+
+@pytest.fixture
+def news(tmp_path: Path) -> NewsClassificationDataset:
+    labels = ["A"] * 60 + ["B"] * 30 + ["C"] * 10
+    body = "".join(f"T{i},Body,t{i % 2},{lab}\n" for i, lab in enumerate(labels))
+    (tmp_path / "train.csv").write_text("title,text,tags,target\n" + body, encoding="utf8")
+    return NewsClassificationDataset(root=tmp_path, split="train", download=False)
+
+
+def test_kfold_partitions_and_stratifies(news: NewsClassificationDataset) -> None:
+    folds = StratifiedSplitter(news, seed=3).kfold(5)
+    seen: list = []
+    for train, val in folds:
+        assert len(train) + len(val) == len(news)
+        assert train.parent is news
+        assert Counter(row[2] for row in val) == {"A": 12, "B": 6, "C": 2}
+        seen.extend(val.indices)
+    assert sorted(seen) == list(range(len(news)))
+
+
+def test_holdout_deterministic_and_by_tag(news: NewsClassificationDataset) -> None:
+    _, val = StratifiedSplitter(news, seed=1).holdout(0.2)
+    assert len(val) == 20
+    _, again = StratifiedSplitter(news, seed=1).holdout(0.2)
+    assert list(again.indices) == list(val.indices)
+    _, other = StratifiedSplitter(news, seed=2).holdout(0.2)
+    assert list(other.indices) != list(val.indices)
+    _, by_tag = StratifiedSplitter(news, seed=1, stratify_by_tag=True).holdout(0.2)
+    assert len(by_tag) == 20
+
+
+def test_assignments_are_persisted(
+    news: NewsClassificationDataset, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    cache = tmp_path / "splits"
+    first = StratifiedSplitter(news, seed=5, cache_dir=cache).fold_assignment(4)
+    assert len(list(cache.iterdir())) == 1
+
+    def _fail(self: StratifiedSplitter, params: dict) -> None:
+        raise AssertionError("assignment should be loaded from disk")
+
+    monkeypatch.setattr(StratifiedSplitter, "_build_kfold", _fail)
+    assert StratifiedSplitter(news, seed=5, cache_dir=cache).fold_assignment(4) == first
+
+
+def test_invalid_parameters(news: NewsClassificationDataset) -> None:
+    with pytest.raises(ValueError, match="n_splits"):
+        StratifiedSplitter(news).kfold(1)
+    with pytest.raises(ValueError, match="test_size"):
+        StratifiedSplitter(news).holdout(1.5)
+
+
+def test_kfold_rejects_more_splits_than_rows(
+    tmp_path: Path, write_news_csv: Callable[..., Path]
+) -> None:
+    write_news_csv(4)
+    small = NewsClassificationDataset(root=tmp_path, split="train", download=False)
+    assert len(StratifiedSplitter(small).kfold(4)) == 4
+    with pytest.raises(ValueError, match="greater than the number of rows"):
+        StratifiedSplitter(small).kfold(10)
+
+
+def test_cache_distinguishes_filtered_subsets(tmp_path: Path) -> None:
+    body = "".join(f"T{i},Body,t0,{'AB'[i % 3 == 0]}\n" for i in range(100))
+    (tmp_path / "train.csv").write_text("title,text,tags,target\n" + body, encoding="utf8")
+    cache = tmp_path / "splits"
+    for parity in (0, 1):
+        subset = NewsClassificationDataset(
+            root=tmp_path, download=False, where=lambda r, p=parity: int(r["title"][1:]) % 2 == p
+        )
+        assert len(subset) == 50
+        expected = StratifiedSplitter(subset, seed=5).fold_assignment(4)
+        assert StratifiedSplitter(subset, seed=5, cache_dir=cache).fold_assignment(4) == expected
+    assert len(list(cache.iterdir())) == 2
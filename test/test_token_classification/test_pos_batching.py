@@ -0,0 +1,56 @@
+from pathlib import Path
+
+import pytest
+
+from ua_datasets.token_classification import MovaInstitutePOSDataset
+
+
+@pytest.fixture
+def ds(tmp_path: Path) -> MovaInstitutePOSDataset:
+    sentences = []
+    for i, n in enumerate([1, 5, 2, 9, 3, 3, 7, 1, 4, 2]):
+        sentences.append("".join(f"{j + 1}\tw{i}_{j}\t_\t{'NV'[j % 2]}\n" for j in range(n)))
+    (tmp_path / "b.conllu.txt").write_text("\n".join(sentences), encoding="utf8")
+    return MovaInstitutePOSDataset(
+        root=tmp_path, download=False, file_name="b.conllu.txt", encoded=True
+    )
+
+
+def test_lengths_recorded(ds: MovaInstitutePOSDataset) -> None:
+    assert list(ds.sentence_lengths) == [1, 5, 2, 9, 3, 3, 7, 1, 4, 2]
+
+
+def test_batches_cover_corpus_within_budget(ds: MovaInstitutePOSDataset) -> None:
+    batches = list(ds.iter_padded_batches(max_tokens=12, seed=3))
+    seen = sorted(i for b in batches for i in b.indices)
+    assert seen == list(range(len(ds)))
+    for b in batches:
+        rows, width = b.shape
+        assert rows * width <= 12 or rows == 1
+        assert len(b.token_ids) == len(b.tag_ids) == len(b.mask) == rows * width
+        assert sum(b.mask) == sum(ds.sentence_lengths[i] for i in b.indices)
+
+
+def test_padding_and_ids(ds: MovaInstitutePOSDataset) -> None:
+    batch = next(ds.iter_padded_batches(max_tokens=100, batch_size=2, shuffle=False, pad_id=7))
+    _, width = batch.shape
+    first = batch.indices[0]
+    token_ids, _ = ds.ids(first)
+    row = batch.token_ids[:width].tolist()
+    assert row[: len(token_ids)] == token_ids.tolist()
+    assert row[len(token_ids) :] == [7] * (width - len(token_ids))
+
+
+def test_reproducible_per_epoch(ds: MovaInstitutePOSDataset) -> None:
+    def order(epoch: int) -> list:
+        return [list(b.indices) for b in ds.iter_padded_batches(max_tokens=10, seed=1, epoch=epoch)]
+
+    assert order(0) == order(0)
+    assert order(0) != order(1)
+
+
+def test_requires_encoded(tmp_path: Path) -> None:
+    (tmp_path / "p.conllu.txt").write_text("1\ta\t_\tX\n", encoding="utf8")
+    plain = MovaInstitutePOSDataset(root=tmp_path, download=False, file_name="p.conllu.txt")
+    with pytest.raises(ValueError, match="encoded"):
+        next(plain.iter_padded_batches())
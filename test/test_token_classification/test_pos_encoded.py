@@ -0,0 +1,47 @@
+from array import array
+from pathlib import Path
+
+import pytest
+
+from ua_datasets.token_classification.part_of_speech import MovaInstitutePOSDataset
+
+CONTENT = "1\tHello\t_\tINTJ\n2\tworld\t_\tNOUN\n\n1\tworld\t_\tNOUN\n2\tagain\t_\tADV\n\n"
+
+
+@pytest.fixture
+def root(tmp_path: Path) -> Path:
+    (tmp_path / "enc.conllu.txt").write_text(CONTENT, encoding="utf8")
+    return tmp_path
+
+
+def _load(root: Path, **kwargs: bool) -> MovaInstitutePOSDataset:
+    return MovaInstitutePOSDataset(root=root, download=False, file_name="enc.conllu.txt", **kwargs)
+
+
+def test_encoded_matches_plain(root: Path) -> None:
+    plain, encoded = _load(root), _load(root, encoded=True)
+    assert len(encoded) == len(plain) == 2
+    assert list(encoded) == list(plain)
+    assert encoded[-1] == plain[-1]
+    assert encoded.data == plain.data
+    assert encoded.labels == plain.labels
+    assert encoded.unique_labels == plain.unique_labels
+    assert encoded.label_frequencies() == plain.label_frequencies()
+
+
+def test_flat_buffers_and_id_slices(root: Path) -> None:
+    ds = _load(root, encoded=True, return_ids=True)
+    assert ds.token_vocabulary == ["Hello", "world", "again"]
+    assert ds.tag_vocabulary == ["INTJ", "NOUN", "ADV"]
+    assert ds.sentence_offsets == array("Q", [0, 2, 4])
+    token_ids, tag_ids = ds[1]
+    assert isinstance(token_ids, memoryview)
+    assert token_ids.tolist() == [1, 2]
+    assert tag_ids.tolist() == [1, 2]
+    with pytest.raises(IndexError):
+        ds.ids(2)
+
+
+def test_return_ids_requires_encoded(root: Path) -> None:
+    with pytest.raises(ValueError, match="encoded"):
+        _load(root, return_ids=True)
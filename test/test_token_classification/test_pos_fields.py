@@ -0,0 +1,59 @@
+from array import array
+from pathlib import Path
+
+import pytest
+
+from ua_datasets.token_classification.part_of_speech import MovaInstitutePOSDataset
+
+CONLLU = (
+    "# sent_id = 1\n"
+    "1\tMama\tmama\tNOUN\tNcfsnn\tCase=Nom|Gender=Fem|Number=Sing\t2\tnsubj\t_\t_\n"
+    "2\tmyie\tmyty\tVERB\tVmpis3s\tNumber=Sing|Person=3\t0\troot\t_\tSpaceAfter=No\n"
+    "3\t.\t.\tPUNCT\tU\t_\t2\tpunct\t_\t_\n"
+    "\n"
+    "1\tTato\ttato\tNOUN\tNcmsnn\tCase=Nom|Gender=Masc|Number=Sing\t_\troot\n"
+)
+
+
+@pytest.fixture
+def root(tmp_path: Path) -> Path:
+    (tmp_path / "ud.conllu").write_text(CONLLU, encoding="utf8")
+    return tmp_path
+
+
+def test_default_keeps_form_and_upos_only(root: Path) -> None:
+    ds: MovaInstitutePOSDataset = MovaInstitutePOSDataset(
+        root=root, download=False, file_name="ud.conllu"
+    )
+    assert ds[0] == (["Mama", "myie", "."], ["NOUN", "VERB", "PUNCT"])
+    assert ds.annotations(0) == {}
+
+
+def test_selected_fields(root: Path) -> None:
+    ds: MovaInstitutePOSDataset = MovaInstitutePOSDataset(
+        root=root, download=False, file_name="ud.conllu", fields=("lemma", "feats", "head")
+    )
+    ann = ds.annotations(0)
+    assert set(ann) == {"lemma", "feats", "head"}
+    assert ann["lemma"] == ["mama", "myty", "."]
+    assert ann["head"] == array("h", [2, 0, 2])
+    assert ds.decode_feats(ann["feats"][0]) == {"Case": "Nom", "Gender": "Fem", "Number": "Sing"}
+    assert ann["feats"][2] == 0
+    # Second sentence lacks trailing columns and has an unspecified head.
+    second = ds.annotations(1)
+    assert second["head"] == array("h", [-1])
+    assert ds.decode_feats(second["feats"][0])["Gender"] == "Masc"
+    assert "Case=Nom" in ds.feats_vocabulary
+
+
+def test_missing_columns_default_to_underscore(root: Path) -> None:
+    ds: MovaInstitutePOSDataset = MovaInstitutePOSDataset(
+        root=root, download=False, file_name="ud.conllu", fields=("misc",)
+    )
+    assert ds.annotations(0)["misc"] == ["_", "SpaceAfter=No", "_"]
+    assert ds.annotations(1)["misc"] == ["_"]
+
+
+def test_unknown_field_rejected(root: Path) -> None:
+    with pytest.raises(ValueError, match="Invalid fields"):
+        MovaInstitutePOSDataset(root=root, download=False, file_name="ud.conllu", fields=("form",))
@@ -0,0 +1,72 @@
+import os
+from pathlib import Path
+
+import pytest
+
+from ua_datasets.token_classification import MovaInstitutePOSDataset
+
+
+def _sentence(i: int) -> str:
+    n = 1 + i % 4
+    head = f"# sent_id = {i}\n"
+    if i % 3 == 0:
+        head += f"1-2\tmw{i}\t_\t_\n"
+    return head + "".join(
+        f"{j + 1}\tt{i}_{j}\tl{j}\t{'ABC'[j % 3]}\tX\tF={j}\t0\n" for j in range(n)
+    )
+
+
+@pytest.fixture
+def root(tmp_path: Path) -> Path:
+    body = "\n".join(_sentence(i) for i in range(50))
+    # Extra blank lines and a trailing sentence without a final newline.
+    (tmp_path / "main.conllu").write_text("\n\n" + body + "\n\n" + _sentence(50).rstrip("\n"))
+    crlf = "\n".join(_sentence(i) for i in range(100, 110)).replace("\n", "\r\n")
+    (tmp_path / "extra.conllu").write_text(crlf, newline="")
+    return tmp_path
+
+
+def _load(root: Path, **kwargs: object) -> MovaInstitutePOSDataset:
+    return MovaInstitutePOSDataset(
+        root=root, download=False, file_name="main.conllu", extra_files=("extra.conllu",), **kwargs
+    )
+
+
+def test_lazy_matches_eager(root: Path) -> None:
+    eager = _load(root, fields=("lemma", "head"))
+    lazy = _load(root, fields=("lemma", "head"), lazy=True)
+    assert len(lazy) == len(eager) == 61
+    assert [lazy[i] for i in range(len(lazy))] == list(eager)
+    assert lazy[-1] == eager[-1]
+    assert list(lazy) == list(eager)
+    assert lazy.annotations(7) == eager.annotations(7)
+    assert list(lazy.sentence_lengths) == list(eager.sentence_lengths)
+    assert list(lazy.source_offsets) == [0, 51, 61]
+    assert lazy.unique_labels == eager.unique_labels
+    assert lazy.label_frequencies() == eager.label_frequencies()
+    with pytest.raises(IndexError, match="out of range"):
+        lazy[61]
+    lazy.close()
+
+
+def test_sidecar_index_reused_and_rebuilt(root: Path) -> None:
+    _load(root, lazy=True).close()
+    sidecar = root / "main.conllu.sentidx"
+    assert sidecar.exists()
+    stamp = sidecar.stat().st_mtime_ns
+    _load(root, lazy=True).close()
+    assert sidecar.stat().st_mtime_ns == stamp
+
+    path = root / "main.conllu"
+    path.write_text(_sentence(0) + "\n" + _sentence(1))
+    os.utime(path, ns=(stamp + 10**9, stamp + 10**9))
+    ds = _load(root, lazy=True)
+    assert len(ds) == 12
+    assert ds[1][0] == ["t1_0", "t1_1"]
+
+
+def test_lazy_rejects_encoded(root: Path) -> None:
+    with pytest.raises(ValueError, match="lazy=True"):
+        _load(root, lazy=True, encoded=True)
+    with pytest.raises(ValueError, match="feats"):
+        _load(root, lazy=True, fields=("feats",))
@@ -0,0 +1,68 @@
+from pathlib import Path
+
+import pytest
+
+from ua_datasets.token_classification import MovaInstitutePOSDataset, part_of_speech
+
+
+def _sentence(i: int) -> str:
+    n = 1 + i % 6
+    head = f"# sent_id = {i}\n"
+    if i % 5 == 0:
+        head += f"1-2\tmw{i}\t_\t_\n"
+    return head + "".join(f"{j + 1}\tt{i}_{j}\tl{j}\t{'ABC'[j % 3]}\tX\tF=1\n" for j in range(n))
+
+
+@pytest.fixture
+def root(tmp_path: Path) -> Path:
+    (tmp_path / "main.conllu").write_text("\n".join(_sentence(i) for i in range(300)), "utf8")
+    body = "\r\n".join(_sentence(i).replace("\n", "\r\n") for i in range(300, 400))
+    (tmp_path / "ud_iu.conllu").write_text(body.replace("\tA\t", "\tD\t"), "utf8")
+    return tmp_path
+
+
+def test_parallel_matches_serial(monkeypatch: pytest.MonkeyPatch, root: Path) -> None:
+    monkeypatch.setattr(part_of_speech, "_MIN_CHUNK_BYTES", 512)
+    kwargs = {"root": root, "download": False, "file_name": "main.conllu", "fields": ("lemma",)}
+    serial = MovaInstitutePOSDataset(**kwargs, extra_files=("ud_iu.conllu",))
+    parallel = MovaInstitutePOSDataset(**kwargs, extra_files=("ud_iu.conllu",), parse_workers=3)
+    assert len(parallel) == len(serial) == 400
+    assert list(parallel) == list(serial)
+    assert [parallel.annotations(i) for i in range(400)] == [
+        serial.annotations(i) for i in range(400)
+    ]
+    assert list(parallel.source_offsets) == [0, 300, 400]
+
+
+def test_multiple_files_share_vocabulary(root: Path) -> None:
+    ds = MovaInstitutePOSDataset(
+        root=root,
+        download=False,
+        file_name="main.conllu",
+        extra_files=(root / "ud_iu.conllu",),
+        encoded=True,
+    )
+    assert ds.unique_labels == {"A", "B", "C", "D"}
+    assert ds.sentence_source(0).name == "main.conllu"
+    assert ds.sentence_source(-1).name == "ud_iu.conllu"
+    assert ds[300][0][0] == "t300_0"
+
+
+def test_chunk_boundaries_follow_blank_lines(monkeypatch: pytest.MonkeyPatch, root: Path) -> None:
+    monkeypatch.setattr(part_of_speech, "_MIN_CHUNK_BYTES", 512)
+    for name, blank in (("main.conllu", b"\n\n"), ("ud_iu.conllu", b"\n\r\n")):
+        path = root / name
+        data = path.read_bytes()
+        spans = part_of_speech._chunk_spans(path, 4)
+        assert len(spans) == 4
+        assert spans[0][0] == 0
+        assert spans[-1][1] == len(data)
+        for start, _ in spans[1:]:
+            assert data[start - len(blank) : start] == blank
+
+
+def test_missing_extra_file(root: Path) -> None:
+    with pytest.raises(FileNotFoundError):
+        MovaInstitutePOSDataset(
+            root=root, download=False, file_name="main.conllu", extra_files=("nope.conllu",)
+        )
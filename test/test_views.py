@@ -0,0 +1,68 @@
+import json
+from array import array
+from pathlib import Path
+from typing import Callable
+
+import pytest
+
+from ua_datasets import MovaInstitutePOSDataset, NewsClassificationDataset, UaSquadDataset
+from ua_datasets.views import DatasetView
+
+
+@pytest.fixture
+def news(tmp_path: Path, write_news_csv: Callable[..., Path]) -> NewsClassificationDataset:
+    write_news_csv(20)
+    return NewsClassificationDataset(root=tmp_path, download=False)
+
+
+def test_slicing_returns_view(news: NewsClassificationDataset) -> None:
+    view = news[2:10:2]
+    assert isinstance(view, DatasetView)
+    assert view.indices == range(2, 10, 2)
+    assert list(view) == [news[i] for i in (2, 4, 6, 8)]
+    assert view[-1] == news[8]
+    assert list(news[::-1]) == [news[i] for i in reversed(range(len(news)))]
+
+
+def test_nested_views_stay_on_parent(news: NewsClassificationDataset) -> None:
+    nested = news[::-2][1:3]
+    assert nested.parent is news
+    assert list(nested) == [news[17], news[15]]
+    picked = news.select([5, -1, 0])[[2, 0]]
+    assert isinstance(picked.indices, array)
+    assert list(picked) == [news[0], news[5]]
+
+
+def test_view_methods_act_on_view(news: NewsClassificationDataset) -> None:
+    view = news[:10]
+    assert list(view.prefetch(4)) == list(view)
+    assert sorted(view.shuffled(seed=1, block_size=3)) == sorted(view)
+    assert list(view.shard(2, 0)) == [news[i] for i in range(0, 10, 2)]
+    assert list(view.shard(2, 1, contiguous=True)) == list(news[5:10])
+    assert view.parent.column_names == news.column_names
+    with pytest.raises(AttributeError, match="column_names"):
+        view.column_names  # noqa: B018
+    with pytest.raises(AttributeError, match="memory_usage"):
+        view.memory_usage()
+
+
+def test_invalid_indices(news: NewsClassificationDataset) -> None:
+    with pytest.raises(IndexError, match="out of range"):
+        news.select([0, 20])
+    with pytest.raises(TypeError, match="integer sequences"):
+        news.select("ab")
+
+
+def test_pos_and_squad_views(tmp_path: Path, write_conllu: Callable[..., Path]) -> None:
+    write_conllu(6)
+    pos = MovaInstitutePOSDataset(root=tmp_path, download=False, file_name="pos.conllu")
+    assert list(pos[1:3]) == [pos[1], pos[2]]
+    assert pos.select(range(0, 6, 3))[1] == pos[3]
+
+    data = [{"question": f"q{i}", "context": f"c{i} a", "answer": "a"} for i in range(4)]
+    (tmp_path / "train.json").write_text(json.dumps({"data": data}), "utf8")
+    squad = UaSquadDataset(root=tmp_path, download=False)
+    assert [ex["question"] for ex in squad[[3, 1]]] == ["q3", "q1"]
+    assert squad.examples is squad.examples
+    assert squad.to_hf_dict() == list(squad.examples)
+    assert squad.to_hf_dict() is not squad.to_hf_dict()
@@ -0,0 +1,83 @@
+from pathlib import Path
+from typing import Callable
+
+import pytest
+
+from ua_datasets.text_classification import NewsClassificationDataset
+from ua_datasets.token_classification import MovaInstitutePOSDataset
+from ua_datasets.vocab import (
+    CountMinSketch,
+    Vocabulary,
+    VocabularyBuilder,
+    build_vocabulary,
+)
+
+
+@pytest.fixture
+def news(tmp_path: Path, write_news_csv: Callable[..., Path]) -> NewsClassificationDataset:
+    def words(i: int) -> str:
+        # Token "w{k}" occurs in every row with index divisible by k.
+        return " ".join(f"w{k}" for k in range(1, 11) if i % k == 0) + f" u{i}"
+
+    write_news_csv(60, text=words, tags="", labels="A")
+    return NewsClassificationDataset(root=tmp_path, split="train", download=False)
+
+
+def test_exact_vocabulary_pruning(news: NewsClassificationDataset) -> None:
+    vocab = build_vocabulary(news, min_freq=10)
+    assert vocab.tokens == ["<pad>", "<unk>", "w1", "w2", "w3", "w4", "w5", "w6"]
+    assert vocab.counts[2:4].tolist() == [60, 30]
+    top = build_vocabulary(news, top_k=3, specials=(), unk_token=None)
+    assert top.tokens == ["w1", "w2", "w3"]
+    with pytest.raises(KeyError):
+        top.lookup("u1")
+    assert vocab.encode(["w2", "nope"]).tolist() == [3, 1]
+
+
+def test_parallel_and_sketch_match_exact(news: NewsClassificationDataset) -> None:
+    exact = build_vocabulary(news, min_freq=2)
+    assert build_vocabulary(news, min_freq=2, num_workers=2, chunk_size=7) == exact
+    sketch = build_vocabulary(
+        news, min_freq=2, mode="sketch", width=4096, max_candidates=20, num_workers=2, chunk_size=7
+    )
+    assert sketch.tokens == exact.tokens
+
+
+def test_sketch_never_undercounts() -> None:
+    sketch = CountMinSketch(width=16, depth=3)
+    for i in range(200):
+        sketch.add(f"t{i % 40}")
+    assert all(sketch.estimate(f"t{i}") >= 5 for i in range(40))
+    builder = VocabularyBuilder(mode="sketch", width=64, max_candidates=4)
+    builder.update(["a"] * 50 + ["b"] * 30 + [f"r{i}" for i in range(100)])
+    counts = builder.counts()
+    assert len(counts) < 8
+    assert counts["a"] >= 50
+    assert counts["b"] >= 30
+
+
+def test_saved_vocabulary_drives_encoded_pos(tmp_path: Path) -> None:
+    (tmp_path / "pos.conllu").write_text("1\tx\t_\tA\n2\ty\t_\tB\n\n1\tz\t_\tA\n", "utf8")
+    path = tmp_path / "vocab.json"
+    Vocabulary(["<pad>", "<unk>", "y", "x"]).save(path)
+    assert Vocabulary.load(path).tokens == ["<pad>", "<unk>", "y", "x"]
+    ds = MovaInstitutePOSDataset(
+        root=tmp_path, download=False, file_name="pos.conllu", encoded=True, vocabulary=path
+    )
+    assert ds.ids(0)[0].tolist() == [3, 2]
+    assert ds[1][0] == ["<unk>"]
+    assert ds.token_vocabulary == ["<pad>", "<unk>", "y", "x"]
+    with pytest.raises(ValueError, match="requires encoded"):
+        MovaInstitutePOSDataset(
+            root=tmp_path, download=False, file_name="pos.conllu", vocabulary=path
+        )
+
+
+def test_exact_update_is_linear(monkeypatch: pytest.MonkeyPatch) -> None:
+    builder = VocabularyBuilder()
+    # Counter.total() sums every count; calling it per sequence made building quadratic.
+    monkeypatch.setattr(type(builder._exact), "total", lambda self: pytest.fail("total()"))
+    for i in range(2000):
+        builder.update(iter([f"a{i}", f"b{i}", "c"]))
+    assert builder.total == 6000
+    assert builder.counts()["c"] == 2000
@@ -0,0 +1,68 @@
+import json
+import pickle
+from pathlib import Path
+from typing import Callable
+
+import pytest
+
+from ua_datasets import MovaInstitutePOSDataset, NewsClassificationDataset, UaSquadDataset
+from ua_datasets.text_classification import news_classification
+
+
+@pytest.fixture
+def root(
+    tmp_path: Path, write_news_csv: Callable[..., Path], write_conllu: Callable[..., Path]
+) -> Path:
+    write_news_csv(
+        60, text=lambda i: f'"multi\nline {i}"' if i % 5 == 0 else f"plain {i}", labels="XYZ"
+    )
+    write_conllu(30, sentence=lambda i: "".join(f"{k + 1}\tw{k}\t_\tA\n" for k in range(i % 6 + 1)))
+    data = [
+        {"question": f"q{i}", "context": "c" * (i + 1), "answer": "c" if i % 2 else None}
+        for i in range(10)
+    ]
+    (tmp_path / "train.json").write_text(json.dumps({"data": data}), "utf8")
+    return tmp_path
+
+
+def test_news_where_filters_rows(monkeypatch: pytest.MonkeyPatch, root: Path) -> None:
+    full = NewsClassificationDataset(root=root, download=False)
+    expected = [row for row in full.data if row[3] != "Y"]
+    ds = NewsClassificationDataset(root=root, download=False, where=lambda r: r["target"] != "Y")
+    assert ds.data == expected
+    assert ds.labels == {"X", "Z"}
+    monkeypatch.setattr(news_classification, "_MIN_CHUNK_BYTES", 128)
+    parallel = NewsClassificationDataset(
+        root=root, download=False, parse_workers=3, where=lambda r: r["target"] != "Y"
+    )
+    assert parallel.data == expected
+    shards = [
+        NewsClassificationDataset(
+            root=root, download=False, load_shard=(2, k), where=lambda r: r["target"] != "Y"
+        )
+        for k in range(2)
+    ]
+    assert [row for s in shards for row in s.data] == expected
+
+
+def test_pos_where_filters_sentences(root: Path) -> None:
+    kwargs = {"root": root, "download": False, "file_name": "pos.conllu"}
+    full = MovaInstitutePOSDataset(**kwargs)
+    ds = MovaInstitutePOSDataset(**kwargs, encoded=True, where=lambda toks, tags: len(toks) > 3)
+    assert list(ds) == [s for s in full if len(s[0]) > 3]
+    assert list(ds.sentence_lengths) == [n for n in full.sentence_lengths if n > 3]
+    assert pickle.loads(pickle.dumps(ds))[0] == ds[0]
+    with pytest.raises(ValueError, match="lazy"):
+        MovaInstitutePOSDataset(**kwargs, lazy=True, where=lambda toks, tags: True)
+
+
+def test_squad_where_filters_examples(root: Path) -> None:
+    ds = UaSquadDataset(
+        root=root,
+        download=False,
+        where=lambda ex: not ex["is_impossible"] and len(ex["context"]) < 8,
+    )
+    assert [ex["question"] for ex in ds] == ["q1", "q3", "q5"]
+    empty = UaSquadDataset(root=root, download=False, where=lambda ex: False)
+    assert len(empty) == 0
+    assert len(pickle.loads(pickle.dumps(ds))) == 3
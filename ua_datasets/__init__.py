@@ -1,9 +1,58 @@
-from ua_datasets.question_answering import UaSquadDataset
-from ua_datasets.text_classification import NewsClassificationDataset
-from ua_datasets.token_classification import MovaInstitutePOSDataset
+"""Ukrainian language datasets.
+
+The dataset classes are imported on first attribute access (PEP 562), so
+``import ua_datasets`` stays cheap and only the loader actually used is loaded.
+"""
+
+from __future__ import annotations
+
+import sys
+
+TYPE_CHECKING = False  # avoids importing ``typing``; type checkers treat the name as True
+if TYPE_CHECKING:
+    from typing import Callable
+
+    from ua_datasets.question_answering import UaSquadDataset
+    from ua_datasets.text_classification import NewsClassificationDataset
+    from ua_datasets.token_classification import MovaInstitutePOSDataset
 
 __all__ = [
     "MovaInstitutePOSDataset",
     "NewsClassificationDataset",
     "UaSquadDataset",
 ]
+
+
+def _lazy_module(
+    name: str, attributes: dict[str, str]
+) -> tuple[Callable[[str], object], Callable[[], list[str]]]:
+    """Return PEP 562 ``__getattr__`` and ``__dir__`` functions for package ``name``.
+
+    ``attributes`` maps each exported name to the module defining it; that
+    module is imported on first access and the value cached in the package.
+    """
+
+    def __getattr__(attr: str) -> object:
+        module = attributes.get(attr)
+        if module is None:
+            raise AttributeError(f"module {name!r} has no attribute {attr!r}")
+        from importlib import import_module
+
+        value = getattr(import_module(module), attr)
+        setattr(sys.modules[name], attr, value)  # later lookups bypass __getattr__
+        return value
+
+    def __dir__() -> list[str]:
+        return sorted({*vars(sys.modules[name]), *attributes})
+
+    return __getattr__, __dir__
+
+
+__getattr__, __dir__ = _lazy_module(
+    __name__,
+    {
+        "MovaInstitutePOSDataset": "ua_datasets.token_classification",
+        "NewsClassificationDataset": "ua_datasets.text_classification",
+        "UaSquadDataset": "ua_datasets.question_answering",
+    },
+)
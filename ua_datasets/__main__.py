@@ -0,0 +1,3 @@
+from ua_datasets.cli import main
+
+raise SystemExit(main())
@@ -0,0 +1,323 @@
+"""asyncio counterparts of the download helpers and dataset constructors.
+
+:func:`adownload_text_with_retries` talks HTTP/1.1 over ``asyncio`` streams
+(non-blocking sockets, TLS via :mod:`ssl`) and backs off with
+:func:`asyncio.sleep`, so an event loop keeps serving other tasks while a
+corpus downloads. The ``aload()`` classmethods of the datasets use it to fetch
+missing files and then run the (CPU-bound) parsing in an executor.
+
+Concurrency is bounded by an :class:`asyncio.Semaphore` passed as ``limiter``
+(held per download attempt) or by :func:`gather_limited`:
+
+>>> train, val = await gather_limited(
+...     [UaSquadDataset.aload(root, split=s) for s in ("train", "val")], limit=2
+... )
+"""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import dataclasses
+from functools import partial
+from pathlib import Path
+from typing import (
+    Any,
+    Awaitable,
+    Callable,
+    Dict,
+    Iterable,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+    Type,
+    TypeVar,
+    Union,
+)
+from urllib.parse import urljoin, urlsplit
+
+from ua_datasets.instrumentation import span
+from ua_datasets.progress import ProgressReporter
+from ua_datasets.utils import DownloadFailure, atomic_write_text, verify_payload
+
+__all__ = [
+    "adownload_text_with_retries",
+    "aload_dataset",
+    "fetch_bytes",
+    "gather_limited",
+]
+
+T = TypeVar("T")
+
+Fetcher = Callable[..., Awaitable[bytes]]
+
+_REDIRECTS = frozenset({301, 302, 303, 307, 308})
+_READ_SIZE = 1 << 16
+
+
+def _ignore(nbytes: int) -> None:
+    pass
+
+
+async def _read_headers(reader: asyncio.StreamReader, timeout: float) -> Tuple[int, Dict[str, str]]:
+    status_line = await asyncio.wait_for(reader.readline(), timeout)
+    parts = status_line.decode("latin-1").split(None, 2)
+    if len(parts) < 2 or not parts[0].startswith("HTTP/") or not parts[1].isdigit():
+        raise DownloadFailure(f"Malformed HTTP status line: {status_line[:80]!r}")
+    headers: Dict[str, str] = {}
+    while True:
+        line = await asyncio.wait_for(reader.readline(), timeout)
+        if line in (b"\r\n", b"\n", b""):
+            return int(parts[1]), headers
+        name, _, value = line.decode("latin-1").partition(":")
+        headers[name.strip().lower()] = value.strip()
+
+
+async def _read_body(
+    reader: asyncio.StreamReader,
+    headers: Dict[str, str],
+    timeout: float,
+    on_chunk: Callable[[int], None],
+) -> bytes:
+    body = bytearray()
+    if headers.get("transfer-encoding", "").lower() == "chunked":
+        while True:
+            size_line = await asyncio.wait_for(reader.readline(), timeout)
+            size = int(size_line.split(b";", 1)[0].strip() or b"0", 16)
+            if size == 0:
+                # Skip optional trailers up to the terminating blank line.
+                while (await asyncio.wait_for(reader.readline(), timeout)) not in (
+                    b"\r\n",
+                    b"\n",
+                    b"",
+                ):
+                    pass
+                return bytes(body)
+            body += await asyncio.wait_for(reader.readexactly(size), timeout)
+            on_chunk(size)
+            await asyncio.wait_for(reader.readexactly(2), timeout)  # CRLF after each chunk
+    if "content-length" in headers:
+        remaining = int(headers["content-length"])
+        while remaining:
+            chunk = await asyncio.wait_for(reader.read(min(remaining, _READ_SIZE)), timeout)
+            if not chunk:
+                raise asyncio.IncompleteReadError(bytes(body), remaining)
+            body += chunk
+            on_chunk(len(chunk))
+            remaining -= len(chunk)
+        return bytes(body)
+    while chunk := await asyncio.wait_for(reader.read(_READ_SIZE), timeout):
+        body += chunk
+        on_chunk(len(chunk))
+    return bytes(body)
+
+
+async def _get(
+    url: str, timeout: float, progress: Optional[ProgressReporter]
+) -> Tuple[int, Dict[str, str], bytes]:
+    parts = urlsplit(url)
+    if parts.scheme not in ("http", "https") or not parts.hostname:
+        raise ValueError(f"Unsupported URL for async download: {url!r}")
+    ssl_context = None
+    if parts.scheme == "https":
+        import ssl
+
+        ssl_context = ssl.create_default_context()
+    port = parts.port or (443 if ssl_context else 80)
+    reader, writer = await asyncio.wait_for(
+        asyncio.open_connection(parts.hostname, port, ssl=ssl_context), timeout
+    )
+    try:
+        target = (parts.path or "/") + (f"?{parts.query}" if parts.query else "")
+        host = parts.netloc.rpartition("@")[2]
+        writer.write(
+            f"GET {target} HTTP/1.1\r\nHost: {host}\r\nUser-Agent: ua-datasets\r\n"
+            "Accept-Encoding: identity\r\nConnection: close\r\n\r\n".encode("latin-1")
+        )
+        await asyncio.wait_for(writer.drain(), timeout)
+        status, headers = await _read_headers(reader, timeout)
+        if progress is None or not 200 <= status < 300:
+            return status, headers, await _read_body(reader, headers, timeout, _ignore)
+        length = headers.get("content-length", "")
+        progress.start(url, int(length) if length.isdigit() and int(length) else None)
+        try:
+            body = await _read_body(reader, headers, timeout, partial(progress.advance, url))
+        finally:
+            progress.finish(url)
+        return status, headers, body
+    finally:
+        writer.close()
+        with contextlib.suppress(OSError, asyncio.TimeoutError):  # peer gone / TLS teardown
+            await writer.wait_closed()
+
+
+async def fetch_bytes(
+    url: str,
+    *,
+    timeout: float = 15,
+    max_redirects: int = 5,
+    progress: Optional[ProgressReporter] = None,
+) -> bytes:
+    """GET ``url`` without blocking the event loop and return the response body.
+
+    Redirects are followed; a status of 400 or above raises ``DownloadFailure``.
+    Like ``urlopen``'s ``timeout``, ``timeout`` applies to each connect, send
+    and read step rather than to the whole transfer. The body of the final
+    response is reported to ``progress`` as it arrives.
+    """
+    for _ in range(max_redirects + 1):
+        status, headers, body = await _get(url, timeout, progress)
+        if status in _REDIRECTS and "location" in headers:
+            url = urljoin(url, headers["location"])
+            continue
+        if status >= 400:
+            raise DownloadFailure(f"HTTP {status} for {url}")
+        return body
+    raise DownloadFailure(f"Too many redirects for {url}")
+
+
+async def adownload_text_with_retries(
+    url: str,
+    *,
+    timeout: float = 15,
+    max_retries: int = 3,
+    expected_sha256: str | None = None,
+    backoff_factor: float = 0.5,
+    validate: Optional[Callable[[str], bool]] = None,
+    limiter: Optional[asyncio.Semaphore] = None,
+    show_progress: Union[bool, ProgressReporter] = False,
+    fetch: Fetcher = fetch_bytes,
+) -> str:
+    """Asynchronous :func:`~ua_datasets.utils.download_text_with_retries`.
+
+    Parameters
+    ----------
+    url, timeout, max_retries, expected_sha256, backoff_factor, validate
+        As for the blocking helper; backoff waits with ``asyncio.sleep``.
+    limiter : asyncio.Semaphore | None
+        Held for the duration of each attempt (not during backoff), bounding
+        how many downloads sharing it run at once.
+    show_progress : bool | ProgressReporter
+        As for the blocking helper; concurrent downloads reporting to the same
+        console display are shown as one aggregated line.
+    fetch : Callable[..., Awaitable[bytes]]
+        Coroutine function ``fetch(url, timeout=..., progress=...)`` returning
+        the body (injected for tests; ``progress`` is only passed when progress
+        is shown); defaults to :func:`fetch_bytes`.
+    """
+    options: Dict[str, Any] = {"timeout": timeout}
+    if show_progress:
+        from ua_datasets.progress import resolve_reporter
+
+        reporter = resolve_reporter(show_progress)
+        if reporter is not None:
+            options["progress"] = reporter
+    last_exc: Exception | None = None
+    for attempt in range(1, max_retries + 1):
+        try:
+            with span("download", url=url, attempt=attempt) as phase:
+                if limiter is None:
+                    data = await fetch(url, **options)
+                else:
+                    async with limiter:
+                        data = await fetch(url, **options)
+                phase.set(bytes=len(data))
+            return verify_payload(url, data, expected_sha256=expected_sha256, validate=validate)
+        except (OSError, EOFError, asyncio.TimeoutError, DownloadFailure) as exc:
+            last_exc = exc
+            if attempt < max_retries:
+                await asyncio.sleep(backoff_factor * attempt)
+        except Exception as exc:  # unknown fatal (bad URL, undecodable payload, ...)
+            last_exc = exc
+            break
+    raise DownloadFailure(f"Failed to download {url} after {max_retries} attempts: {last_exc}")
+
+
+async def gather_limited(awaitables: Iterable[Awaitable[T]], *, limit: int) -> List[T]:
+    """Await all ``awaitables`` with at most ``limit`` running at once; results keep input order.
+
+    Pass coroutines (e.g. ``aload()`` calls): they only start once a slot is free.
+    """
+    if limit < 1:
+        raise ValueError("limit must be positive")
+    semaphore = asyncio.Semaphore(limit)
+
+    async def run(awaitable: Awaitable[T]) -> T:
+        async with semaphore:
+            return await awaitable
+
+    return list(await asyncio.gather(*(run(aw) for aw in awaitables)))
+
+
+def _options(cls: type, kwargs: Dict[str, Any]) -> Dict[str, Any]:
+    """Constructor arguments of dataclass ``cls`` with defaults filled in."""
+    options: Dict[str, Any] = {}
+    for f in dataclasses.fields(cls):
+        if not f.init:
+            continue
+        if f.name in kwargs:
+            options[f.name] = kwargs[f.name]
+        elif f.default is not dataclasses.MISSING:
+            options[f.name] = f.default
+        elif f.default_factory is not dataclasses.MISSING:
+            options[f.name] = f.default_factory()
+    return options
+
+
+def _write(path: Path, text: str) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    atomic_write_text(path, text)
+
+
+async def aload_dataset(
+    cls: Callable[..., T],
+    kwargs: Dict[str, Any],
+    sources: Callable[[Dict[str, Any]], Sequence[Tuple[Path, str]]],
+    *,
+    validate: Optional[Callable[[str], bool]] = None,
+    error: Optional[Type[Exception]] = None,
+    limiter: Optional[asyncio.Semaphore] = None,
+    executor: Any = None,
+) -> T:
+    """Download a dataset's missing file asynchronously, then construct it in ``executor``.
+
+    Backs the ``aload()`` classmethods. ``sources`` maps the constructor
+    options (defaults filled in) to ``(local path, url)`` candidates tried in
+    order; the first successful download is written to its path. If none
+    succeeds, ``error`` is raised (or, when ``None``, construction proceeds and
+    the class handles the missing file). The dataset is then built with
+    ``download=False`` so the constructor only parses. With ``bundle=`` nothing
+    is downloaded: the constructor reads the files from the bundle.
+    """
+    options = _options(cls, kwargs)  # type: ignore[arg-type]
+    candidates = sources(options)
+    loop = asyncio.get_running_loop()
+    if (
+        options["download"]
+        and options.get("bundle") is None
+        and candidates
+        and (options["force_download"] or not any(path.exists() for path, _ in candidates))
+    ):
+        last_exc: Optional[DownloadFailure] = None
+        for path, url in candidates:
+            try:
+                text = await adownload_text_with_retries(
+                    url,
+                    timeout=options["timeout"],
+                    max_retries=options["max_retries"],
+                    expected_sha256=options["expected_sha256"],
+                    validate=validate,
+                    limiter=limiter,
+                    show_progress=options["show_progress"],
+                )
+            except DownloadFailure as exc:
+                last_exc = exc
+                continue
+            await loop.run_in_executor(executor, _write, path, text)
+            break
+        else:
+            if error is not None:
+                raise error(str(last_exc)) from last_exc
+    construct = partial(cls, **{**kwargs, "download": False, "force_download": False})
+    return await loop.run_in_executor(executor, construct)
@@ -0,0 +1,50 @@
+"""Offline load-path benchmarks for the dataset loaders.
+
+Synthetic corpora in every supported format are generated deterministically,
+served from a local ``http.server`` and pushed through the real download
+helper and loaders. Each corpus is measured in four phases (download, parse,
+iterate, stats) for wall time, throughput and peak memory; reports are JSON
+and can be checked against a stored baseline.
+
+Example
+-------
+>>> report = run_benchmarks(scale=0.1)
+>>> compare_to_baseline(report, load_report(Path("bench_baseline.json")), threshold=0.25)
+[]
+
+or from a shell::
+
+    python -m ua_datasets.benchmarks --scale 0.1 --output bench.json --baseline bench_baseline.json
+"""
+
+from ua_datasets.benchmarks.runner import (
+    CORPORA,
+    BenchmarkResult,
+    compare_to_baseline,
+    load_report,
+    main,
+    run_benchmarks,
+    write_report,
+)
+from ua_datasets.benchmarks.server import serve_directory
+from ua_datasets.benchmarks.synthetic import (
+    write_conllu,
+    write_news_csv,
+    write_squad_flat,
+    write_squad_nested,
+)
+
+__all__ = [
+    "CORPORA",
+    "BenchmarkResult",
+    "compare_to_baseline",
+    "load_report",
+    "main",
+    "run_benchmarks",
+    "serve_directory",
+    "write_conllu",
+    "write_news_csv",
+    "write_report",
+    "write_squad_flat",
+    "write_squad_nested",
+]
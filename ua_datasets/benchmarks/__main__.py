@@ -0,0 +1,3 @@
+from ua_datasets.benchmarks.runner import main
+
+raise SystemExit(main())
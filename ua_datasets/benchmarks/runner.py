@@ -0,0 +1,359 @@
+"""Benchmark runner: download, parse, iteration and statistics phases per corpus."""
+
+from __future__ import annotations
+
+import argparse
+import contextlib
+import json
+import math
+import platform
+import sys
+import tempfile
+import time
+import tracemalloc
+from dataclasses import asdict, dataclass
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+from ua_datasets import MovaInstitutePOSDataset, NewsClassificationDataset, UaSquadDataset
+from ua_datasets.benchmarks.server import serve_directory
+from ua_datasets.benchmarks.synthetic import (
+    write_conllu,
+    write_news_csv,
+    write_squad_flat,
+    write_squad_nested,
+)
+from ua_datasets.utils import atomic_write_text, download_text_with_retries, urlopen
+
+__all__ = [
+    "CORPORA",
+    "BenchmarkResult",
+    "compare_to_baseline",
+    "load_report",
+    "main",
+    "run_benchmarks",
+    "write_report",
+]
+
+
+@dataclass(slots=True, frozen=True)
+class _Corpus:
+    file_name: str
+    size: int  # records at scale 1.0
+    write: Callable[[Path, int, int], Path]
+    load: Callable[[Path], Any]
+    stats: Callable[[Any], object]
+
+
+CORPORA: Dict[str, _Corpus] = {
+    "squad_flat": _Corpus(
+        "train.json",
+        20_000,
+        write_squad_flat,
+        lambda root: UaSquadDataset(root=root, split="train", download=False),
+        lambda ds: (ds.answer_frequencies(), ds.unique_answers),
+    ),
+    "squad_nested": _Corpus(
+        "val.json",
+        20_000,
+        write_squad_nested,
+        lambda root: UaSquadDataset(root=root, split="val", download=False),
+        lambda ds: (ds.answer_frequencies(), ds.unique_answers),
+    ),
+    "news": _Corpus(
+        "train.csv",
+        50_000,
+        write_news_csv,
+        lambda root: NewsClassificationDataset(root=root, download=False),
+        lambda ds: (ds.label_frequencies(), ds.label_positions()),
+    ),
+    "pos": _Corpus(
+        "synthetic.conllu",
+        50_000,
+        write_conllu,
+        lambda root: MovaInstitutePOSDataset(
+            root=root, download=False, file_name="synthetic.conllu"
+        ),
+        lambda ds: (ds.label_frequencies(), ds.unique_labels),
+    ),
+}
+
+
+@dataclass(slots=True)
+class BenchmarkResult:
+    """Measurements of one phase of one corpus.
+
+    ``wall_time`` is the best of the repeated runs in seconds. ``peak_traced``
+    is the tracemalloc peak of a separate run (bytes allocated by the phase and
+    alive at the same time); ``peak_rss`` is the process's resident-set
+    high-water mark after the phase (``None`` where unavailable).
+    """
+
+    corpus: str
+    phase: str
+    items: int
+    nbytes: int
+    wall_time: float
+    peak_traced: Optional[int] = None
+    peak_rss: Optional[int] = None
+
+    @property
+    def items_per_s(self) -> float:
+        return self.items / self.wall_time if self.wall_time > 0 else math.inf
+
+    @property
+    def mb_per_s(self) -> Optional[float]:
+        if not self.nbytes:
+            return None
+        return self.nbytes / 1e6 / self.wall_time if self.wall_time > 0 else math.inf
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {**asdict(self), "items_per_s": self.items_per_s, "mb_per_s": self.mb_per_s}
+
+
+def _peak_rss() -> Optional[int]:
+    try:
+        import resource
+    except ImportError:  # Windows
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return int(peak if sys.platform == "darwin" else peak * 1024)  # bytes on macOS, KiB elsewhere
+
+
+def _measure(
+    fn: Callable[[Any], Any],
+    *,
+    setup: Callable[[], Any] = lambda: None,
+    repeat: int,
+    trace_memory: bool,
+) -> Tuple[Any, float, Optional[int]]:
+    """Run ``fn(setup())`` ``repeat`` times; return the last value, best time and traced peak."""
+    best = math.inf
+    value = None
+    for _ in range(max(repeat, 1)):
+        arg = setup()
+        start = time.perf_counter()
+        value = fn(arg)
+        best = min(best, time.perf_counter() - start)
+    peak = None
+    if trace_memory:
+        arg = setup()
+        value = None
+        tracemalloc.start()
+        try:
+            value = fn(arg)
+            peak = tracemalloc.get_traced_memory()[1]
+        finally:
+            tracemalloc.stop()
+    return value, best, peak
+
+
+def _bench_corpus(
+    name: str,
+    corpus: _Corpus,
+    root: Path,
+    url: str,
+    *,
+    repeat: int,
+    trace_memory: bool,
+    opener: Callable[..., Any],
+) -> List[BenchmarkResult]:
+    nbytes = (root / corpus.file_name).stat().st_size
+    results: List[BenchmarkResult] = []
+
+    def record(phase: str, items: int, size: int, wall: float, peak: Optional[int]) -> None:
+        results.append(BenchmarkResult(name, phase, items, size, wall, peak, _peak_rss()))
+
+    def download(_: None) -> str:
+        return download_text_with_retries(url, opener=opener, max_retries=1, show_progress=False)
+
+    _, wall, peak = _measure(download, repeat=repeat, trace_memory=trace_memory)
+    ds, parse_wall, parse_peak = _measure(
+        lambda _: corpus.load(root), repeat=repeat, trace_memory=trace_memory
+    )
+    n = len(ds)
+    record("download", n, nbytes, wall, peak)
+    record("parse", n, nbytes, parse_wall, parse_peak)
+    _, wall, peak = _measure(lambda _: sum(1 for _ in ds), repeat=repeat, trace_memory=trace_memory)
+    record("iterate", n, 0, wall, peak)
+    # Statistics are cached by the loaders, so every run gets a fresh (untimed) load.
+    _, wall, peak = _measure(
+        corpus.stats, setup=lambda: corpus.load(root), repeat=repeat, trace_memory=trace_memory
+    )
+    record("stats", n, 0, wall, peak)
+    return results
+
+
+def run_benchmarks(
+    corpora: Optional[Sequence[str]] = None,
+    *,
+    scale: float = 1.0,
+    seed: int = 0,
+    repeat: int = 3,
+    trace_memory: bool = True,
+    workdir: Optional[Path] = None,
+    opener: Callable[..., Any] = urlopen,
+) -> Dict[str, Any]:
+    """Generate synthetic corpora, serve them locally and benchmark every loader.
+
+    Parameters
+    ----------
+    corpora:
+        Names from :data:`CORPORA` (default: all of them).
+    scale:
+        Multiplier for the default corpus sizes (``1.0`` = tens of thousands of records).
+    seed:
+        Generator seed; identical seeds give byte-identical corpora.
+    repeat:
+        Timed runs per phase; the best wall time is reported.
+    trace_memory:
+        Also run each phase once under ``tracemalloc`` to record its peak.
+    workdir:
+        Where corpora are written (default: a temporary directory removed afterwards).
+    opener:
+        URL opener passed to ``download_text_with_retries`` for the download phase.
+
+    Returns
+    -------
+    dict
+        JSON-serializable report with ``meta`` and ``results`` keys.
+    """
+    names = list(CORPORA) if corpora is None else list(corpora)
+    unknown = [name for name in names if name not in CORPORA]
+    if unknown:
+        raise ValueError(f"Unknown corpora {unknown}. Expected any of: {list(CORPORA)}")
+    results: List[BenchmarkResult] = []
+    with contextlib.ExitStack() as stack:
+        if workdir is None:
+            workdir = Path(stack.enter_context(tempfile.TemporaryDirectory(prefix="ua-bench-")))
+        for name in names:
+            corpus = CORPORA[name]
+            (workdir / name).mkdir(parents=True, exist_ok=True)
+            size = max(1, round(corpus.size * scale))
+            corpus.write(workdir / name / corpus.file_name, size, seed)
+        base_url = stack.enter_context(serve_directory(workdir))
+        for name in names:
+            corpus = CORPORA[name]
+            results.extend(
+                _bench_corpus(
+                    name,
+                    corpus,
+                    workdir / name,
+                    f"{base_url}{name}/{corpus.file_name}",
+                    repeat=repeat,
+                    trace_memory=trace_memory,
+                    opener=opener,
+                )
+            )
+    meta = {
+        "created": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "scale": scale,
+        "seed": seed,
+        "repeat": repeat,
+    }
+    return {"meta": meta, "results": [r.to_dict() for r in results]}
+
+
+def write_report(report: Dict[str, Any], path: Path) -> None:
+    atomic_write_text(Path(path), json.dumps(report, indent=2) + "\n")
+
+
+def load_report(path: Path) -> Dict[str, Any]:
+    with Path(path).open("r", encoding="utf8") as fh:
+        report: Dict[str, Any] = json.load(fh)
+    return report
+
+
+def compare_to_baseline(
+    report: Dict[str, Any],
+    baseline: Dict[str, Any],
+    *,
+    threshold: float = 0.2,
+    metrics: Sequence[str] = ("wall_time", "peak_traced"),
+) -> List[str]:
+    """Return a description of every metric that grew by more than ``threshold``.
+
+    Results are matched by corpus and phase; entries missing on either side are
+    ignored. Raises ``ValueError`` if the reports were recorded at different
+    scales or seeds, since their numbers are not comparable.
+    """
+    for key in ("scale", "seed"):
+        if report["meta"].get(key) != baseline["meta"].get(key):
+            raise ValueError(
+                f"Baseline {key}={baseline['meta'].get(key)!r} differs from {report['meta'].get(key)!r}"
+            )
+    previous = {(r["corpus"], r["phase"]): r for r in baseline["results"]}
+    regressions: List[str] = []
+    for result in report["results"]:
+        old_result = previous.get((result["corpus"], result["phase"]))
+        if old_result is None:
+            continue
+        for metric in metrics:
+            new, old = result.get(metric), old_result.get(metric)
+            if new is None or not old or new <= old * (1 + threshold):
+                continue
+            regressions.append(
+                f"{result['corpus']}/{result['phase']}: {metric} {old:.4g} -> {new:.4g} "
+                f"(+{new / old - 1:.0%})"
+            )
+    return regressions
+
+
+def _format_table(report: Dict[str, Any]) -> str:
+    lines = [f"{'corpus':<14}{'phase':<10}{'items/s':>12}{'MB/s':>9}{'wall s':>10}{'peak MB':>10}"]
+    for r in report["results"]:
+        mb_s = "-" if r["mb_per_s"] is None else f"{r['mb_per_s']:.1f}"
+        peak = "-" if r["peak_traced"] is None else f"{r['peak_traced'] / 1e6:.1f}"
+        lines.append(
+            f"{r['corpus']:<14}{r['phase']:<10}{r['items_per_s']:>12.0f}{mb_s:>9}"
+            f"{r['wall_time']:>10.4f}{peak:>10}"
+        )
+    return "\n".join(lines)
+
+
+def main(
+    argv: Optional[Sequence[str]] = None, prog: str = "python -m ua_datasets.benchmarks"
+) -> int:
+    """Command-line entry point (``python -m ua_datasets.benchmarks``, ``ua-datasets bench``)."""
+    parser = argparse.ArgumentParser(
+        prog=prog,
+        description="Benchmark the dataset loaders on synthetic corpora served from localhost.",
+    )
+    parser.add_argument("--corpora", nargs="+", choices=list(CORPORA), default=None)
+    parser.add_argument("--scale", type=float, default=1.0, help="corpus size multiplier")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--repeat", type=int, default=3, help="timed runs per phase (best kept)")
+    parser.add_argument("--no-memory", action="store_true", help="skip the tracemalloc runs")
+    parser.add_argument("--workdir", type=Path, default=None, help="keep corpora in this directory")
+    parser.add_argument("--output", type=Path, default=None, help="write the JSON report here")
+    parser.add_argument("--baseline", type=Path, default=None, help="JSON report to compare with")
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=0.2,
+        help="relative slowdown/memory growth that counts as a regression (default 0.2)",
+    )
+    args = parser.parse_args(argv)
+    report = run_benchmarks(
+        args.corpora,
+        scale=args.scale,
+        seed=args.seed,
+        repeat=args.repeat,
+        trace_memory=not args.no_memory,
+        workdir=args.workdir,
+    )
+    print(_format_table(report))
+    if args.output is not None:
+        write_report(report, args.output)
+    if args.baseline is not None:
+        regressions = compare_to_baseline(
+            report, load_report(args.baseline), threshold=args.threshold
+        )
+        for line in regressions:
+            print(f"REGRESSION {line}", file=sys.stderr)
+        if regressions:
+            return 1
+    return 0
@@ -0,0 +1,40 @@
+"""Local HTTP stand-in for the dataset hosts used by the download benchmarks."""
+
+from __future__ import annotations
+
+import contextlib
+import threading
+from functools import partial
+from http.server import SimpleHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Any, Iterator
+
+__all__ = ["serve_directory"]
+
+
+class _QuietHandler(SimpleHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"  # keep-alive, like the real hosts
+
+    def log_message(self, format: str, *args: Any) -> None:
+        pass
+
+
+@contextlib.contextmanager
+def serve_directory(directory: Path, host: str = "127.0.0.1") -> Iterator[str]:
+    """Serve ``directory`` over HTTP on a free port for the duration of the block.
+
+    Yields the base URL (ending with ``/``), which can be used as a loader's
+    ``base_url`` or joined with file names for ``download_text_with_retries``.
+    """
+    handler = partial(_QuietHandler, directory=str(directory))
+    server = ThreadingHTTPServer((host, 0), handler)
+    thread = threading.Thread(
+        target=server.serve_forever, name="ua-datasets-bench-http", daemon=True
+    )
+    thread.start()
+    try:
+        yield f"http://{host}:{server.server_address[1]}/"
+    finally:
+        server.shutdown()
+        server.server_close()
+        thread.join()
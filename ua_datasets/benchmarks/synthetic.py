@@ -0,0 +1,166 @@
+"""Deterministic synthetic corpora in the on-disk formats of every loader.
+
+Each ``write_*`` function takes a target path, a record count and a seed and
+always produces byte-identical output for the same arguments, so benchmark
+runs on different machines (or commits) parse exactly the same data. Words are
+pseudo-Ukrainian syllable strings drawn with a Zipf-like frequency profile.
+"""
+
+from __future__ import annotations
+
+import csv
+import io
+import json
+import random
+from itertools import accumulate
+from pathlib import Path
+from typing import Any, Dict, List, Set, Tuple
+
+from ua_datasets.utils import atomic_write_text
+
+__all__ = [
+    "write_conllu",
+    "write_news_csv",
+    "write_squad_flat",
+    "write_squad_nested",
+]
+
+# Cyrillic letters by code point (literals would trip confusable-character linters).
+_VOWELS = [chr(c) for c in (0x430, 0x435, 0x438, 0x456, 0x43E, 0x443, 0x44F, 0x44E, 0x454)]
+_CONSONANTS = [chr(c) for c in range(0x431, 0x449) if chr(c) not in _VOWELS and c != 0x439]
+_UPOS = ("NOUN", "VERB", "ADJ", "ADV", "PRON", "ADP", "CCONJ", "PART", "PUNCT", "PROPN", "NUM")
+_FEATS = (("Case", ("Gen", "Nom")), ("Gender", ("Fem", "Masc")), ("Number", ("Plur", "Sing")))
+_DEPRELS = ("nsubj", "obj", "amod", "advmod", "case", "cc", "punct", "obl", "nmod", "conj")
+
+
+class _Text:
+    """Seeded word/sentence source shared by the generators."""
+
+    def __init__(self, seed: int, vocabulary_size: int = 5000) -> None:
+        self.rng = random.Random(seed)
+        words: Set[str] = set()
+        while len(words) < vocabulary_size:
+            syllables = self.rng.randint(1, 4)
+            words.add(
+                "".join(
+                    self.rng.choice(_CONSONANTS) + self.rng.choice(_VOWELS)
+                    for _ in range(syllables)
+                )
+            )
+        self.words = sorted(words)
+        self.rng.shuffle(self.words)
+        self._cum_weights = list(accumulate(1.0 / rank for rank in range(1, vocabulary_size + 1)))
+
+    def tokens(self, n: int) -> List[str]:
+        return self.rng.choices(self.words, cum_weights=self._cum_weights, k=n)
+
+    def sentence(self, low: int = 4, high: int = 25) -> str:
+        words = self.tokens(self.rng.randint(low, high))
+        return " ".join(words).capitalize() + "."
+
+    def paragraph(self, sentences: int) -> str:
+        return " ".join(self.sentence() for _ in range(sentences))
+
+
+def _question_and_answer(text: _Text, context: str) -> Tuple[str, str]:
+    words = context.rstrip(".").split()
+    start = text.rng.randrange(len(words))
+    answer = " ".join(words[start : start + text.rng.randint(1, 3)]).rstrip(".")
+    return text.sentence(3, 10).rstrip(".") + "?", answer
+
+
+def write_squad_flat(path: Path, n_examples: int, seed: int = 0) -> Path:
+    """Write the flat train-style UA-SQuAD JSON (``question``/``context``/``answer``).
+
+    About 10% of the questions are impossible (no ``answer`` key) and 2% carry an
+    empty answer string, mirroring the quirks the loader handles.
+    """
+    text = _Text(seed)
+    data: List[Dict[str, Any]] = []
+    for _ in range(n_examples):
+        context = text.paragraph(text.rng.randint(2, 6))
+        question, answer = _question_and_answer(text, context)
+        item: Dict[str, Any] = {"question": question, "context": context}
+        roll = text.rng.random()
+        if roll >= 0.12:
+            item["answer"] = answer
+        elif roll >= 0.10:
+            item["answer"] = ""
+        data.append(item)
+    atomic_write_text(path, json.dumps({"data": data}, ensure_ascii=False))
+    return path
+
+
+def write_squad_nested(path: Path, n_examples: int, seed: int = 0) -> Path:
+    """Write SQuAD v2 style nested JSON (articles -> paragraphs -> qas) with ``n_examples`` questions."""
+    text = _Text(seed)
+    articles: List[Dict[str, Any]] = []
+    written = 0
+    while written < n_examples:
+        paragraphs: List[Dict[str, Any]] = []
+        for _ in range(text.rng.randint(1, 5)):
+            context = text.paragraph(text.rng.randint(2, 6))
+            qas: List[Dict[str, Any]] = []
+            for _ in range(min(text.rng.randint(1, 5), n_examples - written)):
+                question, answer = _question_and_answer(text, context)
+                impossible = text.rng.random() < 0.1
+                answers = (
+                    [] if impossible else [{"text": answer, "answer_start": context.find(answer)}]
+                )
+                qas.append(
+                    {
+                        "id": f"q{written:08d}",
+                        "question": question,
+                        "answers": answers,
+                        "is_impossible": impossible,
+                    }
+                )
+                written += 1
+            paragraphs.append({"context": context, "qas": qas})
+            if written >= n_examples:
+                break
+        articles.append({"title": text.sentence(1, 4).rstrip("."), "paragraphs": paragraphs})
+    atomic_write_text(path, json.dumps({"version": "v2.0", "data": articles}, ensure_ascii=False))
+    return path
+
+
+def write_news_csv(path: Path, n_rows: int, seed: int = 0, n_labels: int = 5) -> Path:
+    """Write a news classification CSV (``title,text,tags,target``).
+
+    Every fifth text spans several lines and texts contain commas and doubled
+    quotes, so the quoted-field handling of the parsers is exercised.
+    """
+    text = _Text(seed)
+    labels = text.words[:n_labels]
+    out = io.StringIO()
+    writer = csv.writer(out, lineterminator="\n")
+    writer.writerow(["title", "text", "tags", "target"])
+    for i in range(n_rows):
+        parts = [text.paragraph(text.rng.randint(1, 4)) for _ in range(3 if i % 5 == 0 else 1)]
+        body = "\n".join(parts)
+        if i % 7 == 0:
+            body = f'{body} "{text.sentence(2, 5)}", {text.sentence(2, 5)}'
+        tags = "|".join(text.tokens(text.rng.randint(0, 4)))
+        writer.writerow([text.sentence(3, 10), body, tags, text.rng.choice(labels)])
+    atomic_write_text(path, out.getvalue())
+    return path
+
+
+def write_conllu(path: Path, n_sentences: int, seed: int = 0) -> Path:
+    """Write a CoNLL-U corpus with all ten columns, comments and multiword-free ids."""
+    text = _Text(seed)
+    rng = text.rng
+    out = io.StringIO()
+    for s in range(n_sentences):
+        tokens = text.tokens(rng.randint(3, 30))
+        out.write(f"# sent_id = s{s}\n# text = {' '.join(tokens)}\n")
+        for i, token in enumerate(tokens, start=1):
+            feats = "|".join(f"{k}={rng.choice(v)}" for k, v in _FEATS if rng.random() < 0.5)
+            head = 0 if i == 1 else rng.randint(1, i - 1)
+            out.write(
+                f"{i}\t{token}\t{token.lower()}\t{rng.choice(_UPOS)}\t_\t{feats or '_'}\t"
+                f"{head}\t{rng.choice(_DEPRELS)}\t_\t_\n"
+            )
+        out.write("\n")
+    atomic_write_text(path, out.getvalue())
+    return path
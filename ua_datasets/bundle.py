@@ -0,0 +1,281 @@
+"""Single-file dataset bundles for offline (air-gapped) distribution.
+
+:func:`write_bundle` packs loaded datasets - their raw files plus derived
+indexes such as the ``.sentidx`` sentence index of the POS corpus - into one
+seekable file with a table of contents. :class:`Bundle` opens it with two reads
+(header and table of contents) and loaders read their files straight out of it:
+text is streamed from the member's byte range, memory-mapped access
+(``lazy=True`` POS, parallel and sharded parsing) maps the member in place.
+Nothing is extracted.
+
+Layout
+------
+* 24-byte header: magic ``UABUNDL1``, table-of-contents offset and size
+  (little-endian ``uint64``);
+* member files, each starting at a multiple of 64 KiB so it can be
+  memory-mapped on its own on every platform;
+* the table of contents: UTF-8 JSON with ``members`` (``name -> [offset, size]``)
+  and ``datasets`` (``name -> {"class", "options"}``).
+
+Example
+-------
+>>> write_bundle("corpora.uab", {"news/train": news, "pos": pos})
+>>> bundle = Bundle("corpora.uab")
+>>> news = bundle.load("news/train")
+>>> pos = bundle.load("pos", lazy=True)
+"""
+
+from __future__ import annotations
+
+import io
+import mmap
+import os
+import struct
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, BinaryIO, Dict, List, Mapping, Optional, TextIO, Tuple, Union
+
+from ua_datasets.instrumentation import span
+
+__all__ = ["Bundle", "BundleError", "FileRange", "open_bundle", "write_bundle"]
+
+_MAGIC = b"UABUNDL1"
+_HEADER = struct.Struct("<8sQQ")
+# Member alignment; a multiple of mmap.ALLOCATIONGRANULARITY on all platforms.
+_ALIGN = 1 << 16
+_VERSION = 1
+# Constructor arguments that describe where data comes from rather than how to read it.
+_LOCATION_FIELDS = frozenset({"root", "bundle", "download", "force_download", "extra_files"})
+
+
+class BundleError(RuntimeError):
+    """Raised for unreadable bundles and for datasets that cannot be bundled."""
+
+
+@dataclass(slots=True, frozen=True)
+class FileRange:
+    """The byte range ``[offset, offset + size)`` of ``path``: a whole file or a bundle member.
+
+    Loaders read their files through this type, so the same code serves plain
+    files and bundle members. For members, ``mtime_ns`` is the bundle file's.
+    """
+
+    path: Path
+    offset: int
+    size: int
+    mtime_ns: int = 0
+    whole_file: bool = False
+
+    @classmethod
+    def of(cls, source: Union[str, Path, FileRange]) -> FileRange:
+        """``source`` itself if it is a range, else the whole file at that path."""
+        if isinstance(source, FileRange):
+            return source
+        path = Path(source)
+        stat = path.stat()
+        return cls(path, 0, stat.st_size, stat.st_mtime_ns, whole_file=True)
+
+    def open(self) -> BinaryIO:
+        """Buffered binary reader over the range (positions are relative to it)."""
+        if self.whole_file:
+            return self.path.open("rb")
+        return io.BufferedReader(_RangeReader(self))
+
+    def open_text(self, newline: Optional[str] = None) -> TextIO:
+        """UTF-8 text reader over the range (``newline`` as for :func:`open`)."""
+        if self.whole_file:
+            return self.path.open("r", encoding="utf8", newline=newline)
+        return io.TextIOWrapper(self.open(), encoding="utf8", newline=newline)
+
+    def read(self) -> bytes:
+        with self.open() as fh:
+            return fh.read()
+
+    def map(self) -> Union[mmap.mmap, bytes]:
+        """Memory-map the range read-only (empty ranges, which mmap rejects, map to ``b""``)."""
+        if self.size == 0:
+            return b""
+        with self.path.open("rb") as fh:
+            return mmap.mmap(
+                fh.fileno(),
+                0 if self.whole_file else self.size,
+                offset=self.offset,
+                access=mmap.ACCESS_READ,
+            )
+
+
+class _RangeReader(io.RawIOBase):
+    """Raw reader confined to a :class:`FileRange` of a larger file."""
+
+    def __init__(self, source: FileRange) -> None:
+        super().__init__()
+        self._fh = source.path.open("rb", buffering=0)
+        self._start = source.offset
+        self._end = source.offset + source.size
+        self._fh.seek(self._start)
+
+    def readable(self) -> bool:
+        return True
+
+    def seekable(self) -> bool:
+        return True
+
+    def readinto(self, buffer: Any) -> int:
+        remaining = self._end - self._fh.tell()
+        if remaining <= 0:
+            return 0
+        view = memoryview(buffer).cast("B")
+        return self._fh.readinto(view[: min(len(view), remaining)]) or 0
+
+    def seek(self, offset: int, whence: int = io.SEEK_SET) -> int:
+        base = {io.SEEK_SET: self._start, io.SEEK_CUR: self._fh.tell(), io.SEEK_END: self._end}
+        position = min(max(base[whence] + offset, self._start), self._end)
+        return self._fh.seek(position) - self._start
+
+    def tell(self) -> int:
+        return self._fh.tell() - self._start
+
+    def close(self) -> None:
+        if not self.closed:
+            self._fh.close()
+        super().close()
+
+
+class Bundle:
+    """Read-only view of a bundle file written by :func:`write_bundle`.
+
+    Member names are POSIX paths (``"<dataset>/<file>"``); loaders constructed
+    with ``bundle=`` resolve ``root / file_name`` against them. Pickles as its
+    path, so datasets opened from a bundle can be sent to worker processes.
+    """
+
+    __slots__ = ("datasets", "members", "mtime_ns", "path")
+
+    def __init__(self, path: Union[str, Path]) -> None:
+        import json
+
+        self.path = Path(path)
+        with self.path.open("rb") as fh:
+            self.mtime_ns = os.fstat(fh.fileno()).st_mtime_ns
+            head = fh.read(_HEADER.size)
+            if len(head) != _HEADER.size or head[:8] != _MAGIC:
+                raise BundleError(f"'{self.path}' is not a ua-datasets bundle")
+            _, toc_offset, toc_size = _HEADER.unpack(head)
+            fh.seek(toc_offset)
+            try:
+                toc = json.loads(fh.read(toc_size).decode("utf8"))
+            except ValueError as exc:
+                raise BundleError(f"Corrupt table of contents in '{self.path}'") from exc
+        if toc.get("version") != _VERSION:
+            raise BundleError(f"Unsupported bundle version {toc.get('version')!r}")
+        self.members: Dict[str, Tuple[int, int]] = {
+            name: (offset, size) for name, (offset, size) in toc["members"].items()
+        }
+        self.datasets: Dict[str, Dict[str, Any]] = toc["datasets"]
+
+    def __contains__(self, name: object) -> bool:
+        return isinstance(name, (str, Path)) and Path(name).as_posix() in self.members
+
+    def file(self, name: Union[str, Path]) -> FileRange:
+        """The member ``name`` as a :class:`FileRange` of the bundle file."""
+        key = Path(name).as_posix()
+        try:
+            offset, size = self.members[key]
+        except KeyError:
+            raise FileNotFoundError(f"'{key}' is not in bundle '{self.path}'") from None
+        return FileRange(self.path, offset, size, self.mtime_ns)
+
+    def load(self, name: str, **overrides: Any) -> Any:
+        """Construct the dataset stored as ``name``; ``overrides`` replace stored options."""
+        from importlib import import_module
+
+        try:
+            entry = self.datasets[name]
+        except KeyError:
+            raise KeyError(
+                f"No dataset {name!r} in bundle; available: {sorted(self.datasets)}"
+            ) from None
+        module, _, qualname = entry["class"].partition(":")
+        cls = getattr(import_module(module), qualname)
+        options = {**entry["options"], **overrides}
+        return cls(root=Path(name), bundle=self, download=False, **options)
+
+    def __reduce__(self) -> Tuple[Any, Tuple[Path]]:
+        return Bundle, (self.path,)
+
+    def __repr__(self) -> str:
+        return f"Bundle({str(self.path)!r}, datasets={sorted(self.datasets)})"
+
+
+def open_bundle(bundle: Union[str, Path, Bundle]) -> Bundle:
+    """``bundle`` itself, or the bundle at that path."""
+    return bundle if isinstance(bundle, Bundle) else Bundle(bundle)
+
+
+def _options(dataset: Any) -> Dict[str, Any]:
+    """JSON-representable constructor arguments of ``dataset`` that differ from their defaults."""
+    import dataclasses
+    import json
+
+    options: Dict[str, Any] = {}
+    for f in dataclasses.fields(dataset):
+        if not f.init or f.name in _LOCATION_FIELDS:
+            continue
+        value = getattr(dataset, f.name)
+        if f.default is not dataclasses.MISSING and value == f.default:
+            continue
+        try:
+            json.dumps(value)
+        except TypeError:
+            continue  # predicates, vocabulary objects, reporters: pass them again on load
+        options[f.name] = value
+    return options
+
+
+def write_bundle(path: Union[str, Path], datasets: Mapping[str, Any]) -> Path:
+    """Pack ``datasets`` (name -> loaded dataset) into the bundle file ``path``.
+
+    Each dataset contributes its source files and indexes under ``"<name>/"``
+    together with the options it was loaded with (those that are plain data;
+    predicates and vocabulary objects must be passed again to
+    :meth:`Bundle.load`). The file is written next to ``path`` and renamed into
+    place, so readers never see a partial bundle.
+    """
+    import json
+    import shutil
+
+    path = Path(path)
+    members: Dict[str, List[int]] = {}
+    entries: Dict[str, Dict[str, Any]] = {}
+    tmp = path.with_name(path.name + ".tmp")
+    try:
+        with span("write", path=str(path)) as phase, tmp.open("wb") as out:
+            out.write(bytes(_HEADER.size))
+            for name, dataset in datasets.items():
+                if not name or name.startswith("/") or ".." in Path(name).parts:
+                    raise BundleError(f"Invalid dataset name {name!r}")
+                cls = type(dataset)
+                options, files = dataset._bundle_entry()
+                entries[name] = {
+                    "class": f"{cls.__module__}:{cls.__qualname__}",
+                    "options": {**_options(dataset), **options},
+                }
+                for relative, source in files.items():
+                    out.write(bytes(-out.tell() % _ALIGN))
+                    offset = out.tell()
+                    with source.open() as fh:
+                        shutil.copyfileobj(fh, out, 1 << 20)
+                    members[f"{name}/{relative}"] = [offset, out.tell() - offset]
+            toc = json.dumps({"version": _VERSION, "members": members, "datasets": entries})
+            toc_bytes = toc.encode("utf8")
+            toc_offset = out.tell()
+            out.write(toc_bytes)
+            out.seek(0)
+            out.write(_HEADER.pack(_MAGIC, toc_offset, len(toc_bytes)))
+            if phase.enabled:
+                phase.set(bytes=toc_offset + len(toc_bytes), members=len(members))
+    except BaseException:
+        tmp.unlink(missing_ok=True)
+        raise
+    tmp.replace(path)
+    return path
@@ -0,0 +1,379 @@
+"""The ``ua-datasets`` command line (also ``python -m ua_datasets``).
+
+Subcommands
+-----------
+``prefetch``
+    Download datasets concurrently and check that they load.
+``build-cache``
+    Write the POS ``.sentidx`` sentence index, the only on-disk cache the
+    loaders keep (so it defaults to ``pos``). With ``--bundle FILE`` the
+    selected datasets, news and squad included, are packed into one
+    :mod:`bundle <ua_datasets.bundle>`.
+``convert``
+    Export records to JSON Lines or Parquet files (optionally split every
+    ``--records-per-file`` records) or tokenize them into ``.bin``/``.idx``
+    token shards (:mod:`ua_datasets.shards`).
+``bench``
+    Run the loader benchmarks; arguments go to ``python -m ua_datasets.benchmarks``.
+
+Datasets are named ``squad``, ``news`` and ``pos``, optionally with a split
+(``squad:val``, ``news:test``); without names every dataset and split is used.
+Each is stored under ``<root>/<directory>`` (``ua_squad``, ``ua_news``,
+``mova_pos``), as in the examples of the README.
+
+Example
+-------
+.. code-block:: bash
+
+    ua-datasets prefetch --root /scratch/data --workers 4
+    ua-datasets build-cache --root /scratch/data --bundle /shared/corpora.uab
+    ua-datasets convert news pos --format jsonl --output /scratch/jsonl
+"""
+
+from __future__ import annotations
+
+import argparse
+import sys
+from dataclasses import dataclass
+from itertools import islice
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple
+
+__all__ = ["Target", "main", "parse_targets"]
+
+# name -> ("module:class", directory under --root, splits); ``None`` for single-corpus datasets.
+_DATASETS: Dict[str, Tuple[str, str, Tuple[Optional[str], ...]]] = {
+    "squad": ("ua_datasets.question_answering:UaSquadDataset", "ua_squad", ("train", "val")),
+    "news": (
+        "ua_datasets.text_classification:NewsClassificationDataset",
+        "ua_news",
+        ("train", "test"),
+    ),
+    "pos": ("ua_datasets.token_classification:MovaInstitutePOSDataset", "mova_pos", (None,)),
+}
+
+
+@dataclass(slots=True, frozen=True)
+class Target:
+    """One dataset split selected on the command line."""
+
+    name: str
+    split: Optional[str] = None
+
+    @property
+    def label(self) -> str:
+        return self.name if self.split is None else f"{self.name}:{self.split}"
+
+    @property
+    def bundle_name(self) -> str:
+        return self.name if self.split is None else f"{self.name}/{self.split}"
+
+    def dataset_class(self) -> Any:
+        from importlib import import_module
+
+        module, _, qualname = _DATASETS[self.name][0].partition(":")
+        return getattr(import_module(module), qualname)
+
+    def options(self, root: Path) -> Dict[str, Any]:
+        """Constructor arguments locating this target under ``root``."""
+        options: Dict[str, Any] = {"root": root / _DATASETS[self.name][1]}
+        if self.split is not None:
+            options["split"] = self.split
+        return options
+
+
+def parse_targets(specs: Iterable[str]) -> List[Target]:
+    """Expand ``name[:split]`` specs (all datasets when empty), dropping duplicates."""
+    targets: List[Target] = []
+    for spec in list(specs) or list(_DATASETS):
+        name, _, split = spec.partition(":")
+        if name not in _DATASETS:
+            raise ValueError(f"Unknown dataset {name!r}; expected one of {list(_DATASETS)}")
+        splits = _DATASETS[name][2]
+        if split and split not in splits:
+            raise ValueError(f"Unknown split {spec!r}; {name} has {[s for s in splits if s]}")
+        for s in [split] if split else splits:
+            if Target(name, s) not in targets:
+                targets.append(Target(name, s))
+    return targets
+
+
+def _report(target: Target, dataset: Any) -> None:
+    print(f"{target.label:<12} {len(dataset):>10} records  {dataset.dataset_path}")
+
+
+def _fail(target: Target, exc: BaseException) -> None:
+    print(f"error: {target.label}: {exc}", file=sys.stderr)
+
+
+def _prefetch(args: argparse.Namespace, targets: List[Target]) -> int:
+    import asyncio
+
+    async def fetch_all() -> List[Any]:
+        limiter = asyncio.Semaphore(args.workers)
+
+        async def fetch(target: Target) -> Any:
+            options = target.options(args.root)
+            if target.name == "pos":
+                options["lazy"] = True  # index instead of parsing
+            try:
+                return await target.dataset_class().aload(
+                    options.pop("root"),
+                    limiter=limiter,
+                    force_download=args.force,
+                    show_progress=not args.quiet,
+                    **options,
+                )
+            except Exception as exc:
+                return exc
+
+        return list(await asyncio.gather(*(fetch(t) for t in targets)))
+
+    status = 0
+    for target, result in zip(targets, asyncio.run(fetch_all()), strict=True):
+        if isinstance(result, Exception):
+            _fail(target, result)
+            status = 1
+        elif len(result) == 0:
+            _fail(target, RuntimeError("no records (download failed?)"))
+            status = 1
+        else:
+            _report(target, result)
+    return status
+
+
+def _load(args: argparse.Namespace, target: Target, **overrides: Any) -> Any:
+    """Construct ``target`` from local files; empty datasets count as failures."""
+    dataset = target.dataset_class()(
+        **target.options(args.root), download=False, show_progress=False, **overrides
+    )
+    if len(dataset) == 0:
+        raise FileNotFoundError(f"no records under {dataset.root} (run prefetch first)")
+    return dataset
+
+
+def _build_cache(args: argparse.Namespace, targets: List[Target]) -> int:
+    uncached = [t.label for t in targets if t.name != "pos"]
+    if uncached and args.bundle is None:
+        print(
+            f"error: {', '.join(uncached)}: no on-disk cache to build (only pos has one); "
+            "pass --bundle FILE to pack them",
+            file=sys.stderr,
+        )
+        return 2
+    loaded: Dict[str, Any] = {}
+    status = 0
+    for target in targets:
+        overrides: Dict[str, Any] = {}
+        if target.name == "pos":
+            overrides["lazy"] = True  # builds and persists the sentence index
+        elif target.name == "news":
+            overrides["parse_workers"] = args.workers
+        try:
+            dataset = _load(args, target, **overrides)
+        except Exception as exc:
+            _fail(target, exc)
+            status = 1
+            continue
+        _report(target, dataset)
+        loaded[target.bundle_name] = dataset
+    if args.bundle is not None and loaded:
+        from ua_datasets.bundle import write_bundle
+
+        path = write_bundle(args.bundle, loaded)
+        print(f"wrote {path} ({path.stat().st_size} bytes, datasets: {', '.join(loaded)})")
+    return status
+
+
+def _records(target: Target, dataset: Any) -> Iterator[Dict[str, Any]]:
+    if target.name == "news":
+        columns = dataset.column_names
+        for row in dataset.data:
+            # Rows may carry more fields than the header; extras have no name and are dropped.
+            yield dict(zip(columns, row, strict=False))
+    elif target.name == "pos":
+        for tokens, tags in dataset:
+            yield {"tokens": tokens, "tags": tags}
+    else:
+        yield from dataset
+
+
+def _import_object(spec: str) -> Callable[..., Any]:
+    from importlib import import_module
+
+    module, _, qualname = spec.partition(":")
+    obj: Any = import_module(module)
+    for attr in qualname.split(".") if qualname else ():
+        obj = getattr(obj, attr)
+    if not callable(obj):
+        raise TypeError(f"{spec!r} is not callable")
+    return obj  # type: ignore[no-any-return]
+
+
+def _write_records(
+    records: Iterator[Dict[str, Any]], prefix: Path, fmt: str, per_file: int
+) -> List[Path]:
+    """Write ``records`` to ``<prefix>_00000.<fmt>``, ... with ``per_file`` records each (0: one file)."""
+    if fmt == "parquet":
+        try:  # local import to avoid a hard dependency
+            from importlib import import_module
+
+            pa = import_module("pyarrow")
+            pq = import_module("pyarrow.parquet")
+        except ImportError as exc:
+            raise RuntimeError(
+                "The 'pyarrow' package is required for --format parquet; install with 'pip install pyarrow'."
+            ) from exc
+    else:
+        import json
+    paths: List[Path] = []
+    while True:
+        chunk = list(islice(records, per_file)) if per_file else list(records)
+        if paths and not chunk:
+            break
+        path = prefix.with_name(f"{prefix.name}_{len(paths):05d}.{fmt}")
+        if fmt == "parquet":
+            pq.write_table(pa.Table.from_pylist(chunk), path)
+        else:
+            with path.open("w", encoding="utf8") as fh:
+                for record in chunk:
+                    fh.write(json.dumps(record, ensure_ascii=False) + "\n")
+        paths.append(path)
+        if not per_file:
+            break
+    return paths
+
+
+def _convert(args: argparse.Namespace, targets: List[Target]) -> int:
+    if args.format == "shards" and args.tokenizer is None:
+        print("error: --format shards requires --tokenizer MODULE:CALLABLE", file=sys.stderr)
+        return 2
+    args.output.mkdir(parents=True, exist_ok=True)
+    status = 0
+    for target in targets:
+        prefix = args.output / target.bundle_name.replace("/", "_")
+        try:
+            dataset = _load(args, target)
+            if args.format == "shards":
+                from ua_datasets.shards import export_token_shards
+
+                paths = export_token_shards(
+                    dataset,
+                    _import_object(args.tokenizer),
+                    prefix,
+                    dtype=args.dtype,
+                    num_workers=args.workers,
+                )
+            else:
+                paths = _write_records(
+                    _records(target, dataset), prefix, args.format, args.records_per_file
+                )
+        except Exception as exc:
+            _fail(target, exc)
+            status = 1
+            continue
+        print(f"{target.label:<12} {len(dataset):>10} records  -> {len(paths)} file(s) {prefix}_*")
+    return status
+
+
+def _positive_int(value: str) -> int:
+    number = int(value)
+    if number < 1:
+        raise argparse.ArgumentTypeError(f"expected a positive integer, got {value}")
+    return number
+
+
+def _parser() -> argparse.ArgumentParser:
+    selection = argparse.ArgumentParser(add_help=False)
+    selection.add_argument(
+        "datasets",
+        nargs="*",
+        metavar="DATASET[:SPLIT]",
+        help=f"datasets to process: {', '.join(_DATASETS)} (default: all datasets and splits)",
+    )
+    selection.add_argument(
+        "--root", type=Path, default=Path("data"), help="data directory (default: ./data)"
+    )
+
+    parser = argparse.ArgumentParser(
+        prog="ua-datasets", description="Stage, cache, convert and benchmark ua-datasets corpora."
+    )
+    commands = parser.add_subparsers(dest="command", required=True, metavar="COMMAND")
+
+    prefetch = commands.add_parser(
+        "prefetch", parents=[selection], help="download datasets concurrently"
+    )
+    prefetch.add_argument(
+        "--workers", type=_positive_int, default=4, help="concurrent downloads (at least 1)"
+    )
+    prefetch.add_argument("--force", action="store_true", help="download even if present")
+    prefetch.add_argument("--quiet", action="store_true", help="no progress display")
+
+    build = commands.add_parser(
+        "build-cache",
+        parents=[selection],
+        help="write the POS sentence index; with --bundle, pack any datasets",
+        description="Write the POS sentence index (the only on-disk cache; default dataset: "
+        "pos). News and squad have no on-disk cache and are only accepted with --bundle, "
+        "which packs the selected datasets into one file.",
+    )
+    build.add_argument("--workers", type=int, default=0, help="parse_workers for the CSV parser")
+    build.add_argument(
+        "--bundle",
+        type=Path,
+        default=None,
+        help="also pack the datasets into this bundle file (POS opens lazily from it)",
+    )
+
+    convert = commands.add_parser(
+        "convert", parents=[selection], help="export to JSON Lines, Parquet or token shards"
+    )
+    convert.add_argument("--format", choices=("jsonl", "parquet", "shards"), default="jsonl")
+    convert.add_argument("--output", type=Path, required=True, help="output directory")
+    convert.add_argument(
+        "--records-per-file", type=int, default=0, help="split jsonl/parquet output (0: one file)"
+    )
+    convert.add_argument(
+        "--tokenizer",
+        default=None,
+        metavar="MODULE:CALLABLE",
+        help="text -> token ids callable (required for --format shards)",
+    )
+    convert.add_argument("--dtype", choices=("B", "H", "I", "Q"), default="I")
+    convert.add_argument("--workers", type=int, default=0, help="tokenization processes")
+
+    commands.add_parser(
+        "bench",
+        add_help=False,
+        help="run the loader benchmarks (see 'ua-datasets bench --help')",
+    )
+    return parser
+
+
+_COMMANDS: Dict[str, Callable[[argparse.Namespace, List[Target]], int]] = {
+    "prefetch": _prefetch,
+    "build-cache": _build_cache,
+    "convert": _convert,
+}
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    """Command-line entry point (``ua-datasets`` / ``python -m ua_datasets``)."""
+    parser = _parser()
+    args, rest = parser.parse_known_args(argv)
+    if args.command == "bench":
+        from ua_datasets.benchmarks.runner import main as bench
+
+        return bench(rest, prog="ua-datasets bench")
+    if rest:
+        parser.error(f"unrecognized arguments: {' '.join(rest)}")
+    if getattr(args, "workers", 0) < 0 or getattr(args, "records_per_file", 0) < 0:
+        parser.error("--workers and --records-per-file must not be negative")
+    specs = args.datasets
+    if args.command == "build-cache" and not specs and args.bundle is None:
+        specs = ["pos"]
+    try:
+        targets = parse_targets(specs)
+    except ValueError as exc:
+        parser.error(str(exc))
+    return _COMMANDS[args.command](args, targets)
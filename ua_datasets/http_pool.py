@@ -0,0 +1,235 @@
+"""Keep-alive HTTP(S) connection pool used as the default download opener.
+
+``urllib.request.urlopen`` opens (and TLS-handshakes) a new connection for
+every request. :class:`HTTPConnectionPool` keeps a few idle
+``http.client`` connections per ``(scheme, host, port)`` and hands them out
+again, so retries, fallback file names, further splits and redirect targets
+(e.g. Hugging Face ``resolve`` URLs redirecting to their CDN) reuse an open
+connection. :func:`ua_datasets.utils.urlopen` routes through the process-wide
+:func:`default_pool`.
+
+Responses behave like ``urlopen``'s: ``read([size])``, ``headers``, ``status``,
+``url`` and use as a context manager. A connection returns to the pool when its
+response is closed after being read to the end; otherwise it is discarded.
+HTTP errors raise ``urllib.error.HTTPError`` and connection failures
+``urllib.error.URLError``, exactly like ``urlopen``.
+"""
+
+from __future__ import annotations
+
+import http.client
+import threading
+from types import TracebackType
+from typing import Any, Dict, List, Optional, Tuple, Type
+from urllib.error import HTTPError, URLError
+from urllib.parse import urljoin, urlsplit
+
+__all__ = ["HTTPConnectionPool", "PooledResponse", "default_pool"]
+
+_REDIRECTS = frozenset({301, 302, 303, 307, 308})
+# A kept-alive connection may have been closed by the server since its last use.
+_STALE = (http.client.RemoteDisconnected, ConnectionResetError, BrokenPipeError)
+
+HostKey = Tuple[str, str, int]
+
+
+class PooledResponse:
+    """``urlopen``-style response whose connection goes back to the pool on close."""
+
+    __slots__ = ("_conn", "_key", "_pool", "_response", "url")
+
+    def __init__(
+        self,
+        pool: HTTPConnectionPool,
+        key: HostKey,
+        conn: Optional[http.client.HTTPConnection],
+        response: http.client.HTTPResponse,
+        url: str,
+    ) -> None:
+        self._pool = pool
+        self._key = key
+        self._conn = conn
+        self._response = response
+        self.url = url
+
+    @property
+    def status(self) -> int:
+        return self._response.status
+
+    @property
+    def headers(self) -> http.client.HTTPMessage:
+        return self._response.headers
+
+    def geturl(self) -> str:
+        return self.url
+
+    def read(self, amt: Optional[int] = None) -> bytes:
+        return self._response.read(amt)
+
+    def close(self) -> None:
+        conn, self._conn = self._conn, None
+        if conn is not None:
+            self._pool._finish(self._key, conn, self._response)
+
+    def __enter__(self) -> PooledResponse:
+        return self
+
+    def __exit__(
+        self,
+        exc_type: Optional[Type[BaseException]],
+        exc: Optional[BaseException],
+        tb: Optional[TracebackType],
+    ) -> None:
+        self.close()
+
+
+class HTTPConnectionPool:
+    """Thread-safe pool of idle keep-alive connections, keyed by scheme, host and port.
+
+    Parameters
+    ----------
+    max_idle_per_host:
+        Idle connections kept per host; further released connections are closed.
+    max_redirects:
+        Redirects followed per request before ``URLError`` is raised.
+
+    Attributes
+    ----------
+    connections_opened, requests:
+        Counters of new connections and of requests sent (redirects included).
+    """
+
+    def __init__(self, *, max_idle_per_host: int = 4, max_redirects: int = 5) -> None:
+        self.max_idle_per_host = max_idle_per_host
+        self.max_redirects = max_redirects
+        self.connections_opened = 0
+        self.requests = 0
+        self._idle: Dict[HostKey, List[http.client.HTTPConnection]] = {}
+        self._lock = threading.Lock()
+        self._ssl_context: Any = None
+
+    def urlopen(self, url: str, timeout: float = 15) -> PooledResponse:
+        """GET ``url`` (following redirects) over a pooled connection."""
+        for _ in range(self.max_redirects + 1):
+            parts = urlsplit(url)
+            if parts.scheme not in ("http", "https") or not parts.hostname:
+                raise URLError(f"unsupported URL {url!r}")
+            key = (
+                parts.scheme,
+                parts.hostname,
+                parts.port or (443 if parts.scheme == "https" else 80),
+            )
+            target = (parts.path or "/") + (f"?{parts.query}" if parts.query else "")
+            host = parts.netloc.rpartition("@")[2]
+            conn, response = self._send(key, host, target, timeout)
+            if response.status in _REDIRECTS and response.getheader("Location"):
+                response.read()  # drain so the connection can be reused
+                self._finish(key, conn, response)
+                url = urljoin(url, response.getheader("Location", ""))
+                continue
+            if response.status >= 400:
+                response.read()
+                self._finish(key, conn, response)
+                raise HTTPError(url, response.status, response.reason, response.headers, None)
+            return PooledResponse(self, key, conn, response, url)
+        raise URLError(f"too many redirects (> {self.max_redirects}) for {url!r}")
+
+    def close(self) -> None:
+        """Close all idle connections."""
+        with self._lock:
+            idle, self._idle = self._idle, {}
+        for conns in idle.values():
+            for conn in conns:
+                conn.close()
+
+    def __enter__(self) -> HTTPConnectionPool:
+        return self
+
+    def __exit__(
+        self,
+        exc_type: Optional[Type[BaseException]],
+        exc: Optional[BaseException],
+        tb: Optional[TracebackType],
+    ) -> None:
+        self.close()
+
+    def _send(
+        self, key: HostKey, host: str, target: str, timeout: float
+    ) -> Tuple[http.client.HTTPConnection, http.client.HTTPResponse]:
+        headers = {"Host": host, "User-Agent": "ua-datasets", "Accept-Encoding": "identity"}
+        conn = self._acquire(key)
+        reused = conn is not None
+        while True:
+            if conn is None:
+                conn = self._connect(key, timeout)
+            else:
+                conn.timeout = timeout
+                if conn.sock is not None:
+                    conn.sock.settimeout(timeout)
+            try:
+                with self._lock:
+                    self.requests += 1
+                conn.request("GET", target, headers=headers)
+                return conn, conn.getresponse()
+            except _STALE as exc:
+                conn.close()
+                if not reused:
+                    raise URLError(exc) from exc
+                conn, reused = None, False  # retry once on a fresh connection
+            except (OSError, http.client.HTTPException) as exc:
+                conn.close()
+                if isinstance(exc, TimeoutError):
+                    raise
+                raise URLError(exc) from exc
+
+    def _connect(self, key: HostKey, timeout: float) -> http.client.HTTPConnection:
+        scheme, hostname, port = key
+        conn: http.client.HTTPConnection
+        if scheme == "https":
+            if self._ssl_context is None:
+                import ssl
+
+                self._ssl_context = ssl.create_default_context()
+            conn = http.client.HTTPSConnection(
+                hostname, port, timeout=timeout, context=self._ssl_context
+            )
+        else:
+            conn = http.client.HTTPConnection(hostname, port, timeout=timeout)
+        with self._lock:
+            self.connections_opened += 1
+        return conn
+
+    def _acquire(self, key: HostKey) -> Optional[http.client.HTTPConnection]:
+        with self._lock:
+            idle = self._idle.get(key)
+            return idle.pop() if idle else None
+
+    def _release(self, key: HostKey, conn: http.client.HTTPConnection) -> None:
+        with self._lock:
+            idle = self._idle.setdefault(key, [])
+            if len(idle) < self.max_idle_per_host:
+                idle.append(conn)
+                return
+        conn.close()
+
+    def _finish(
+        self, key: HostKey, conn: http.client.HTTPConnection, response: http.client.HTTPResponse
+    ) -> None:
+        if response.isclosed() and not response.will_close:
+            self._release(key, conn)  # body fully read, server keeps the connection open
+        else:
+            response.close()
+            conn.close()
+
+
+_default: Optional[HTTPConnectionPool] = None
+_default_lock = threading.Lock()
+
+
+def default_pool() -> HTTPConnectionPool:
+    """The process-wide pool behind :func:`ua_datasets.utils.urlopen`."""
+    global _default
+    with _default_lock:
+        if _default is None:
+            _default = HTTPConnectionPool()
+        return _default
@@ -0,0 +1,190 @@
+"""Download progress reporting.
+
+The download helpers report each transfer to a :class:`ProgressReporter`:
+``start(url, total)`` once the response headers are in, ``advance(url, n)`` per
+received chunk and ``finish(url)`` when the attempt ends (successfully or not).
+The base class ignores everything; :class:`ConsoleProgress` renders one
+throttled status line with throughput and ETA, aggregated over all transfers
+that are active at the same time (threads or asyncio tasks).
+
+``show_progress=True`` on the loaders means :func:`default_reporter`: a shared
+:class:`ConsoleProgress` when stdout is a terminal, and silence otherwise (so
+batch-job logs stay clean). Pass a reporter instance to route progress
+elsewhere, e.g. into a logger or a notebook widget.
+"""
+
+from __future__ import annotations
+
+import sys
+import threading
+import time
+from typing import Any, Dict, List, Optional, TextIO, Union
+
+__all__ = ["ConsoleProgress", "ProgressReporter", "default_reporter", "resolve_reporter"]
+
+
+class ProgressReporter:
+    """No-op reporter and base class for custom implementations.
+
+    Methods may be called from several threads (or interleaved asyncio tasks);
+    ``url`` identifies the transfer. ``total`` is the expected size in bytes,
+    or ``None`` if the server did not announce it.
+    """
+
+    __slots__ = ()
+
+    def start(self, url: str, total: Optional[int]) -> None:
+        pass
+
+    def advance(self, url: str, nbytes: int) -> None:
+        pass
+
+    def finish(self, url: str) -> None:
+        pass
+
+
+def _format_bytes(n: float) -> str:
+    for unit in ("B", "KB", "MB", "GB"):
+        if n < 1000 or unit == "GB":
+            return f"{n:.0f} {unit}" if unit == "B" else f"{n:.1f} {unit}"
+        n /= 1000
+    raise AssertionError("unreachable")
+
+
+def _format_eta(seconds: float) -> str:
+    minutes, seconds = divmod(int(seconds + 0.5), 60)
+    hours, minutes = divmod(minutes, 60)
+    return f"{hours}:{minutes:02d}:{seconds:02d}" if hours else f"{minutes}:{seconds:02d}"
+
+
+class ConsoleProgress(ProgressReporter):
+    """Single-line ``\\r`` progress display, redrawn at most every ``interval`` seconds.
+
+    While several transfers are active the line shows their combined bytes,
+    rate and ETA (the bar and ETA need every size to be known). The line is
+    terminated with a newline once no transfer is left.
+
+    Parameters
+    ----------
+    stream:
+        Where to write (default: ``sys.stdout`` at the time of writing).
+    interval:
+        Minimum seconds between redraws; start and end are always drawn.
+    width:
+        Width of the ``#``/``-`` bar in characters.
+    """
+
+    __slots__ = (
+        "_active",
+        "_done",
+        "_last_draw",
+        "_lock",
+        "_started",
+        "interval",
+        "stream",
+        "width",
+    )
+
+    def __init__(
+        self, stream: Optional[TextIO] = None, *, interval: float = 0.1, width: int = 30
+    ) -> None:
+        self.stream = stream
+        self.interval = interval
+        self.width = width
+        self._lock = threading.Lock()
+        self._active: Dict[str, List[Any]] = {}  # url -> [received, total]
+        self._done = 0  # bytes of transfers finished while others were still running
+        self._started = 0.0
+        self._last_draw = 0.0
+
+    def start(self, url: str, total: Optional[int]) -> None:
+        with self._lock:
+            now = time.perf_counter()
+            if not self._active:
+                self._started = now
+                self._done = 0
+            self._active[url] = [0, total]
+            self._draw(now)
+
+    def advance(self, url: str, nbytes: int) -> None:
+        with self._lock:
+            transfer = self._active.get(url)
+            if transfer is None:
+                return
+            transfer[0] += nbytes
+            now = time.perf_counter()
+            if now - self._last_draw >= self.interval:
+                self._draw(now)
+
+    def finish(self, url: str) -> None:
+        with self._lock:
+            transfer = self._active.get(url)
+            if transfer is None:
+                return
+            self._draw(time.perf_counter())
+            del self._active[url]
+            self._done += transfer[0]
+            if not self._active:
+                self._write("\n")
+
+    def status(self, now: Optional[float] = None) -> str:
+        """The current status line (without the leading ``\\r``)."""
+        now = time.perf_counter() if now is None else now
+        received = self._done + sum(t[0] for t in self._active.values())
+        totals = [t[1] for t in self._active.values()]
+        elapsed = now - self._started
+        rate = received / elapsed if elapsed > 0 else 0.0
+        if len(self._active) == 1:
+            label = next(iter(self._active)).rsplit("/", 1)[-1]
+        else:
+            label = f"{len(self._active)} files"
+        parts = [f"Downloading {label}"]
+        remaining: Optional[int] = None
+        if totals and all(totals):
+            total = self._done + sum(totals)
+            remaining = max(total - received, 0)
+            filled = min(self.width, self.width * received // total)
+            parts.append(f"[{'#' * filled}{'-' * (self.width - filled)}]")
+            parts.append(f"{min(received / total, 1.0):6.1%}")
+            parts.append(f"{_format_bytes(received)}/{_format_bytes(total)}")
+        else:
+            parts.append(_format_bytes(received))
+        if rate > 0:
+            parts.append(f"{_format_bytes(rate)}/s")
+            if remaining:
+                parts.append(f"ETA {_format_eta(remaining / rate)}")
+        return " ".join(parts)
+
+    def _draw(self, now: float) -> None:
+        self._last_draw = now
+        self._write(f"\r{self.status(now)}")
+
+    def _write(self, text: str) -> None:
+        stream = self.stream if self.stream is not None else sys.stdout
+        stream.write(text)
+        stream.flush()
+
+
+_QUIET = ProgressReporter()
+_console: Optional[ConsoleProgress] = None
+
+
+def default_reporter() -> ProgressReporter:
+    """Shared :class:`ConsoleProgress` if stdout is a terminal, otherwise a no-op reporter."""
+    global _console
+    isatty = getattr(sys.stdout, "isatty", None)
+    if isatty is None or not isatty():
+        return _QUIET
+    if _console is None:
+        _console = ConsoleProgress()
+    return _console
+
+
+def resolve_reporter(show_progress: Union[bool, ProgressReporter]) -> Optional[ProgressReporter]:
+    """Map a loader's ``show_progress`` value to a reporter (``None`` when disabled)."""
+    if isinstance(show_progress, ProgressReporter):
+        return show_progress
+    if not show_progress:
+        return None
+    reporter = default_reporter()
+    return None if reporter is _QUIET else reporter
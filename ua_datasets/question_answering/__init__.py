@@ -1,3 +1,14 @@
-from ua_datasets.question_answering.uasquad_question_answering import UaSquadDataset
+from ua_datasets import _lazy_module
+
+TYPE_CHECKING = False  # avoids importing ``typing``; type checkers treat the name as True
+if TYPE_CHECKING:
+    from ua_datasets.question_answering.uasquad_question_answering import UaSquadDataset
 
 __all__ = ["UaSquadDataset"]
+
+__getattr__, __dir__ = _lazy_module(
+    __name__,
+    {
+        "UaSquadDataset": "ua_datasets.question_answering.uasquad_question_answering",
+    },
+)
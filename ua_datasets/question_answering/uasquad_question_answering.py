@@ -3,10 +3,38 @@ from __future__ import annotations
 import json
 from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Any, Dict, Iterator, List, Optional, Set
-from urllib.request import urlopen
-
-from ua_datasets.utils import DownloadFailure, atomic_write_text, download_text_with_retries
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    Dict,
+    Iterator,
+    List,
+    Optional,
+    Sequence,
+    Set,
+    SupportsIndex,
+    Tuple,
+    Union,
+    overload,
+)
+
+from ua_datasets.bundle import Bundle, BundleError, FileRange, open_bundle
+from ua_datasets.instrumentation import memory_usage, span
+from ua_datasets.sharding import shard_indices, shard_view
+from ua_datasets.utils import (
+    DownloadFailure,
+    atomic_write_text,
+    download_text_with_retries,
+    urlopen,
+)
+from ua_datasets.views import DatasetView, IndexKey, as_position, resolve_indices
+
+if TYPE_CHECKING:
+    import asyncio
+
+    from ua_datasets.progress import ProgressReporter
+    from ua_datasets.shuffle import ShuffledIterable
 
 __all__ = [
     "DownloadError",
@@ -19,6 +47,12 @@ __all__ = [
 # We intentionally keep this a plain dict-compatible shape instead of introducing
 # pydantic/dataclasses for each row to avoid overhead and preserve zero heavy deps.
 HFStyleExample = Dict[str, Any]
+# Predicate deciding whether a parsed example is kept (see ``UaSquadDataset.where``).
+ExamplePredicate = Callable[[HFStyleExample], bool]
+
+
+def _looks_like_json(text: str) -> bool:
+    return text.lstrip().startswith(("{", "["))
 
 
 class DownloadError(RuntimeError):
@@ -46,6 +80,19 @@ class UaSquadDataset:
         ``{"train": "train.json", "val": "val.json"}``.
     base_url:
         Base URL path ending with a slash from which filenames are resolved.
+    load_shard:
+        Optional ``(num_shards, index)``: keep only this contiguous block of the
+        parsed examples (the JSON file itself is always parsed in full).
+    where:
+        Optional predicate called with each example dict while the file is
+        parsed; examples for which it returns ``False`` are dropped on the spot
+        and never stored, e.g. ``lambda ex: not ex["is_impossible"]``. Applied
+        before ``load_shard``. An empty result is not an error when filtering.
+    bundle:
+        Read the split from this :mod:`bundle <ua_datasets.bundle>` (a
+        :class:`~ua_datasets.bundle.Bundle` or its path) instead of the file
+        system; ``root`` is then the dataset's name inside the bundle and
+        nothing is downloaded. See :meth:`Bundle.load <ua_datasets.bundle.Bundle.load>`.
     """
 
     root: Path
@@ -62,45 +109,63 @@ class UaSquadDataset:
     max_retries: int = 3
     timeout: int = 20  # seconds
     expected_sha256: str | None = None
-    show_progress: bool = True
+    show_progress: Union[bool, ProgressReporter] = True
     # If True (default) skip flat-format training examples whose 'answer' value is an empty string.
     # This avoids polluting the training set with ambiguous empty-answer placeholders while still
     # retaining explicit impossible examples represented by a missing 'answer' key (answer=None).
     ignore_empty_answer: bool = True
+    load_shard: Optional[Tuple[int, int]] = None
+    where: Optional[ExamplePredicate] = None
+    bundle: Union[str, Path, Bundle, None] = None
 
     dataset_path: Optional[Path] = field(init=False, default=None)
     # SQuAD v2 style expanded storage
     _examples: List[HFStyleExample] = field(init=False, default_factory=list)
     _unique_answers_cache: Set[str] = field(init=False, default_factory=set)
+    _shared: Dict[str, Any] = field(init=False, default_factory=dict)
+    _bundle: Optional[Bundle] = field(init=False, default=None)
 
     def __post_init__(self) -> None:
         self.root = Path(self.root)
+        if self.bundle is not None:
+            self._bundle = open_bundle(self.bundle)
         if self.split not in self.file_map:
             raise ValueError(
                 f"Unsupported split '{self.split}'. Expected one of: {list(self.file_map)}"
             )
+        if self.load_shard is not None:
+            shard_indices(0, *self.load_shard)  # validate before any download
         self.dataset_path = self._resolve_or_download_split()
         if self.dataset_path is None:
             # Graceful empty dataset (tests expect len==0 allowed)
             self._examples = []
             return
-        self._examples = self._parse(
-            self.dataset_path,
-            ignore_empty_answer=self.ignore_empty_answer,
-            split=self.split,
-        )
-        if not self._examples:
+        with span("parse", dataset=type(self).__name__, path=str(self.dataset_path)) as phase:
+            source = self._file(self.dataset_path)
+            self._examples = self._parse(
+                source,
+                ignore_empty_answer=self.ignore_empty_answer,
+                split=self.split,
+                where=self.where,
+            )
+            if phase.enabled:
+                phase.set(records=len(self._examples), bytes=source.size)
+        if not self._examples and self.where is None:
             raise ParseError(
                 f"Parsed zero QA examples from '{self.dataset_path}'. File may be malformed."
             )
+        if self.load_shard is not None:
+            block = shard_indices(len(self._examples), *self.load_shard, contiguous=True)
+            self._examples = self._examples[block.start : block.stop]
         # Build unique answer cache ignoring empties and impossible examples.
-        self._unique_answers_cache = {
-            t
-            for ex in self._examples
-            if not ex.get("is_impossible")
-            for t in ex.get("answers", {}).get("text", [])
-            if t
-        }
+        with span("stats", dataset=type(self).__name__, records=len(self._examples)):
+            self._unique_answers_cache = {
+                t
+                for ex in self._examples
+                if not ex.get("is_impossible")
+                for t in ex.get("answers", {}).get("text", [])
+                if t
+            }
 
     @property
     def unique_answers(self) -> Set[str]:
@@ -117,9 +182,46 @@ class UaSquadDataset:
                 freqs[t] = freqs.get(t, 0) + 1
         return freqs
 
+    def memory_usage(self) -> Dict[str, int]:
+        """Approximate bytes held per category and field; see :func:`ua_datasets.instrumentation.memory_usage`."""
+        return memory_usage(self, caches=("_unique_answers_cache",))
+
+    @classmethod
+    async def aload(
+        cls,
+        root: Union[str, Path],
+        *,
+        limiter: Optional[asyncio.Semaphore] = None,
+        executor: Any = None,
+        **kwargs: Any,
+    ) -> UaSquadDataset:
+        """Asynchronous constructor: download with non-blocking I/O, parse in ``executor``.
+
+        Accepts the constructor's arguments. A missing split is fetched with
+        :func:`ua_datasets.aio.adownload_text_with_retries` (``limiter`` bounds
+        concurrent downloads); parsing runs in ``executor`` (default: the
+        loop's thread pool). The returned dataset has ``download=False``.
+        """
+        from ua_datasets.aio import aload_dataset
+
+        def sources(options: Dict[str, Any]) -> List[Tuple[Path, str]]:
+            names = options["file_map"].get(options["split"], [])
+            return [(Path(root) / name, f"{options['base_url']}{name}") for name in names]
+
+        return await aload_dataset(
+            cls,
+            {**kwargs, "root": root},
+            sources,
+            validate=_looks_like_json,
+            limiter=limiter,
+            executor=executor,
+        )
+
     def _resolve_or_download_split(self) -> Path | None:
         """Locate or download split file with retries & optional integrity."""
         candidates = self.file_map[self.split]
+        if self._bundle is not None:
+            return next((self.root / n for n in candidates if self.root / n in self._bundle), None)
         self.root.mkdir(parents=True, exist_ok=True)
 
         # Existing file short-circuit
@@ -139,7 +241,7 @@ class UaSquadDataset:
                     timeout=self.timeout,
                     max_retries=self.max_retries,
                     expected_sha256=self.expected_sha256,
-                    validate=lambda t: t.lstrip().startswith("{") or t.lstrip().startswith("["),
+                    validate=_looks_like_json,
                     opener=urlopen,
                     show_progress=self.show_progress,
                 )
@@ -149,23 +251,43 @@ class UaSquadDataset:
                 continue
         return None
 
+    def _file(self, path: Path) -> FileRange:
+        """``path`` as a byte range of the file system or of :attr:`bundle`."""
+        return FileRange.of(path) if self._bundle is None else self._bundle.file(path)
+
+    def _bundle_entry(self) -> Tuple[Dict[str, Any], Dict[str, FileRange]]:
+        """Options and files that :func:`ua_datasets.bundle.write_bundle` stores for this split."""
+        if self.dataset_path is None:
+            raise BundleError(f"No '{self.split}' split file to bundle")
+        name = self.dataset_path.name
+        return {"file_map": {self.split: [name]}}, {name: self._file(self.dataset_path)}
+
     @staticmethod
     def _parse(
-        path: Path,
+        path: Union[Path, FileRange],
         *,
         ignore_empty_answer: bool = True,
         split: str | None = None,
+        where: Optional[ExamplePredicate] = None,
     ) -> List[HFStyleExample]:
-        """Parse flat (train-like) or nested SQuAD / SQuAD v2 style JSON into HF style examples only."""
-        with path.open("r", encoding="utf8") as f:
+        """Parse flat (train-like) or nested SQuAD / SQuAD v2 style JSON into HF style examples only.
+
+        Examples rejected by ``where`` are discarded as soon as they are built.
+        """
+        source = FileRange.of(path)
+        with source.open_text() as f:
             try:
                 obj = json.load(f)
             except json.JSONDecodeError as exc:
-                raise ParseError(f"Failed to decode JSON file '{path}': {exc}") from exc
+                raise ParseError(f"Failed to decode JSON file '{source.path}': {exc}") from exc
 
         data = obj.get("data", [])
         examples: List[HFStyleExample] = []
 
+        def _keep(example: HFStyleExample) -> None:
+            if where is None or where(example):
+                examples.append(example)
+
         def _gen_id(question: str, context: str) -> str:
             # Lightweight deterministic id (not cryptographic, good enough for local uniqueness)
             import hashlib
@@ -222,7 +344,7 @@ class UaSquadDataset:
                                 texts.append(t)
                                 starts.append(start)
                         is_impossible = bool(qa.get("is_impossible", len(texts) == 0))
-                        examples.append(
+                        _keep(
                             {
                                 "id": qa.get("id") or _gen_id(question, context),
                                 "title": title,
@@ -270,7 +392,7 @@ class UaSquadDataset:
                             texts = [ans_text]
                             starts = [start_pos]
                             is_impossible = False
-                examples.append(
+                _keep(
                     {
                         "id": _gen_id(question, context),
                         "title": None,
@@ -283,8 +405,46 @@ class UaSquadDataset:
 
         return examples
 
-    def __getitem__(self, idx: int) -> HFStyleExample:
-        return self._examples[idx]
+    @overload
+    def __getitem__(self, idx: int) -> HFStyleExample: ...
+
+    @overload
+    def __getitem__(self, idx: IndexKey) -> DatasetView[HFStyleExample]: ...
+
+    def __getitem__(
+        self, idx: Union[int, IndexKey]
+    ) -> Union[HFStyleExample, DatasetView[HFStyleExample]]:
+        pos = as_position(idx)
+        if pos is None:
+            return self.select(idx)  # type: ignore[arg-type]
+        return self._examples[pos]
+
+    def select(self, indices: IndexKey) -> DatasetView[HFStyleExample]:
+        """Return a view over ``indices`` (a slice or integer positions) without copying."""
+        return DatasetView(self, resolve_indices(len(self), indices))
+
+    @overload
+    def prefetch(
+        self, n: int = ..., *, batch_size: None = ..., num_workers: int = ...
+    ) -> Iterator[HFStyleExample]: ...
+
+    @overload
+    def prefetch(
+        self, n: int = ..., *, batch_size: int, num_workers: int = ...
+    ) -> Iterator[List[HFStyleExample]]: ...
+
+    def prefetch(
+        self, n: int = 64, *, batch_size: Optional[int] = None, num_workers: int = 0
+    ) -> Union[Iterator[HFStyleExample], Iterator[List[HFStyleExample]]]:
+        """Iterate with up to ``n`` items (or batches) loaded ahead in the background.
+
+        A producer thread reads ahead of the caller; with ``num_workers > 1``
+        index ranges are fetched by a process pool instead. See
+        :func:`ua_datasets.prefetch.prefetch`.
+        """
+        from ua_datasets.prefetch import prefetch
+
+        return prefetch(self, n, batch_size=batch_size, num_workers=num_workers)
 
     def __len__(self) -> int:
         return len(self._examples)
@@ -293,26 +453,74 @@ class UaSquadDataset:
         for ex in self._examples:
             yield ex
 
+    def shard(
+        self, num_shards: int, index: int, *, contiguous: bool = False
+    ) -> DatasetView[HFStyleExample]:
+        """Return shard ``index`` of ``num_shards`` disjoint, deterministic subsets.
+
+        Round-robin by default; ``contiguous=True`` gives consecutive blocks.
+        """
+        return shard_view(self, num_shards, index, contiguous=contiguous)
+
+    def shuffled(
+        self, *, seed: int = 0, block_size: int = 256, buffer_size: int = 4096
+    ) -> ShuffledIterable[HFStyleExample]:
+        """Near-random, reproducible iteration reading blocks of consecutive items.
+
+        Blocks are visited in a shuffled order and mixed through a bounded
+        buffer; call ``set_epoch`` on the result between epochs. Shards are
+        detected per rank and loader worker, see :mod:`ua_datasets.shuffle`.
+        """
+        from ua_datasets.shuffle import ShuffledIterable
+
+        return ShuffledIterable(self, seed=seed, block_size=block_size, buffer_size=buffer_size)
+
+    def share_memory(self) -> None:
+        """Move the parsed examples into shared memory (see :mod:`ua_datasets.shared`).
+
+        Pickled copies then reattach to the same memory instead of carrying the
+        examples; every item access decodes a fresh dict.
+        """
+        if self._shared:
+            return
+        from ua_datasets.shared import SharedJsonTable
+
+        self._shared["_examples"] = SharedJsonTable.from_records(self._examples)
+        self._examples = self._shared["_examples"]
+
+    def __reduce_ex__(self, protocol: SupportsIndex) -> Any:
+        if self._shared or self.where is not None:
+            from ua_datasets.shared import _reduce_dataset
+
+            # Examples are already filtered; predicates are often unpicklable lambdas.
+            return _reduce_dataset(self, {**self._shared, "where": None})
+        return object.__reduce_ex__(self, protocol)
+
     def __repr__(self) -> str:
         return f"{self.__class__.__name__}(split={self.split!r}, examples={len(self._examples)}, unique_answers={len(self._unique_answers_cache)})"
 
     def _check_exists(self) -> bool:
-        return bool(self.dataset_path and self.dataset_path.exists())
+        if self.dataset_path is None:
+            return False
+        if self._bundle is not None:
+            return self.dataset_path in self._bundle
+        return self.dataset_path.exists()
 
     # ---- SQuAD v2 style accessors -------------------------------------------------
     @property
-    def examples(self) -> List[HFStyleExample]:
-        """Full list of SQuAD v2 style examples.
+    def examples(self) -> Sequence[HFStyleExample]:
+        """All SQuAD v2 style examples (the dataset's own storage, not a copy).
 
         Each example dict has keys: id, title, context, question, answers, is_impossible.
         Answers is a dict {'text': List[str], 'answer_start': List[int]} as expected by
         Hugging Face's squad_v2 format. No heavy HF dependency is required here.
+        Treat the result as read-only; use :meth:`to_hf_dict` for a mutable list.
         """
-        return list(self._examples)
+        return self._examples
 
     def to_hf_dict(self) -> List[Dict[str, Any]]:  # lightweight alias
-        """Alias returning examples (intended for quick serialization)."""
-        return self.examples
+        """Return a new list of the examples (intended for quick serialization)."""
+        return list(self._examples)
 
     def to_hf_dataset(self) -> Any:  # pragma: no cover - optional convenience
         """Return a Hugging Face Dataset (requires 'datasets' installed).
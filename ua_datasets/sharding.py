@@ -0,0 +1,154 @@
+"""Deterministic dataset sharding for distributed training and loader workers.
+
+Every dataset class has ``shard(num_shards, index, contiguous=...)`` returning a
+:class:`~ua_datasets.views.DatasetView` over a disjoint subset, and a
+``load_shard=(num_shards, index)`` constructor argument that parses only a
+contiguous part of the source file. :class:`ShardedIterable` picks its shard at
+iteration time from the process rank and the DataLoader worker.
+
+Example
+-------
+>>> ds = MovaInstitutePOSDataset(root=Path("./data"), lazy=True)
+>>> loader = DataLoader(ShardedIterable(ds).as_torch(), num_workers=4)
+"""
+
+from __future__ import annotations
+
+import importlib
+import os
+import sys
+from typing import Any, Generic, Iterator, Optional, Tuple
+
+from ua_datasets.views import DatasetView, Indexable, T_co
+
+__all__ = [
+    "ShardedIterable",
+    "detect_shard",
+    "shard_indices",
+]
+
+
+def shard_indices(n: int, num_shards: int, index: int, *, contiguous: bool = False) -> range:
+    """Positions of shard ``index`` out of ``num_shards`` over ``n`` items.
+
+    Contiguous shards are consecutive blocks whose sizes differ by at most one;
+    otherwise items are dealt round-robin (``index, index + num_shards, ...``).
+    """
+    if num_shards < 1:
+        raise ValueError("num_shards must be positive")
+    if not 0 <= index < num_shards:
+        raise ValueError(f"index must be in [0, {num_shards}), got {index}")
+    if contiguous:
+        return range(n * index // num_shards, n * (index + 1) // num_shards)
+    return range(index, n, num_shards)
+
+
+def shard_view(
+    dataset: Indexable[T_co], num_shards: int, index: int, *, contiguous: bool = False
+) -> DatasetView[T_co]:
+    """Return a :class:`DatasetView` over one shard of ``dataset`` (backs ``Dataset.shard``)."""
+    return DatasetView(
+        dataset, shard_indices(len(dataset), num_shards, index, contiguous=contiguous)
+    )
+
+
+def detect_shard() -> Tuple[int, int]:
+    """Return ``(num_shards, index)`` for the calling process and loader worker.
+
+    The rank comes from an initialized ``torch.distributed`` process group, else
+    from the ``RANK``/``WORLD_SIZE`` environment variables (default ``0``/``1``).
+    Within a PyTorch DataLoader worker, each worker gets its own shard of the
+    rank's share. PyTorch is consulted only if it has already been imported.
+    """
+    rank, world_size = int(os.environ.get("RANK", 0)), int(os.environ.get("WORLD_SIZE", 1))
+    worker_id, num_workers = 0, 1
+    if "torch" in sys.modules:
+        dist = sys.modules["torch"].distributed
+        if dist.is_available() and dist.is_initialized():
+            rank, world_size = dist.get_rank(), dist.get_world_size()
+        info = sys.modules["torch"].utils.data.get_worker_info()
+        if info is not None:
+            worker_id, num_workers = info.id, info.num_workers
+    return world_size * num_workers, rank * num_workers + worker_id
+
+
+class ShardedIterable(Generic[T_co]):
+    """Iterate over the current process's shard of ``dataset``.
+
+    The shard is resolved with :func:`detect_shard` each time iteration starts,
+    so one object can be handed to every rank and loader worker.
+
+    Parameters
+    ----------
+    dataset:
+        Any dataset (or view) supporting ``len()`` and integer indexing.
+    contiguous:
+        Use consecutive blocks instead of round-robin assignment.
+    num_shards, index:
+        Fixed shard to use instead of detecting it.
+    """
+
+    def __init__(
+        self,
+        dataset: Indexable[T_co],
+        *,
+        contiguous: bool = False,
+        num_shards: Optional[int] = None,
+        index: Optional[int] = None,
+    ) -> None:
+        if (num_shards is None) != (index is None):
+            raise ValueError("num_shards and index must be given together")
+        self.dataset = dataset
+        self.contiguous = contiguous
+        self.num_shards = num_shards
+        self.index = index
+
+    def current_shard(self) -> Tuple[int, int]:
+        if self.num_shards is not None and self.index is not None:
+            return self.num_shards, self.index
+        return detect_shard()
+
+    def __iter__(self) -> Iterator[T_co]:
+        num_shards, index = self.current_shard()
+        dataset = self.dataset
+        for i in shard_indices(len(dataset), num_shards, index, contiguous=self.contiguous):
+            yield dataset[i]
+
+    def as_torch(self) -> Any:  # pragma: no cover - optional convenience
+        """Wrap as a ``torch.utils.data.IterableDataset`` (requires 'torch')."""
+        return _torch_iterable_class()(self)
+
+
+def _torch_iterable_class() -> Any:  # pragma: no cover - optional convenience
+    """Create (once) the IterableDataset subclass used by :meth:`ShardedIterable.as_torch`.
+
+    It is published as a module attribute, and resolved on demand through the
+    module ``__getattr__``, so spawn-based DataLoader workers can unpickle it.
+    """
+    cls = globals().get("_TorchShardedIterable")
+    if cls is not None:
+        return cls
+    try:  # local import to avoid hard dependency
+        data = importlib.import_module("torch.utils.data")
+    except Exception as exc:
+        raise RuntimeError(
+            "The 'torch' package is required for as_torch(); install with 'pip install torch'."
+        ) from exc
+
+    class _TorchShardedIterable(data.IterableDataset):  # type: ignore[name-defined]
+        def __init__(self, source: ShardedIterable[Any]) -> None:
+            super().__init__()
+            self.source = source
+
+        def __iter__(self) -> Iterator[Any]:
+            return iter(self.source)
+
+    _TorchShardedIterable.__qualname__ = "_TorchShardedIterable"
+    globals()["_TorchShardedIterable"] = _TorchShardedIterable
+    return _TorchShardedIterable
+
+
+def __getattr__(name: str) -> Any:
+    if name == "_TorchShardedIterable":
+        return _torch_iterable_class()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
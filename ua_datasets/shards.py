@@ -0,0 +1,348 @@
+"""Token-id shards (``.bin``/``.idx`` pairs) for streaming language-model training.
+
+A shard stores every document's token ids back to back in one fixed-dtype
+``.bin`` buffer; the ``.idx`` file holds the token offset of every document.
+:class:`TokenShardReader` memory-maps shards and serves documents and
+fixed-length training sequences as ``memoryview`` slices, without copying.
+
+Example
+-------
+>>> paths = export_token_shards(news, tokenizer.encode, "shards/news", num_workers=4)
+>>> reader = TokenShardReader(paths)
+>>> for seq in reader.iter_sequences(2048):
+...     train_step(seq)
+"""
+
+from __future__ import annotations
+
+import mmap
+import sys
+from array import array
+from bisect import bisect_right
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor
+from itertools import pairwise
+from pathlib import Path
+from typing import (
+    Any,
+    BinaryIO,
+    Callable,
+    Deque,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+    Union,
+)
+
+__all__ = [
+    "TokenShardReader",
+    "TokenShardWriter",
+    "export_token_shards",
+    "iter_documents",
+]
+
+Tokenizer = Callable[[str], Sequence[int]]
+
+# .idx layout: magic, 8-byte header [typecode, byte order, padding], then
+# ``array('Q')`` [n_docs] and n_docs + 1 token offsets into the .bin buffer.
+_IDX_MAGIC = b"UATOKIDX"
+_DTYPES = ("B", "H", "I", "Q")
+
+
+def iter_documents(dataset: Any, field: str = "text") -> Iterator[str]:
+    """Yield one text per document of a news or POS dataset.
+
+    News rows contribute their ``field`` column; POS sentences are joined with
+    single spaces (``field`` is ignored).
+    """
+    from ua_datasets.text_classification.news_classification import NewsClassificationDataset
+    from ua_datasets.token_classification.part_of_speech import MovaInstitutePOSDataset
+
+    if isinstance(dataset, NewsClassificationDataset):
+        if field not in dataset.column_names:
+            raise ValueError(f"Unknown field {field!r}; expected one of {dataset.column_names}")
+        col = dataset.column_names.index(field)
+        for row in dataset.data:
+            yield row[col]
+    elif isinstance(dataset, MovaInstitutePOSDataset):
+        for tokens in dataset.data:
+            yield " ".join(tokens)
+    else:
+        raise TypeError(f"Unsupported dataset type: {type(dataset).__name__}")
+
+
+def _tokenize_batch(
+    tokenizer: Tokenizer, texts: List[str], typecode: str, eos_id: Optional[int]
+) -> Tuple[array, array]:
+    """Tokenize ``texts`` into one flat id buffer plus per-document lengths (pool worker)."""
+    ids = array(typecode)
+    lengths = array("Q")
+    for text in texts:
+        before = len(ids)
+        ids.extend(tokenizer(text))
+        if eos_id is not None:
+            ids.append(eos_id)
+        lengths.append(len(ids) - before)
+    return ids, lengths
+
+
+class TokenShardWriter:
+    """Append documents to numbered ``<prefix>_NNNNN.bin``/``.idx`` shard pairs.
+
+    Parameters
+    ----------
+    prefix:
+        Output path prefix; parent directories are created.
+    dtype:
+        ``array`` typecode of the token buffer (``"B"``, ``"H"``, ``"I"`` or ``"Q"``).
+    max_shard_tokens:
+        Start a new shard once the current one holds at least this many tokens
+        (documents are never split). ``None`` writes a single shard.
+    """
+
+    def __init__(
+        self,
+        prefix: Union[str, Path],
+        *,
+        dtype: str = "I",
+        max_shard_tokens: Optional[int] = None,
+    ) -> None:
+        if dtype not in _DTYPES:
+            raise ValueError(f"Unsupported dtype {dtype!r}; expected one of {list(_DTYPES)}")
+        if max_shard_tokens is not None and max_shard_tokens < 1:
+            raise ValueError("max_shard_tokens must be positive")
+        self.prefix = Path(prefix)
+        self.dtype = dtype
+        self.max_shard_tokens = max_shard_tokens
+        self.paths: List[Path] = []
+        self._bin: Optional[BinaryIO] = None
+        self._offsets = array("Q", [0])
+        self.prefix.parent.mkdir(parents=True, exist_ok=True)
+
+    def add_document(self, ids: array) -> None:
+        """Append one document given as an ``array`` of this writer's dtype."""
+        self.add_batch(ids, array("Q", [len(ids)]))
+
+    def add_batch(self, ids: array, lengths: array) -> None:
+        """Append consecutive documents stored flat in ``ids`` with their ``lengths``."""
+        if ids.typecode != self.dtype:
+            ids = array(self.dtype, ids)
+        pos = 0
+        for n in lengths:
+            if self._bin is None:
+                self._open_shard()
+            assert self._bin is not None
+            self._bin.write(memoryview(ids)[pos : pos + n].cast("B"))
+            pos += n
+            self._offsets.append(self._offsets[-1] + n)
+            if self.max_shard_tokens is not None and self._offsets[-1] >= self.max_shard_tokens:
+                self._finish_shard()
+
+    def close(self) -> List[Path]:
+        """Flush the open shard and return the ``.bin`` paths written so far."""
+        if self._bin is not None:
+            self._finish_shard()
+        return self.paths
+
+    def __enter__(self) -> TokenShardWriter:
+        return self
+
+    def __exit__(self, *exc: object) -> None:
+        self.close()
+
+    def _open_shard(self) -> None:
+        path = self.prefix.with_name(f"{self.prefix.name}_{len(self.paths):05d}.bin")
+        self.paths.append(path)
+        self._bin = path.open("wb")
+        self._offsets = array("Q", [0])
+
+    def _finish_shard(self) -> None:
+        assert self._bin is not None
+        self._bin.close()
+        self._bin = None
+        idx_path = self.paths[-1].with_suffix(".idx")
+        tmp = idx_path.with_name(idx_path.name + ".tmp")
+        with tmp.open("wb") as fh:
+            fh.write(_IDX_MAGIC)
+            fh.write(f"{self.dtype}{'<' if sys.byteorder == 'little' else '>'}".encode().ljust(8))
+            array("Q", [len(self._offsets) - 1]).tofile(fh)
+            self._offsets.tofile(fh)
+        # The .idx appears last, so a shard with an index is always complete.
+        tmp.replace(idx_path)
+
+
+def export_token_shards(
+    dataset: Any,
+    tokenizer: Tokenizer,
+    prefix: Union[str, Path],
+    *,
+    field: str = "text",
+    dtype: str = "I",
+    eos_id: Optional[int] = None,
+    batch_size: int = 1024,
+    num_workers: int = 0,
+    max_shard_tokens: Optional[int] = None,
+) -> List[Path]:
+    """Tokenize a news or POS dataset into ``.bin``/``.idx`` shards.
+
+    Parameters
+    ----------
+    dataset:
+        :class:`NewsClassificationDataset` or :class:`MovaInstitutePOSDataset`
+        (see :func:`iter_documents`).
+    tokenizer:
+        Callable mapping a text to token ids. With ``num_workers > 1`` it must be
+        picklable (a module-level function or a picklable object's method).
+    prefix:
+        Output path prefix; shards are named ``<prefix>_00000.bin`` etc.
+    field:
+        News column to export.
+    dtype:
+        Token buffer typecode; ``"H"`` halves the size for vocabularies up to 65536.
+    eos_id:
+        Optional id appended to every document.
+    batch_size:
+        Documents per tokenization task.
+    num_workers:
+        If greater than 1, batches are tokenized in a process pool with at most
+        ``2 * num_workers`` batches in flight. Output order matches the dataset.
+    max_shard_tokens:
+        See :class:`TokenShardWriter`.
+
+    Returns
+    -------
+    list of Path
+        The ``.bin`` files written, in order.
+    """
+    if batch_size < 1:
+        raise ValueError("batch_size must be positive")
+    writer = TokenShardWriter(prefix, dtype=dtype, max_shard_tokens=max_shard_tokens)
+    batches = _batched(iter_documents(dataset, field), batch_size)
+    with writer:
+        if num_workers > 1:
+            with ProcessPoolExecutor(max_workers=num_workers) as pool:
+                pending: Deque[Future[Tuple[array, array]]] = deque()
+                for texts in batches:
+                    pending.append(pool.submit(_tokenize_batch, tokenizer, texts, dtype, eos_id))
+                    if len(pending) >= 2 * num_workers:
+                        writer.add_batch(*pending.popleft().result())
+                while pending:
+                    writer.add_batch(*pending.popleft().result())
+        else:
+            for texts in batches:
+                writer.add_batch(*_tokenize_batch(tokenizer, texts, dtype, eos_id))
+    return writer.paths
+
+
+def _batched(items: Iterable[str], size: int) -> Iterator[List[str]]:
+    batch: List[str] = []
+    for item in items:
+        batch.append(item)
+        if len(batch) == size:
+            yield batch
+            batch = []
+    if batch:
+        yield batch
+
+
+class TokenShardReader:
+    """Memory-mapped, read-only access to one or more token shards.
+
+    Parameters
+    ----------
+    paths:
+        ``.bin`` shard paths (the matching ``.idx`` files must exist), in order.
+        Documents of all shards are numbered consecutively.
+    """
+
+    def __init__(self, paths: Sequence[Union[str, Path]]) -> None:
+        self._maps: List[mmap.mmap] = []
+        self._tokens: List[memoryview] = []
+        self._offsets: List[array] = []
+        self._doc_starts = array("Q", [0])
+        self.dtype: Optional[str] = None
+        for path in map(Path, paths):
+            typecode, offsets = self._read_index(path.with_suffix(".idx"))
+            if self.dtype not in (None, typecode):
+                raise ValueError(f"Shard '{path}' has dtype {typecode!r}, expected {self.dtype!r}")
+            self.dtype = typecode
+            with path.open("rb") as fh:
+                size = path.stat().st_size
+                buf = mmap.mmap(fh.fileno(), 0, access=mmap.ACCESS_READ) if size else None
+            if size != offsets[-1] * array(typecode).itemsize:
+                raise ValueError(f"Shard '{path}' does not match its index")
+            if buf is not None:
+                self._maps.append(buf)
+            view = memoryview(buf if buf is not None else b"")
+            self._tokens.append(view.cast(typecode))  # type: ignore[call-overload]
+            self._offsets.append(offsets)
+            self._doc_starts.append(self._doc_starts[-1] + len(offsets) - 1)
+
+    @staticmethod
+    def _read_index(path: Path) -> Tuple[str, array]:
+        with path.open("rb") as fh:
+            if fh.read(len(_IDX_MAGIC)) != _IDX_MAGIC:
+                raise ValueError(f"'{path}' is not a token shard index")
+            header = fh.read(8).decode("ascii")
+            typecode, order = header[0], header[1]
+            if typecode not in _DTYPES or order != ("<" if sys.byteorder == "little" else ">"):
+                raise ValueError(f"Unsupported shard dtype or byte order in '{path}'")
+            n_docs = array("Q")
+            n_docs.fromfile(fh, 1)
+            offsets = array("Q")
+            offsets.fromfile(fh, n_docs[0] + 1)
+        return typecode, offsets
+
+    def __len__(self) -> int:
+        return self._doc_starts[-1]
+
+    @property
+    def num_tokens(self) -> int:
+        return sum(len(t) for t in self._tokens)
+
+    def __getitem__(self, idx: int) -> memoryview:
+        """Token ids of document ``idx`` as a zero-copy ``memoryview``."""
+        if idx < 0:
+            idx += len(self)
+        if not 0 <= idx < len(self):
+            raise IndexError("document index out of range")
+        shard = bisect_right(self._doc_starts, idx) - 1
+        local = idx - self._doc_starts[shard]
+        offsets = self._offsets[shard]
+        return self._tokens[shard][offsets[local] : offsets[local + 1]]
+
+    def __iter__(self) -> Iterator[memoryview]:
+        for tokens, offsets in zip(self._tokens, self._offsets, strict=True):
+            for start, end in pairwise(offsets):
+                yield tokens[start:end]
+
+    def iter_sequences(self, seq_len: int, *, stride: Optional[int] = None) -> Iterator[memoryview]:
+        """Yield fixed-length windows over each shard's concatenated token stream.
+
+        Windows may span document boundaries (pair with ``eos_id`` at export) but
+        not shard boundaries; a shard's tail shorter than ``seq_len`` is dropped.
+        ``stride`` defaults to ``seq_len`` (non-overlapping windows).
+        """
+        if seq_len < 1 or (stride is not None and stride < 1):
+            raise ValueError("seq_len and stride must be positive")
+        step = seq_len if stride is None else stride
+        for tokens in self._tokens:
+            for start in range(0, len(tokens) - seq_len + 1, step):
+                yield tokens[start : start + seq_len]
+
+    def close(self) -> None:
+        """Release the memory maps (slices handed out must be released first)."""
+        for view in self._tokens:
+            view.release()
+        for buf in self._maps:
+            buf.close()
+        self._tokens, self._maps = [], []
+
+    def __enter__(self) -> TokenShardReader:
+        return self
+
+    def __exit__(self, *exc: object) -> None:
+        self.close()
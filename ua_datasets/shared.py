@@ -0,0 +1,296 @@
+"""Shared-memory storage for parsed datasets.
+
+After ``dataset.share_memory()`` the bulk of a dataset lives in
+:mod:`multiprocessing.shared_memory` blocks instead of Python lists. Pickling
+such a dataset (e.g. into spawn-based DataLoader workers) sends only the block
+names; workers reattach to the same memory instead of receiving a copy, and
+fork-based workers no longer trigger copy-on-write through reference counts.
+
+The process that called ``share_memory()`` owns the blocks and unlinks them
+when its dataset is garbage collected, so it must outlive the workers.
+
+Example
+-------
+>>> ds = NewsClassificationDataset(root=Path("./data"))
+>>> ds.share_memory()
+>>> loader = DataLoader(ds, num_workers=16, multiprocessing_context="spawn")
+"""
+
+from __future__ import annotations
+
+import contextlib
+import json
+import sys
+import threading
+import weakref
+from array import array
+from itertools import accumulate
+from multiprocessing import resource_tracker
+from multiprocessing.shared_memory import SharedMemory
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Sequence,
+    Tuple,
+    Union,
+    overload,
+)
+
+__all__ = [
+    "SharedArray",
+    "SharedJsonTable",
+    "SharedStringGroups",
+    "SharedStringTable",
+]
+
+
+# Serializes the temporary wrapping of ``resource_tracker.register`` in :func:`_attach`
+# so that overlapping attaches restore the original function.
+_TRACKER_LOCK = threading.Lock()
+
+
+def _attach(name: str) -> SharedMemory:
+    """Open an existing block without letting this process's tracker unlink it."""
+    if sys.version_info >= (3, 13):
+        return SharedMemory(name=name, track=False)
+    # Before 3.13 attaching registers the block with the resource tracker, which
+    # would unlink it when a worker exits while the owner still uses it.
+    # Unregistering afterwards is not enough: workers share the owner's tracker,
+    # so that would drop the owner's registration too. Instead the register call
+    # made by this thread is skipped; other threads register as usual. Code that
+    # replaces ``resource_tracker.register`` itself while an attach is running
+    # may still have its replacement undone.
+    attaching = threading.get_ident()
+    with _TRACKER_LOCK:
+        register = resource_tracker.register
+
+        def register_others(name: Any, rtype: str) -> None:
+            if threading.get_ident() != attaching:
+                register(name, rtype)
+
+        resource_tracker.register = register_others
+        try:
+            return SharedMemory(name=name)
+        finally:
+            resource_tracker.register = register
+
+
+def _release(shm: SharedMemory, view: memoryview, unlink: bool) -> None:
+    view.release()
+    # Slices handed out may still be alive; the OS frees the mapping on exit.
+    with contextlib.suppress(BufferError):
+        shm.close()
+    if unlink:
+        shm.unlink()
+
+
+class SharedArray:
+    """A typed ``array`` copied into a shared memory block.
+
+    :attr:`view` is a ``memoryview`` with the array's typecode and supports
+    indexing, slicing (zero-copy) and iteration like the original array.
+    """
+
+    __slots__ = ("__weakref__", "_finalizer", "_shm", "typecode", "view")
+
+    def __init__(self, shm: SharedMemory, typecode: str, length: int, *, owner: bool) -> None:
+        self._shm = shm
+        self.typecode = typecode
+        itemsize = array(typecode).itemsize
+        buf = shm.buf
+        assert buf is not None
+        # Blocks may be rounded up to the page size; cut to the exact length.
+        self.view = buf[: length * itemsize].cast(typecode)  # type: ignore[call-overload]
+        self._finalizer = weakref.finalize(self, _release, shm, self.view, owner)
+
+    @classmethod
+    def from_array(cls, values: array) -> SharedArray:
+        data = memoryview(values).cast("B")
+        shm = SharedMemory(create=True, size=max(len(data), 1))
+        buf = shm.buf
+        assert buf is not None
+        buf[: len(data)] = data
+        return cls(shm, values.typecode, len(values), owner=True)
+
+    def __len__(self) -> int:
+        return len(self.view)
+
+    def __reduce__(self) -> Tuple[Callable[..., SharedArray], Tuple[str, str, int]]:
+        return _attach_array, (self._shm.name, self.typecode, len(self.view))
+
+    def close(self) -> None:
+        """Detach now (and unlink, if this process created the block)."""
+        self._finalizer()
+
+
+def _attach_array(name: str, typecode: str, length: int) -> SharedArray:
+    return SharedArray(_attach(name), typecode, length, owner=False)
+
+
+class SharedStringTable(Sequence[str]):
+    """Read-only sequence of strings packed as UTF-8 bytes plus offsets in shared memory."""
+
+    __slots__ = ("_blob", "_offsets")
+
+    def __init__(self, offsets: SharedArray, blob: SharedArray) -> None:
+        self._offsets = offsets
+        self._blob = blob
+
+    @classmethod
+    def from_strings(cls, strings: Iterable[str]) -> SharedStringTable:
+        encoded = [s.encode("utf8") for s in strings]
+        offsets = array("Q", [0])
+        offsets.extend(accumulate(map(len, encoded)))
+        blob = array("B", b"".join(encoded))
+        return cls(SharedArray.from_array(offsets), SharedArray.from_array(blob))
+
+    def __len__(self) -> int:
+        return len(self._offsets) - 1
+
+    @overload
+    def __getitem__(self, idx: int) -> str: ...
+
+    @overload
+    def __getitem__(self, idx: slice) -> List[str]: ...
+
+    def __getitem__(self, idx: Union[int, slice]) -> Union[str, List[str]]:
+        if isinstance(idx, slice):
+            return [self[i] for i in range(*idx.indices(len(self)))]
+        n = len(self)
+        if idx < 0:
+            idx += n
+        if not 0 <= idx < n:
+            raise IndexError("string table index out of range")
+        offsets = self._offsets.view
+        return str(self._blob.view[offsets[idx] : offsets[idx + 1]], "utf8")
+
+    def __iter__(self) -> Iterator[str]:
+        offsets, blob = self._offsets.view, self._blob.view
+        for i in range(len(self)):
+            yield str(blob[offsets[i] : offsets[i + 1]], "utf8")
+
+    def __reduce__(self) -> Tuple[Any, Tuple[SharedArray, SharedArray]]:
+        return self.__class__, (self._offsets, self._blob)
+
+    def close(self) -> None:
+        self._offsets.close()
+        self._blob.close()
+
+
+class SharedStringGroups(Sequence[List[str]]):
+    """Read-only sequence of string lists (sentences, CSV rows) in shared memory.
+
+    Item ``i`` is a new ``list`` holding strings ``bounds[i]:bounds[i + 1]`` of
+    the underlying :class:`SharedStringTable`.
+    """
+
+    __slots__ = ("_bounds", "_strings")
+
+    def __init__(self, strings: SharedStringTable, bounds: SharedArray) -> None:
+        self._strings = strings
+        self._bounds = bounds
+
+    @classmethod
+    def from_groups(cls, groups: Iterable[Sequence[str]]) -> SharedStringGroups:
+        flat: List[str] = []
+        bounds = array("Q", [0])
+        for group in groups:
+            flat.extend(group)
+            bounds.append(len(flat))
+        return cls(SharedStringTable.from_strings(flat), SharedArray.from_array(bounds))
+
+    def __len__(self) -> int:
+        return len(self._bounds) - 1
+
+    @overload
+    def __getitem__(self, idx: int) -> List[str]: ...
+
+    @overload
+    def __getitem__(self, idx: slice) -> List[List[str]]: ...
+
+    def __getitem__(self, idx: Union[int, slice]) -> Union[List[str], List[List[str]]]:
+        if isinstance(idx, slice):
+            return [self[i] for i in range(*idx.indices(len(self)))]
+        n = len(self)
+        if idx < 0:
+            idx += n
+        if not 0 <= idx < n:
+            raise IndexError("group index out of range")
+        bounds = self._bounds.view
+        return self._strings[bounds[idx] : bounds[idx + 1]]
+
+    def __reduce__(self) -> Tuple[Any, Tuple[SharedStringTable, SharedArray]]:
+        return self.__class__, (self._strings, self._bounds)
+
+    def close(self) -> None:
+        self._strings.close()
+        self._bounds.close()
+
+
+class SharedJsonTable(Sequence[Any]):
+    """Read-only sequence of JSON-compatible records; item access decodes a fresh copy."""
+
+    __slots__ = ("_strings",)
+
+    def __init__(self, strings: SharedStringTable) -> None:
+        self._strings = strings
+
+    @classmethod
+    def from_records(cls, records: Iterable[Any]) -> SharedJsonTable:
+        dumps = json.JSONEncoder(ensure_ascii=False, separators=(",", ":")).encode
+        return cls(SharedStringTable.from_strings(map(dumps, records)))
+
+    def __len__(self) -> int:
+        return len(self._strings)
+
+    @overload
+    def __getitem__(self, idx: int) -> Any: ...
+
+    @overload
+    def __getitem__(self, idx: slice) -> List[Any]: ...
+
+    def __getitem__(self, idx: Union[int, slice]) -> Any:
+        if isinstance(idx, slice):
+            return [json.loads(s) for s in self._strings[idx]]
+        return json.loads(self._strings[idx])
+
+    def __iter__(self) -> Iterator[Any]:
+        return map(json.loads, self._strings)
+
+    def __reduce__(self) -> Tuple[Any, Tuple[SharedStringTable]]:
+        return self.__class__, (self._strings,)
+
+    def close(self) -> None:
+        self._strings.close()
+
+
+def _slot_names(cls: type) -> List[str]:
+    return [name for klass in cls.__mro__ for name in getattr(klass, "__slots__", ())]
+
+
+def _reduce_dataset(obj: Any, overrides: Dict[str, Any]) -> Tuple[Any, Tuple[type, Dict[str, Any]]]:
+    """``__reduce__`` helper for slotted datasets holding shared buffers.
+
+    Every slot is pickled as is, except the names in ``overrides`` (e.g. a
+    :class:`SharedArray` standing in for the ``memoryview`` stored on ``obj``).
+    """
+    state = {
+        name: overrides.get(name, getattr(obj, name))
+        for name in _slot_names(type(obj))
+        if name != "__weakref__" and hasattr(obj, name)
+    }
+    return _restore_dataset, (type(obj), state)
+
+
+def _restore_dataset(cls: type, state: Dict[str, Any]) -> Any:
+    obj: Any = object.__new__(cls)
+    for name, value in state.items():
+        object.__setattr__(obj, name, value.view if isinstance(value, SharedArray) else value)
+    reattach = getattr(obj, "_reattach", None)
+    if reattach is not None:
+        reattach()
+    return obj
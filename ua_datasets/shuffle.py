@@ -0,0 +1,137 @@
+"""Deterministic block + shuffle-buffer streaming for large corpora.
+
+A full random permutation touches the underlying file (e.g. a memory-mapped
+``lazy=True`` CoNLL-U corpus) in random order. :class:`ShuffledIterable`
+instead shuffles the order of *blocks* of ``block_size`` consecutive items,
+reads each block front to back and passes the items through a bounded shuffle
+buffer of ``buffer_size`` items. Reads stay sequential within a block, memory
+is bounded by the buffer, and items up to about ``buffer_size`` positions
+(plus a block) apart are mixed.
+
+The block order is drawn once per epoch from ``(seed, epoch)`` and blocks are
+dealt round-robin to shards (ranks and DataLoader workers, see
+:func:`~ua_datasets.sharding.detect_shard`), so shards are disjoint and cover
+the dataset; each shard's buffer uses its own stream derived from ``(seed,
+epoch, num_shards, index)``. The order is therefore reproducible per epoch,
+per worker and per rank.
+
+Example
+-------
+>>> stream = ShuffledIterable(pos, seed=13, block_size=256, buffer_size=8192)
+>>> for epoch in range(3):
+...     stream.set_epoch(epoch)
+...     for tokens, tags in stream:
+...         train_step(tokens, tags)
+"""
+
+from __future__ import annotations
+
+import random
+from typing import Any, Generic, Iterator, List, Optional, Tuple, TypeVar
+
+from ua_datasets.sharding import detect_shard
+from ua_datasets.views import Indexable, T_co
+
+__all__ = ["ShuffledIterable", "buffer_shuffle"]
+
+T = TypeVar("T")
+
+
+def buffer_shuffle(items: Iterator[T], buffer_size: int, rng: random.Random) -> Iterator[T]:
+    """Yield ``items`` in an order shuffled through a buffer of ``buffer_size`` items.
+
+    Once the buffer is full, every incoming item replaces a uniformly chosen
+    buffered one, which is yielded; the remainder is shuffled at the end.
+    """
+    buffer: List[T] = []
+    for item in items:
+        if len(buffer) < buffer_size:
+            buffer.append(item)
+            continue
+        j = int(rng.random() * buffer_size)
+        buffer[j], item = item, buffer[j]
+        yield item
+    rng.shuffle(buffer)
+    yield from buffer
+
+
+class ShuffledIterable(Generic[T_co]):
+    """Seedable near-random iteration over ``dataset`` with mostly sequential reads.
+
+    Parameters
+    ----------
+    dataset:
+        Any dataset (or view) supporting ``len()`` and integer indexing.
+    seed:
+        Base seed; see the module docstring for how streams are derived.
+    block_size:
+        Consecutive items read together. Larger blocks mean more sequential
+        I/O and a less uniform order; shards differ in size by up to one block.
+    buffer_size:
+        Items held in the shuffle buffer (``1`` disables it).
+    num_shards, index:
+        Fixed shard to use instead of detecting it at iteration time.
+    """
+
+    def __init__(
+        self,
+        dataset: Indexable[T_co],
+        *,
+        seed: int = 0,
+        block_size: int = 256,
+        buffer_size: int = 4096,
+        num_shards: Optional[int] = None,
+        index: Optional[int] = None,
+    ) -> None:
+        if block_size < 1 or buffer_size < 1:
+            raise ValueError("block_size and buffer_size must be positive")
+        if (num_shards is None) != (index is None):
+            raise ValueError("num_shards and index must be given together")
+        self.dataset = dataset
+        self.seed = seed
+        self.block_size = block_size
+        self.buffer_size = buffer_size
+        self.num_shards = num_shards
+        self.index = index
+        self.epoch = 0
+
+    def set_epoch(self, epoch: int) -> None:
+        """Select the block order and buffer streams for ``epoch``."""
+        self.epoch = epoch
+
+    def current_shard(self) -> Tuple[int, int]:
+        if self.num_shards is not None and self.index is not None:
+            return self.num_shards, self.index
+        return detect_shard()
+
+    def blocks(self, num_shards: int = 1, index: int = 0) -> List[range]:
+        """Index ranges shard ``index`` reads this epoch, in reading order."""
+        n, size = len(self.dataset), self.block_size
+        order = list(range((n + size - 1) // size))
+        random.Random(f"{self.seed}:{self.epoch}").shuffle(order)
+        return [range(b * size, min(n, (b + 1) * size)) for b in order[index::num_shards]]
+
+    def iter_indices(self, num_shards: int = 1, index: int = 0) -> Iterator[int]:
+        """Yield the positions shard ``index`` visits this epoch (the order of ``__iter__``)."""
+        blocks = self.blocks(num_shards, index)
+        rng = random.Random(f"{self.seed}:{self.epoch}:{num_shards}:{index}")
+        return buffer_shuffle((i for block in blocks for i in block), self.buffer_size, rng)
+
+    def __iter__(self) -> Iterator[T_co]:
+        num_shards, index = self.current_shard()
+        dataset = self.dataset
+        blocks = self.blocks(num_shards, index)
+        rng = random.Random(f"{self.seed}:{self.epoch}:{num_shards}:{index}")
+        # Items (not indices) are buffered so that the dataset is read block by block.
+        items = (dataset[i] for block in blocks for i in block)
+        return buffer_shuffle(items, self.buffer_size, rng)
+
+    def as_torch(self) -> Any:  # pragma: no cover - optional convenience
+        """Wrap as a ``torch.utils.data.IterableDataset`` (requires 'torch').
+
+        Call :meth:`set_epoch` on this object (not the wrapper) between epochs;
+        with persistent workers, recreate the DataLoader instead.
+        """
+        from ua_datasets.sharding import _torch_iterable_class
+
+        return _torch_iterable_class()(self)
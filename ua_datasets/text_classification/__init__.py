@@ -1,3 +1,29 @@
-from ua_datasets.text_classification.news_classification import NewsClassificationDataset
+from ua_datasets import _lazy_module
 
-__all__ = ["NewsClassificationDataset"]
+TYPE_CHECKING = False  # avoids importing ``typing``; type checkers treat the name as True
+if TYPE_CHECKING:
+    from ua_datasets.text_classification.features import HashingFeaturizer, SparseBatch
+    from ua_datasets.text_classification.news_classification import NewsClassificationDataset
+    from ua_datasets.text_classification.sampling import AliasTable, LabelBalancedSampler
+    from ua_datasets.text_classification.splits import StratifiedSplitter
+
+__all__ = [
+    "AliasTable",
+    "HashingFeaturizer",
+    "LabelBalancedSampler",
+    "NewsClassificationDataset",
+    "SparseBatch",
+    "StratifiedSplitter",
+]
+
+__getattr__, __dir__ = _lazy_module(
+    __name__,
+    {
+        "AliasTable": "ua_datasets.text_classification.sampling",
+        "HashingFeaturizer": "ua_datasets.text_classification.features",
+        "LabelBalancedSampler": "ua_datasets.text_classification.sampling",
+        "NewsClassificationDataset": "ua_datasets.text_classification.news_classification",
+        "SparseBatch": "ua_datasets.text_classification.features",
+        "StratifiedSplitter": "ua_datasets.text_classification.splits",
+    },
+)
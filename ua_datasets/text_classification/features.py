@@ -0,0 +1,286 @@
+"""Hashing-trick feature extraction for the news classification corpus.
+
+The featurizer maps Ukrainian text to a fixed-size sparse space without building
+a vocabulary, so memory use does not grow with the corpus. Batches are emitted
+in CSR layout (``indptr``/``indices``/``data`` buffers from :mod:`array`), which
+can be handed to SciPy or a linear model without further copying.
+
+Example
+-------
+>>> feat = HashingFeaturizer(n_features=2**18)
+>>> for batch in feat.iter_batches(ds, batch_size=2048, num_workers=4):
+...     X, y = batch.to_scipy(), batch.targets
+"""
+
+from __future__ import annotations
+
+import json
+import math
+import re
+import unicodedata
+import zlib
+from array import array
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor
+from dataclasses import asdict, dataclass, field
+from hashlib import sha256
+from pathlib import Path
+from typing import Any, Deque, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple
+
+from ua_datasets.text_classification.news_classification import NewsClassificationDataset
+
+__all__ = [
+    "HashingFeaturizer",
+    "SparseBatch",
+]
+
+# Apostrophe look-alikes (U+2019, U+02BC, ...) used interchangeably in Ukrainian text.
+_APOSTROPHES = str.maketrans(dict.fromkeys("\u2019\u02bc\u2018`\u00b4", "'"))
+# Stress marks (combining acute) and soft hyphens carry no lexical information.
+_DROP_CHARS = str.maketrans(dict.fromkeys("\u0301\u00ad"))
+_TOKEN_RE = re.compile(r"[^\W_]+(?:['-][^\W_]+)*")
+_CACHE_VERSION = 1
+
+
+@dataclass(slots=True)
+class SparseBatch:
+    """A batch of hashed feature rows in CSR layout."""
+
+    indptr: array
+    indices: array
+    data: array
+    n_features: int
+    targets: List[str] = field(default_factory=list)
+
+    def __len__(self) -> int:
+        return len(self.indptr) - 1
+
+    def row(self, i: int) -> Tuple[array, array]:
+        """Return ``(indices, values)`` of the ``i``-th row."""
+        start, end = self.indptr[i], self.indptr[i + 1]
+        return self.indices[start:end], self.data[start:end]
+
+    def to_scipy(self) -> Any:  # pragma: no cover - optional convenience
+        """Return a ``scipy.sparse.csr_matrix`` (requires 'scipy' installed)."""
+        try:  # local import to avoid hard dependency
+            import importlib
+
+            sparse = importlib.import_module("scipy.sparse")
+        except Exception as exc:
+            raise RuntimeError(
+                "The 'scipy' package is required for to_scipy(); install with 'pip install scipy'."
+            ) from exc
+        return sparse.csr_matrix(
+            (self.data, self.indices, self.indptr), shape=(len(self), self.n_features)
+        )
+
+
+@dataclass(slots=True, frozen=True)
+class HashingFeaturizer:
+    """Stateless text featurizer using word/char n-grams and the hashing trick.
+
+    Parameters
+    ----------
+    n_features:
+        Size of the output feature space.
+    word_ngram_range:
+        Inclusive ``(min_n, max_n)`` range of word n-grams, or ``None`` to disable.
+    char_ngram_range:
+        Inclusive ``(min_n, max_n)`` range of character n-grams taken inside word
+        boundaries, or ``None`` to disable.
+    fields:
+        CSV columns to featurize. Each field hashes into its own namespace, so
+        the same word in ``title`` and ``text`` yields distinct features.
+    alternate_sign:
+        Derive a sign from the hash so that collisions tend to cancel out.
+    binary:
+        Record presence (1.0) instead of counts.
+    norm:
+        ``"l2"`` to unit-normalize every row, or ``None``.
+    """
+
+    n_features: int = 2**20
+    word_ngram_range: Optional[Tuple[int, int]] = (1, 2)
+    char_ngram_range: Optional[Tuple[int, int]] = (3, 5)
+    fields: Tuple[str, ...] = ("title", "text")
+    alternate_sign: bool = True
+    binary: bool = False
+    norm: Optional[str] = "l2"
+
+    def __post_init__(self) -> None:
+        if self.n_features < 1:
+            raise ValueError("n_features must be positive")
+        if self.norm not in (None, "l2"):
+            raise ValueError(f"Unsupported norm {self.norm!r}; expected 'l2' or None")
+        for rng in (self.word_ngram_range, self.char_ngram_range):
+            if rng is not None and not 1 <= rng[0] <= rng[1]:
+                raise ValueError(f"Invalid n-gram range {rng!r}")
+
+    @staticmethod
+    def normalize(text: str) -> str:
+        """NFC-normalize, unify apostrophes, drop stress marks and lowercase."""
+        text = unicodedata.normalize("NFD", text).translate(_DROP_CHARS)
+        return unicodedata.normalize("NFC", text).translate(_APOSTROPHES).casefold()
+
+    @classmethod
+    def tokenize(cls, text: str) -> List[str]:
+        """Split normalized text into word tokens (apostrophes/hyphens kept inside words)."""
+        return _TOKEN_RE.findall(cls.normalize(text))
+
+    def iter_features(self, text: str, namespace: str = "") -> Iterator[str]:
+        """Yield the string features of ``text`` before hashing."""
+        tokens = self.tokenize(text)
+        if self.word_ngram_range is not None:
+            lo, hi = self.word_ngram_range
+            for n in range(lo, hi + 1):
+                for i in range(len(tokens) - n + 1):
+                    yield f"{namespace}w{n}:{' '.join(tokens[i : i + n])}"
+        if self.char_ngram_range is not None:
+            lo, hi = self.char_ngram_range
+            for tok in tokens:
+                padded = f" {tok} "
+                for n in range(lo, hi + 1):
+                    for i in range(len(padded) - n + 1):
+                        yield f"{namespace}c:{padded[i : i + n]}"
+
+    def transform_one(self, texts: Sequence[str]) -> Tuple[array, array]:
+        """Hash one record (one text per field) into sorted ``(indices, values)``."""
+        counts: Dict[int, float] = {}
+        for field_idx, text in enumerate(texts):
+            for feat in self.iter_features(text, namespace=f"{field_idx}|"):
+                # crc32 is stable across processes, unlike the salted built-in hash().
+                h = zlib.crc32(feat.encode("utf8"))
+                idx = h % self.n_features
+                value = -1.0 if self.alternate_sign and h & 0x80000000 else 1.0
+                if self.binary:
+                    counts[idx] = value
+                else:
+                    counts[idx] = counts.get(idx, 0.0) + value
+        keys = sorted(k for k, v in counts.items() if v != 0.0)
+        values = array("f", (counts[k] for k in keys))
+        if self.norm == "l2" and values:
+            scale = 1.0 / math.sqrt(sum(v * v for v in values))
+            values = array("f", (v * scale for v in values))
+        return array("I", keys), values
+
+    def transform(self, records: Iterable[Sequence[str]]) -> SparseBatch:
+        """Hash an iterable of records into a single :class:`SparseBatch`."""
+        indptr = array("Q", [0])
+        indices = array("I")
+        data = array("f")
+        for texts in records:
+            idx, vals = self.transform_one(texts)
+            indices.extend(idx)
+            data.extend(vals)
+            indptr.append(len(indices))
+        return SparseBatch(indptr, indices, data, self.n_features)
+
+    def config_key(self) -> str:
+        """Stable digest of the featurizer configuration (used for cache keys)."""
+        payload = json.dumps({"v": _CACHE_VERSION, **asdict(self)}, sort_keys=True)
+        return sha256(payload.encode("utf8")).hexdigest()[:16]
+
+    def iter_batches(
+        self,
+        dataset: NewsClassificationDataset,
+        *,
+        batch_size: int = 1024,
+        num_workers: int = 0,
+        cache_dir: Optional[Path] = None,
+    ) -> Iterator[SparseBatch]:
+        """Stream hashed feature batches over ``dataset`` in row order.
+
+        Parameters
+        ----------
+        dataset:
+            Loaded news dataset; the configured ``fields`` must be CSV columns.
+        batch_size:
+            Rows per emitted batch.
+        num_workers:
+            If greater than 1, batches are hashed in a process pool. At most
+            ``2 * num_workers`` batches are in flight, keeping memory bounded.
+        cache_dir:
+            Optional directory for an on-disk feature cache keyed by the
+            featurizer configuration, batch size, the split file's size and
+            modification time and the loaded subset (row count, ``load_shard``
+            and, with ``where``, a digest of the rows). A complete cache is
+            replayed without hashing.
+        """
+        if batch_size < 1:
+            raise ValueError("batch_size must be positive")
+        columns = dataset.column_names
+        missing = [f for f in self.fields if f not in columns]
+        if missing:
+            raise ValueError(f"Unknown field(s) for featurization: {', '.join(missing)}")
+        field_idx = [columns.index(f) for f in self.fields]
+        target_idx = columns.index("target")
+        rows = dataset.data
+        spans = [(a, min(a + batch_size, len(rows))) for a in range(0, len(rows), batch_size)]
+
+        def _records(a: int, b: int) -> List[List[str]]:
+            return [[row[i] for i in field_idx] for row in rows[a:b]]
+
+        def _targets(a: int, b: int) -> List[str]:
+            return [row[target_idx] for row in rows[a:b]]
+
+        cache = self._cache_path(dataset, batch_size, cache_dir) if cache_dir else None
+        if cache is not None and (cache / "complete").exists():
+            for i, (a, b) in enumerate(spans):
+                batch = _read_batch(cache / f"{i:06d}.bin", self.n_features)
+                batch.targets = _targets(a, b)
+                yield batch
+            return
+        if cache is not None:
+            cache.mkdir(parents=True, exist_ok=True)
+
+        def _emit(i: int, batch: SparseBatch) -> SparseBatch:
+            if cache is not None:
+                _write_batch(cache / f"{i:06d}.bin", batch)
+            batch.targets = _targets(*spans[i])
+            return batch
+
+        if num_workers > 1:
+            with ProcessPoolExecutor(max_workers=num_workers) as pool:
+                pending: Deque[Future[SparseBatch]] = deque()
+                done = 0
+                for a, b in spans:
+                    pending.append(pool.submit(self.transform, _records(a, b)))
+                    if len(pending) >= 2 * num_workers:
+                        yield _emit(done, pending.popleft().result())
+                        done += 1
+                while pending:
+                    yield _emit(done, pending.popleft().result())
+                    done += 1
+        else:
+            for i, (a, b) in enumerate(spans):
+                yield _emit(i, self.transform(_records(a, b)))
+        if cache is not None:
+            (cache / "complete").touch()
+
+    def _cache_path(
+        self, dataset: NewsClassificationDataset, batch_size: int, cache_dir: Path
+    ) -> Path:
+        rows_key = json.dumps(dataset._cache_key(), sort_keys=True).encode("utf8")
+        key = f"{dataset.split}-{sha256(rows_key).hexdigest()[:16]}"
+        return Path(cache_dir) / f"{self.config_key()}-b{batch_size}-{key}"
+
+
+def _write_batch(path: Path, batch: SparseBatch) -> None:
+    tmp = path.with_suffix(path.suffix + ".tmp")
+    with tmp.open("wb") as fh:
+        array("Q", [len(batch.indptr), len(batch.indices)]).tofile(fh)
+        batch.indptr.tofile(fh)
+        batch.indices.tofile(fh)
+        batch.data.tofile(fh)
+    tmp.replace(path)
+
+
+def _read_batch(path: Path, n_features: int) -> SparseBatch:
+    with path.open("rb") as fh:
+        sizes = array("Q")
+        sizes.fromfile(fh, 2)
+        indptr, indices, data = array("Q"), array("I"), array("f")
+        indptr.fromfile(fh, sizes[0])
+        indices.fromfile(fh, sizes[1])
+        data.fromfile(fh, sizes[1])
+    return SparseBatch(indptr, indices, data, n_features)
@@ -17,12 +17,45 @@ Example
 from __future__ import annotations
 
 import csv
+import io
+import mmap
+import re
+from array import array
 from dataclasses import dataclass, field
+from itertools import pairwise
 from pathlib import Path
-from typing import Dict, Iterator, List, Optional, Set, Tuple
-from urllib.request import urlopen
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Set,
+    SupportsIndex,
+    Tuple,
+    Union,
+    overload,
+)
 
-from ua_datasets.utils import DownloadFailure, atomic_write_text, download_text_with_retries
+from ua_datasets.bundle import Bundle, FileRange, open_bundle
+from ua_datasets.instrumentation import memory_usage, span
+from ua_datasets.sharding import shard_indices, shard_view
+from ua_datasets.utils import (
+    DownloadFailure,
+    atomic_write_text,
+    download_text_with_retries,
+    urlopen,
+)
+from ua_datasets.views import DatasetView, IndexKey, as_position, resolve_indices
+
+if TYPE_CHECKING:
+    import asyncio
+
+    from ua_datasets.progress import ProgressReporter
+    from ua_datasets.shuffle import ShuffledIterable
 
 __all__ = [
     "DownloadError",
@@ -41,6 +74,81 @@ class ParseError(RuntimeError):
 
 Row = List[str]
 Sample = Tuple[str, str, str, Optional[List[str]]]
+# Predicate over a record keyed by column name (see ``NewsClassificationDataset.where``).
+RowPredicate = Callable[[Dict[str, str]], bool]
+
+# Minimum bytes of row data per parallel chunk; smaller inputs are parsed
+# serially because process start-up would dominate.
+_MIN_CHUNK_BYTES = 8 * 1024 * 1024
+# A quote opens a quoted field only at the start of a field (csv module semantics);
+# quotes elsewhere in an unquoted field are literal characters.
+_OPENING_QUOTE = re.compile(rb'(?<![^,\r\n])"')
+
+
+def _collect_rows(
+    lines: Iterable[str], n_columns: int, keep: Optional[Callable[[Row], bool]] = None
+) -> List[Row]:
+    """Parse CSV records skipping blank rows, right-padding short ones and dropping
+    those rejected by ``keep``."""
+    rows: List[Row] = []
+    for row in csv.reader(lines):
+        if not row or all(cell == "" for cell in row):
+            continue
+        # Basic row length guard
+        if len(row) < n_columns:
+            # Allow shorter if trailing columns empty, pad to columns length
+            row = row + [""] * (n_columns - len(row))
+        if keep is None or keep(row):
+            rows.append(row)
+    return rows
+
+
+def _parse_csv_chunk(
+    path: str, start: int, end: int, n_columns: int, keep: Optional[Callable[[Row], bool]] = None
+) -> List[Row]:
+    """Parse the byte range ``[start, end)`` of a CSV file (process pool worker)."""
+    with open(path, "rb") as fh:
+        fh.seek(start)
+        data = fh.read(end - start)
+    return _collect_rows(io.StringIO(data.decode("utf8"), newline=""), n_columns, keep)
+
+
+def _find_record_boundaries(buf: mmap.mmap, start: int, targets: List[int]) -> List[int]:
+    """Return record start offsets at or after each target byte offset.
+
+    The scan tracks whether it is inside a quoted field, so newlines embedded in
+    quoted values are never chosen. ``start`` must itself be a record start.
+    Only ``\n`` terminated records are split; offsets past the end are dropped.
+    """
+    size = len(buf)
+    bounds: List[int] = []
+    pos = start
+    for target in targets:
+        while pos < size:
+            match = _OPENING_QUOTE.search(buf, pos)
+            quote = match.start() if match else size
+            newline = buf.find(b"\n", max(pos, target), quote)
+            if newline != -1:
+                pos = newline + 1
+                break
+            if quote == size:
+                return bounds
+            # Skip the quoted field, honouring doubled ("") escaped quotes.
+            pos = quote + 1
+            while True:
+                close = buf.find(b'"', pos)
+                if close == -1:
+                    return bounds
+                if buf[close + 1 : close + 2] == b'"':
+                    pos = close + 2
+                    continue
+                pos = close + 1
+                break
+        if pos >= size:
+            break
+        if not bounds or pos > bounds[-1]:
+            bounds.append(pos)
+    return bounds
 
 
 @dataclass(slots=True)
@@ -58,6 +166,25 @@ class NewsClassificationDataset:
     return_tags:
         If ``True`` parsed list of tags is returned instead of ``None`` in the
         4th element of each sample tuple.
+    parse_workers:
+        If greater than 1, large files are split at record boundaries and parsed
+        by a process pool of that size. Rows are identical to the serial parser.
+    load_shard:
+        Optional ``(num_shards, index)``: parse only this contiguous byte range
+        of the file (cut at record boundaries), so each rank reads and holds
+        just its part. Shards are disjoint and together cover every row; labels
+        and statistics then describe the shard only.
+    where:
+        Optional predicate called while parsing with each record as a
+        ``{column: value}`` dict; rejected rows are never stored, e.g.
+        ``lambda row: row["target"] in {"politics", "sport"}``. With
+        ``parse_workers`` it runs in this process as chunks arrive, so it need
+        not be picklable. An empty result is not an error when filtering.
+    bundle:
+        Read the split from this :mod:`bundle <ua_datasets.bundle>` (a
+        :class:`~ua_datasets.bundle.Bundle` or its path) instead of the file
+        system; ``root`` is then the dataset's name inside the bundle and
+        nothing is downloaded. See :meth:`Bundle.load <ua_datasets.bundle.Bundle.load>`.
     """
 
     root: Path
@@ -70,28 +197,74 @@ class NewsClassificationDataset:
     max_retries: int = 3
     timeout: int = 20  # seconds
     expected_sha256: str | None = None
-    show_progress: bool = True
+    show_progress: Union[bool, ProgressReporter] = True
+    parse_workers: int = 0
+    load_shard: Optional[Tuple[int, int]] = None
+    where: Optional[RowPredicate] = None
+    bundle: Union[str, Path, Bundle, None] = None
 
     dataset_path: Path = field(init=False)
     _columns: List[str] = field(init=False, default_factory=list)
     _rows: List[Row] = field(init=False, default_factory=list)
     _parsed_tags: Optional[List[List[str]]] = field(init=False, default=None)
     _label_cache: Set[str] = field(init=False, default_factory=set)
+    _label_positions: Optional[Dict[str, array]] = field(init=False, default=None)
+    _shared: Dict[str, Any] = field(init=False, default_factory=dict)
+    _bundle: Optional[Bundle] = field(init=False, default=None)
 
     def __post_init__(self) -> None:
         self.root = Path(self.root)
         self.dataset_path = self.root / f"{self.split}.csv"
-        if self.download:
+        if self.load_shard is not None:
+            shard_indices(0, *self.load_shard)  # validate before any download
+        if self.bundle is not None:
+            self._bundle = open_bundle(self.bundle)
+        elif self.download:
             self.download_dataset()
-        if not self.dataset_path.exists():
+        if not self._check_exists():
             raise FileNotFoundError(
                 "Dataset not found. Use download=True to fetch it or ensure the file exists."
             )
-        self._rows = self._load_rows()
-        if not self._rows:
+        with span("parse", dataset=type(self).__name__, path=str(self.dataset_path)) as phase:
+            self._rows = self._load_rows()
+            if phase.enabled:
+                phase.set(records=len(self._rows), bytes=self._file(self.dataset_path).size)
+        if not self._rows and self.where is None:
             raise ParseError("Loaded zero rows; file may be empty or malformed.")
         # Cache labels for fast repeated access
-        self._label_cache = {row[self._columns.index("target")] for row in self._rows}
+        with span("stats", dataset=type(self).__name__, records=len(self._rows)):
+            self._label_cache = {row[self._columns.index("target")] for row in self._rows}
+
+    @classmethod
+    async def aload(
+        cls,
+        root: Union[str, Path],
+        *,
+        limiter: Optional[asyncio.Semaphore] = None,
+        executor: Any = None,
+        **kwargs: Any,
+    ) -> NewsClassificationDataset:
+        """Asynchronous constructor: download with non-blocking I/O, parse in ``executor``.
+
+        Accepts the constructor's arguments. A missing split file is fetched
+        with :func:`ua_datasets.aio.adownload_text_with_retries` (``limiter``
+        bounds concurrent downloads) and ``DownloadError`` is raised if that
+        fails; parsing runs in ``executor`` (default: the loop's thread pool).
+        """
+        from ua_datasets.aio import aload_dataset
+
+        def sources(options: Dict[str, Any]) -> List[Tuple[Path, str]]:
+            name = f"{options['split']}.csv"
+            return [(Path(root) / name, f"{options['base_url']}{name}")]
+
+        return await aload_dataset(
+            cls,
+            {**kwargs, "root": root},
+            sources,
+            error=DownloadError,
+            limiter=limiter,
+            executor=executor,
+        )
 
     def download_dataset(self) -> None:
         """Download the dataset split file if needed using shared helper."""
@@ -112,9 +285,47 @@ class NewsClassificationDataset:
             raise DownloadError(str(exc)) from exc
         atomic_write_text(self.dataset_path, text)
 
+    def _check_exists(self) -> bool:
+        if self._bundle is not None:
+            return self.dataset_path in self._bundle
+        return self.dataset_path.exists()
+
+    def _file(self, path: Path) -> FileRange:
+        """``path`` as a byte range of the file system or of :attr:`bundle`."""
+        return FileRange.of(path) if self._bundle is None else self._bundle.file(path)
+
+    def _cache_key(self) -> Dict[str, Any]:
+        """Identity of the loaded rows for on-disk caches derived from them.
+
+        The source file's size and mtime identify an unfiltered load; the row
+        count and ``load_shard`` tell subsets apart, and with :attr:`where` (an
+        arbitrary predicate) a digest of the kept rows is added.
+        """
+        source = self._file(self.dataset_path)
+        key: Dict[str, Any] = {
+            "split": self.split,
+            "source_size": source.size,
+            "source_mtime_ns": source.mtime_ns,
+            "n_rows": len(self._rows),
+            "load_shard": None if self.load_shard is None else list(self.load_shard),
+        }
+        if self.where is not None:
+            from hashlib import sha256
+
+            digest = sha256()
+            for row in self._rows:
+                digest.update("\x1f".join(row).encode("utf8"))
+                digest.update(b"\x1e")
+            key["rows_sha256"] = digest.hexdigest()
+        return key
+
+    def _bundle_entry(self) -> Tuple[Dict[str, Any], Dict[str, FileRange]]:
+        """Options and files that :func:`ua_datasets.bundle.write_bundle` stores for this split."""
+        return {"split": self.split}, {self.dataset_path.name: self._file(self.dataset_path)}
+
     def _load_rows(self) -> List[Row]:
         """Load raw rows from CSV, capturing header separately and validating columns."""
-        with self.dataset_path.open("r", encoding="utf8", newline="") as f:
+        with self._file(self.dataset_path).open_text(newline="") as f:
             reader = csv.reader(f)
             try:
                 self._columns = next(reader)
@@ -124,17 +335,110 @@ class NewsClassificationDataset:
             missing = required - set(self._columns)
             if missing:
                 raise ParseError(f"Missing required column(s): {', '.join(sorted(missing))}")
-            rows: List[Row] = []
-            for row in reader:
-                if not row or all(cell == "" for cell in row):
-                    continue
-                # Basic row length guard
-                if len(row) < len(self._columns):
-                    # Allow shorter if trailing columns empty, pad to columns length
-                    row = row + [""] * (len(self._columns) - len(row))
-                rows.append(row)
+            keep = self._row_filter()
+            if self.load_shard is not None:
+                rows = self._load_rows_shard(*self.load_shard, keep)
+                if rows is not None:
+                    return rows
+                rows = _collect_rows(f, len(self._columns))
+                block = shard_indices(len(rows), *self.load_shard, contiguous=True)
+                rows = rows[block.start : block.stop]
+                return rows if keep is None else list(filter(keep, rows))
+            if self.parse_workers > 1:
+                rows = self._load_rows_parallel(keep)
+                if rows is not None:
+                    return rows
+            return _collect_rows(f, len(self._columns), keep)
+
+    def _row_filter(self) -> Optional[Callable[[Row], bool]]:
+        """Adapt :attr:`where` to raw rows (``None`` when no filter is set)."""
+        where = self.where
+        if where is None:
+            return None
+        columns = self._columns
+        return lambda row: bool(where(dict(zip(columns, row, strict=False))))
+
+    def _load_rows_parallel(
+        self, keep: Optional[Callable[[Row], bool]] = None
+    ) -> Optional[List[Row]]:
+        """Parse the data rows in byte-range chunks using a process pool.
+
+        Returns ``None`` when the file is too small to be worth splitting or the
+        header cannot be located unambiguously, in which case the caller falls
+        back to the serial path.
+        """
+        source = self._file(self.dataset_path)
+        size = source.size
+        if size == 0:
+            return None
+        with source.map() as buf:  # type: ignore[union-attr]  # non-empty: an mmap
+            data_start = self._data_start(buf)
+            if data_start is None:
+                return None
+            n_chunks = min(self.parse_workers, (size - data_start) // _MIN_CHUNK_BYTES)
+            if n_chunks < 2:
+                return None
+            step = (size - data_start) // n_chunks
+            targets = [data_start + step * i for i in range(1, n_chunks)]
+            bounds = [data_start, *_find_record_boundaries(buf, data_start, targets), size]
+        # Workers read absolute byte ranges of the underlying (possibly bundle) file.
+        spans = [(source.offset + a, source.offset + b) for a, b in pairwise(bounds)]
+        if len(spans) < 2:
+            return None
+        path = str(source.path)
+        n_columns = len(self._columns)
+        from concurrent.futures import ProcessPoolExecutor  # deferred: pulls in multiprocessing
+
+        rows: List[Row] = []
+        with ProcessPoolExecutor(max_workers=min(self.parse_workers, len(spans))) as pool:
+            for chunk in pool.map(
+                _parse_csv_chunk,
+                [path] * len(spans),
+                [a for a, _ in spans],
+                [b for _, b in spans],
+                [n_columns] * len(spans),
+            ):
+                rows.extend(chunk if keep is None else filter(keep, chunk))
         return rows
 
+    def _data_start(self, buf: mmap.mmap) -> Optional[int]:
+        """Offset of the first data record, or ``None`` if the header is ambiguous."""
+        header_end = _find_record_boundaries(buf, 0, [0])
+        if not header_end:
+            return None
+        header_text = buf[: header_end[0]].decode("utf8")
+        if next(csv.reader(io.StringIO(header_text, newline=""))) != self._columns:
+            return None
+        return header_end[0]
+
+    def _load_rows_shard(
+        self, num_shards: int, index: int, keep: Optional[Callable[[Row], bool]] = None
+    ) -> Optional[List[Row]]:
+        """Parse only the byte range of shard ``index`` (``None``: header ambiguous)."""
+        source = self._file(self.dataset_path)
+        if source.size == 0:
+            return None
+        with source.map() as buf:  # type: ignore[union-attr]  # non-empty: an mmap
+            data_start = self._data_start(buf)
+            if data_start is None:
+                return None
+            size = len(buf)
+
+            def bound(k: int) -> int:
+                # Every rank computes the same monotone cut points, so shards never overlap.
+                if k == 0:
+                    return data_start
+                if k == num_shards:
+                    return size
+                target = data_start + (size - data_start) * k // num_shards
+                found = _find_record_boundaries(buf, data_start, [target])
+                return found[0] if found else size
+
+            start, end = bound(index), bound(index + 1)
+        return _parse_csv_chunk(
+            str(source.path), source.offset + start, source.offset + end, len(self._columns), keep
+        )
+
     @property
     def column_names(self) -> List[str]:
         return self._columns
@@ -156,9 +460,10 @@ class NewsClassificationDataset:
             return
         tags_idx = self._columns.index("tags") if "tags" in self._columns else None
         parsed: List[List[str]] = []
-        for row in self._rows:
-            raw = row[tags_idx] if tags_idx is not None and tags_idx < len(row) else ""
-            parsed.append(self._preprocess_tags(raw))
+        with span("index", dataset=type(self).__name__, cache="tags", records=len(self._rows)):
+            for row in self._rows:
+                raw = row[tags_idx] if tags_idx is not None and tags_idx < len(row) else ""
+                parsed.append(self._preprocess_tags(raw))
         self._parsed_tags = parsed
 
     def label_frequencies(self) -> Dict[str, int]:
@@ -169,17 +474,121 @@ class NewsClassificationDataset:
             freqs[tgt] = freqs.get(tgt, 0) + 1
         return freqs
 
+    def label_positions(self) -> Dict[str, array]:
+        """Return a mapping of label -> row indices (``array('Q')``) holding that label.
+
+        Built once on first use and cached; samplers and split helpers rely on it
+        to avoid rescanning rows.
+        """
+        if self._label_positions is None:
+            tgt_idx = self._columns.index("target")
+            positions: Dict[str, array] = {}
+            with span("index", dataset=type(self).__name__, cache="label_positions"):
+                for i, row in enumerate(self._rows):
+                    bucket = positions.get(row[tgt_idx])
+                    if bucket is None:
+                        bucket = positions[row[tgt_idx]] = array("Q")
+                    bucket.append(i)
+            self._label_positions = positions
+        return self._label_positions
+
+    def memory_usage(self) -> Dict[str, int]:
+        """Approximate bytes held per category and field; see :func:`ua_datasets.instrumentation.memory_usage`."""
+        return memory_usage(self, caches=("_label_cache", "_label_positions", "_parsed_tags"))
+
+    def shard(
+        self, num_shards: int, index: int, *, contiguous: bool = False
+    ) -> DatasetView[Sample]:
+        """Return shard ``index`` of ``num_shards`` disjoint, deterministic subsets.
+
+        Round-robin by default; ``contiguous=True`` gives consecutive blocks.
+        """
+        return shard_view(self, num_shards, index, contiguous=contiguous)
+
+    def shuffled(
+        self, *, seed: int = 0, block_size: int = 256, buffer_size: int = 4096
+    ) -> ShuffledIterable[Sample]:
+        """Near-random, reproducible iteration reading blocks of consecutive items.
+
+        Blocks are visited in a shuffled order and mixed through a bounded
+        buffer; call ``set_epoch`` on the result between epochs. Shards are
+        detected per rank and loader worker, see :mod:`ua_datasets.shuffle`.
+        """
+        from ua_datasets.shuffle import ShuffledIterable
+
+        return ShuffledIterable(self, seed=seed, block_size=block_size, buffer_size=buffer_size)
+
+    def share_memory(self) -> None:
+        """Move the parsed rows into shared memory (see :mod:`ua_datasets.shared`).
+
+        Pickled copies then reattach to the same memory instead of carrying the
+        rows, and forked workers no longer copy them on access.
+        """
+        if self._shared:
+            return
+        from ua_datasets.shared import SharedStringGroups
+
+        self._ensure_parsed_tags()
+        for name in ("_rows", "_parsed_tags"):
+            if getattr(self, name) is not None:
+                self._shared[name] = SharedStringGroups.from_groups(getattr(self, name))
+                setattr(self, name, self._shared[name])
+
+    def __reduce_ex__(self, protocol: SupportsIndex) -> Any:
+        if self._shared or self.where is not None:
+            from ua_datasets.shared import _reduce_dataset
+
+            # Rows are already filtered; predicates are often unpicklable lambdas.
+            return _reduce_dataset(self, {**self._shared, "where": None})
+        return object.__reduce_ex__(self, protocol)
+
     def __len__(self) -> int:
         return len(self._rows)
 
-    def __getitem__(self, idx: int) -> Sample:
-        title, text, _tags_raw, target = self._rows[idx]
+    @overload
+    def __getitem__(self, idx: int) -> Sample: ...
+
+    @overload
+    def __getitem__(self, idx: IndexKey) -> DatasetView[Sample]: ...
+
+    def __getitem__(self, idx: Union[int, IndexKey]) -> Union[Sample, DatasetView[Sample]]:
+        pos = as_position(idx)
+        if pos is None:
+            return self.select(idx)  # type: ignore[arg-type]
+        title, text, _tags_raw, target = self._rows[pos]
         if self.return_tags:
             self._ensure_parsed_tags()
             assert self._parsed_tags is not None
-            return title, text, target, self._parsed_tags[idx]
+            return title, text, target, self._parsed_tags[pos]
         return title, text, target, None
 
+    def select(self, indices: IndexKey) -> DatasetView[Sample]:
+        """Return a view over ``indices`` (a slice or integer positions) without copying."""
+        return DatasetView(self, resolve_indices(len(self), indices))
+
+    @overload
+    def prefetch(
+        self, n: int = ..., *, batch_size: None = ..., num_workers: int = ...
+    ) -> Iterator[Sample]: ...
+
+    @overload
+    def prefetch(
+        self, n: int = ..., *, batch_size: int, num_workers: int = ...
+    ) -> Iterator[List[Sample]]: ...
+
+    def prefetch(
+        self, n: int = 64, *, batch_size: Optional[int] = None, num_workers: int = 0
+    ) -> Union[Iterator[Sample], Iterator[List[Sample]]]:
+        """Iterate with up to ``n`` items (or batches) loaded ahead in the background.
+
+        A producer thread reads ahead of the caller; with ``num_workers > 1``
+        index ranges are fetched by a process pool instead. See
+        :func:`ua_datasets.prefetch.prefetch`.
+        """
+        from ua_datasets.prefetch import prefetch
+
+        return prefetch(self, n, batch_size=batch_size, num_workers=num_workers)
+
     def __iter__(self) -> Iterator[Sample]:
         for i in range(len(self)):
             yield self[i]
@@ -0,0 +1,203 @@
+"""Class-balanced and weighted index sampling for the news classification corpus.
+
+Weighted draws use Walker/Vose alias tables, so each sample costs O(1)
+regardless of how skewed the label distribution is. Tables are built once per
+sampler from :meth:`NewsClassificationDataset.label_positions`; starting a new
+epoch only reseeds the random generator.
+
+Example
+-------
+>>> sampler = LabelBalancedSampler(ds, strategy="balanced", seed=13)
+>>> sampler.set_epoch(3)
+>>> for batch in sampler.iter_batches(256):
+...     rows = [ds[i] for i in batch]
+"""
+
+from __future__ import annotations
+
+import math
+import random
+from array import array
+from typing import Iterator, List, Mapping, Optional, Sequence, Union
+
+from ua_datasets.text_classification.news_classification import NewsClassificationDataset
+
+__all__ = [
+    "AliasTable",
+    "LabelBalancedSampler",
+]
+
+STRATEGIES = ("balanced", "inverse", "natural", "custom")
+
+
+class AliasTable:
+    """Alias table for O(1) draws from a fixed discrete distribution (Vose's method)."""
+
+    __slots__ = ("_alias", "_prob")
+
+    def __init__(self, weights: Sequence[float]) -> None:
+        n = len(weights)
+        total = float(sum(weights))
+        if n == 0 or total <= 0 or not all(0 <= w < math.inf for w in weights):
+            raise ValueError("weights must be finite and non-negative with a positive sum")
+        scaled = [w * n / total for w in weights]
+        self._prob = array("d", [0.0] * n)
+        self._alias = array("Q", [0] * n)
+        small = [i for i, p in enumerate(scaled) if p < 1.0]
+        large = [i for i, p in enumerate(scaled) if p >= 1.0]
+        while small and large:
+            s, g = small.pop(), large.pop()
+            self._prob[s] = scaled[s]
+            self._alias[s] = g
+            scaled[g] -= 1.0 - scaled[s]
+            (small if scaled[g] < 1.0 else large).append(g)
+        # Leftovers are 1.0 up to floating point error.
+        for i in small + large:
+            self._prob[i] = 1.0
+            self._alias[i] = i
+
+    def __len__(self) -> int:
+        return len(self._prob)
+
+    def probabilities(self) -> List[float]:
+        """Recover the normalized distribution encoded by the table."""
+        n = len(self._prob)
+        probs = [0.0] * n
+        for i, p in enumerate(self._prob):
+            probs[i] += p / n
+            probs[self._alias[i]] += (1.0 - p) / n
+        return probs
+
+    def draw(self, rng: random.Random) -> int:
+        i = int(rng.random() * len(self._prob))
+        return i if rng.random() < self._prob[i] else self._alias[i]
+
+
+class LabelBalancedSampler:
+    """Seedable sampler of row indices drawn with replacement under a label weighting.
+
+    Parameters
+    ----------
+    dataset:
+        Loaded :class:`NewsClassificationDataset`.
+    strategy:
+        ``"balanced"`` (every label equally likely), ``"inverse"`` (each row
+        weighted by ``1 / freq(label) ** power``), ``"natural"`` (corpus
+        distribution) or ``"custom"`` (``weights`` required).
+    weights:
+        For ``"custom"``: either a mapping of label -> weight or a sequence of
+        per-row weights of length ``len(dataset)``. Weights must be finite and
+        non-negative; labels missing from the mapping or weighted ``0`` are
+        never drawn.
+    power:
+        Exponent for ``"inverse"``; ``1.0`` equals ``"balanced"`` and ``0.0``
+        equals ``"natural"``.
+    num_samples:
+        Draws per epoch (defaults to ``len(dataset)``).
+    seed:
+        Base seed. Streams are derived from ``(seed, epoch, rank, worker)`` so
+        results are reproducible across processes.
+    """
+
+    def __init__(
+        self,
+        dataset: NewsClassificationDataset,
+        *,
+        strategy: str = "balanced",
+        weights: Optional[Union[Mapping[str, float], Sequence[float]]] = None,
+        power: float = 0.5,
+        num_samples: Optional[int] = None,
+        seed: int = 0,
+    ) -> None:
+        if strategy not in STRATEGIES:
+            raise ValueError(f"Unknown strategy {strategy!r}. Expected one of: {list(STRATEGIES)}")
+        if (strategy == "custom") != (weights is not None):
+            raise ValueError("weights must be given if and only if strategy='custom'")
+        self.num_samples = len(dataset) if num_samples is None else num_samples
+        self.seed = seed
+        self.epoch = 0
+        self._labels: List[str] = []
+        self._buckets: List[array] = []
+        self._label_table: Optional[AliasTable] = None
+        self._row_table: Optional[AliasTable] = None
+
+        if strategy == "custom" and not isinstance(weights, Mapping):
+            assert weights is not None
+            if len(weights) != len(dataset):
+                raise ValueError("Per-row weights must have one entry per dataset row")
+            self._row_table = AliasTable(weights)
+            return
+
+        positions = dataset.label_positions()
+        label_weights: List[float] = []
+        for label, bucket in positions.items():
+            freq = len(bucket)
+            if strategy == "balanced":
+                w = 1.0
+            elif strategy == "inverse":
+                w = freq ** (1.0 - power)
+            elif strategy == "natural":
+                w = float(freq)
+            else:
+                assert isinstance(weights, Mapping)
+                w = float(weights.get(label, 0.0))
+                if not 0 <= w < math.inf:
+                    raise ValueError(f"Weight for label {label!r} must be finite and >= 0, got {w}")
+            if w > 0:  # labels weighted zero are never drawn
+                self._labels.append(label)
+                self._buckets.append(bucket)
+                label_weights.append(w)
+        self._label_table = AliasTable(label_weights)
+
+    def set_epoch(self, epoch: int) -> None:
+        """Select the random stream for ``epoch`` (constant time)."""
+        self.epoch = epoch
+
+    def label_probabilities(self) -> Mapping[str, float]:
+        """Probability of drawing each label (label-level strategies only)."""
+        if self._label_table is None:
+            raise ValueError("Label probabilities are undefined for per-row weights")
+        return dict(zip(self._labels, self._label_table.probabilities(), strict=True))
+
+    def __len__(self) -> int:
+        return self.num_samples
+
+    def iter_indices(self, *, rank: int = 0, world_size: int = 1) -> Iterator[int]:
+        """Yield this stream's share of the epoch's draws.
+
+        With ``world_size > 1`` the ``num_samples`` draws are divided between
+        streams (ranks and/or DataLoader workers), each with an independent,
+        reproducible generator.
+        """
+        if not 0 <= rank < world_size:
+            raise ValueError(f"rank must be in [0, {world_size}), got {rank}")
+        count = self.num_samples // world_size + (rank < self.num_samples % world_size)
+        rng = random.Random(f"{self.seed}:{self.epoch}:{rank}:{world_size}")
+        if self._row_table is not None:
+            table = self._row_table
+            for _ in range(count):
+                yield table.draw(rng)
+            return
+        assert self._label_table is not None
+        label_table, buckets = self._label_table, self._buckets
+        for _ in range(count):
+            bucket = buckets[label_table.draw(rng)]
+            yield bucket[int(rng.random() * len(bucket))]
+
+    def __iter__(self) -> Iterator[int]:
+        return self.iter_indices()
+
+    def iter_batches(
+        self, batch_size: int, *, drop_last: bool = False, rank: int = 0, world_size: int = 1
+    ) -> Iterator[array]:
+        """Yield ``array('Q')`` batches of row indices."""
+        if batch_size < 1:
+            raise ValueError("batch_size must be positive")
+        batch = array("Q")
+        for idx in self.iter_indices(rank=rank, world_size=world_size):
+            batch.append(idx)
+            if len(batch) == batch_size:
+                yield batch
+                batch = array("Q")
+        if batch and not drop_last:
+            yield batch
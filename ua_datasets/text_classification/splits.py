@@ -0,0 +1,165 @@
+"""Deterministic stratified k-fold and holdout splits for the news corpus.
+
+Splits are expressed as a per-row fold assignment (``array('B')``); folds are
+exposed as :class:`~ua_datasets.views.DatasetView` objects over the original
+dataset, so no rows are copied. With ``cache_dir`` set, assignments are saved
+as JSON and reused as long as the split file, the loaded subset of rows
+(``where=``, ``load_shard``) and the parameters are unchanged.
+
+Example
+-------
+>>> splitter = StratifiedSplitter(ds, seed=42, cache_dir=Path("./splits"))
+>>> for train, val in splitter.kfold(5):
+...     fit(train); evaluate(val)
+"""
+
+from __future__ import annotations
+
+import json
+import random
+from array import array
+from hashlib import sha256
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from ua_datasets.text_classification.news_classification import (
+    NewsClassificationDataset,
+    Sample,
+)
+from ua_datasets.utils import atomic_write_text
+from ua_datasets.views import DatasetView
+
+__all__ = ["StratifiedSplitter"]
+
+_FORMAT_VERSION = 1
+
+
+class StratifiedSplitter:
+    """Build stratified fold assignments over a :class:`NewsClassificationDataset`.
+
+    Parameters
+    ----------
+    dataset:
+        Loaded news dataset.
+    seed:
+        Seed for the per-stratum shuffles.
+    stratify_by_tag:
+        If ``True`` strata are ``(target, first tag)`` pairs instead of ``target``.
+    cache_dir:
+        Optional directory where assignments are saved and looked up.
+    """
+
+    def __init__(
+        self,
+        dataset: NewsClassificationDataset,
+        *,
+        seed: int = 0,
+        stratify_by_tag: bool = False,
+        cache_dir: Optional[Path] = None,
+    ) -> None:
+        self.dataset = dataset
+        self.seed = seed
+        self.stratify_by_tag = stratify_by_tag
+        self.cache_dir = Path(cache_dir) if cache_dir is not None else None
+
+    def kfold(self, n_splits: int = 5) -> List[Tuple[DatasetView[Sample], DatasetView[Sample]]]:
+        """Return ``n_splits`` ``(train, validation)`` view pairs."""
+        if not 2 <= n_splits <= 255:
+            raise ValueError("n_splits must be between 2 and 255")
+        if n_splits > len(self.dataset):
+            raise ValueError(
+                f"n_splits={n_splits} is greater than the number of rows ({len(self.dataset)})"
+            )
+        assignment = self.fold_assignment(n_splits)
+        return [self._views(assignment, k) for k in range(n_splits)]
+
+    def holdout(self, test_size: float = 0.1) -> Tuple[DatasetView[Sample], DatasetView[Sample]]:
+        """Return a single ``(train, validation)`` split with ``test_size`` held out per stratum."""
+        if not 0.0 < test_size < 1.0:
+            raise ValueError("test_size must be in (0, 1)")
+        return self._views(self.holdout_assignment(test_size), 1)
+
+    def fold_assignment(self, n_splits: int) -> array:
+        """Per-row fold ids for stratified k-fold (cached when ``cache_dir`` is set)."""
+        return self._cached({"kind": "kfold", "n_splits": n_splits}, self._build_kfold)
+
+    def holdout_assignment(self, test_size: float) -> array:
+        """Per-row flags (1 = held out) for a stratified holdout split."""
+        return self._cached({"kind": "holdout", "test_size": test_size}, self._build_holdout)
+
+    # ---- construction -----------------------------------------------------------
+    def _strata(self) -> List[List[int]]:
+        """Row indices grouped by stratum, shuffled deterministically, in sorted key order."""
+        positions = self.dataset.label_positions()
+        groups: Dict[Tuple[str, str], List[int]] = {}
+        if self.stratify_by_tag:
+            columns = self.dataset.column_names
+            tags_idx = columns.index("tags") if "tags" in columns else None
+            rows = self.dataset.data
+            for label, bucket in positions.items():
+                for i in bucket:
+                    raw = rows[i][tags_idx] if tags_idx is not None else ""
+                    tag = next((t for t in raw.split("|") if t), "")
+                    groups.setdefault((label, tag), []).append(i)
+        else:
+            groups = {(label, ""): list(bucket) for label, bucket in positions.items()}
+        rng = random.Random(self.seed)
+        strata = []
+        for key in sorted(groups):
+            members = groups[key]
+            rng.shuffle(members)
+            strata.append(members)
+        return strata
+
+    def _build_kfold(self, params: Dict[str, Any]) -> array:
+        n_splits = params["n_splits"]
+        assignment = array("B", bytes(len(self.dataset)))
+        # A running offset spreads each stratum's remainder over different folds.
+        offset = 0
+        for members in self._strata():
+            for j, i in enumerate(members):
+                assignment[i] = (offset + j) % n_splits
+            offset += len(members)
+        return assignment
+
+    def _build_holdout(self, params: Dict[str, Any]) -> array:
+        test_size = params["test_size"]
+        assignment = array("B", bytes(len(self.dataset)))
+        carry = 0.0
+        for members in self._strata():
+            # Carry rounding error between strata so the total matches test_size.
+            exact = len(members) * test_size + carry
+            n_val = round(exact)
+            carry = exact - n_val
+            for i in members[:n_val]:
+                assignment[i] = 1
+        return assignment
+
+    def _views(
+        self, assignment: array, fold: int
+    ) -> Tuple[DatasetView[Sample], DatasetView[Sample]]:
+        train = array("Q", (i for i, f in enumerate(assignment) if f != fold))
+        val = array("Q", (i for i, f in enumerate(assignment) if f == fold))
+        return DatasetView(self.dataset, train), DatasetView(self.dataset, val)
+
+    # ---- persistence ------------------------------------------------------------
+    def _cached(self, params: Dict[str, Any], build: Callable[[Dict[str, Any]], array]) -> array:
+        if self.cache_dir is None:
+            return build(params)
+        meta = {
+            "version": _FORMAT_VERSION,
+            **self.dataset._cache_key(),  # source file and loaded subset (where=, load_shard)
+            "seed": self.seed,
+            "stratify_by_tag": self.stratify_by_tag,
+            **params,
+        }
+        digest = sha256(json.dumps(meta, sort_keys=True).encode("utf8")).hexdigest()[:16]
+        path = self.cache_dir / f"{self.dataset.split}-{params['kind']}-{digest}.json"
+        if path.exists():
+            stored = json.loads(path.read_text(encoding="utf8"))
+            if stored.get("meta") == meta:
+                return array("B", stored["assignment"])
+        assignment = build(params)
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        atomic_write_text(path, json.dumps({"meta": meta, "assignment": assignment.tolist()}))
+        return assignment
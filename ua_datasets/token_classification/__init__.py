@@ -1,3 +1,17 @@
-from ua_datasets.token_classification.part_of_speech import MovaInstitutePOSDataset
+from ua_datasets import _lazy_module
 
-__all__ = ["MovaInstitutePOSDataset"]
+TYPE_CHECKING = False  # avoids importing ``typing``; type checkers treat the name as True
+if TYPE_CHECKING:
+    from ua_datasets.token_classification.batching import PaddedBatch, iter_padded_batches
+    from ua_datasets.token_classification.part_of_speech import MovaInstitutePOSDataset
+
+__all__ = ["MovaInstitutePOSDataset", "PaddedBatch", "iter_padded_batches"]
+
+__getattr__, __dir__ = _lazy_module(
+    __name__,
+    {
+        "MovaInstitutePOSDataset": "ua_datasets.token_classification.part_of_speech",
+        "PaddedBatch": "ua_datasets.token_classification.batching",
+        "iter_padded_batches": "ua_datasets.token_classification.batching",
+    },
+)
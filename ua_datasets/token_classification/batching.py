@@ -0,0 +1,169 @@
+"""Length-bucketed padded batching over the encoded POS corpus.
+
+Sentences are grouped by length so that each batch needs little padding, and
+batches are packed under a token budget (``rows * longest_row``). Batches are
+plain :mod:`array` buffers in row-major order; :meth:`PaddedBatch.numpy` wraps
+them as NumPy arrays without copying when NumPy is installed.
+
+Example
+-------
+>>> ds = MovaInstitutePOSDataset(root=Path('./data'), encoded=True)
+>>> for batch in ds.iter_padded_batches(max_tokens=8192, seed=1, epoch=0):
+...     tokens, tags, mask = batch.numpy()
+"""
+
+from __future__ import annotations
+
+import random
+from array import array
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any, Iterator, List, Optional, Tuple
+
+if TYPE_CHECKING:
+    from ua_datasets.token_classification.part_of_speech import MovaInstitutePOSDataset
+
+__all__ = [
+    "PaddedBatch",
+    "iter_padded_batches",
+]
+
+
+@dataclass(slots=True)
+class PaddedBatch:
+    """Padded id matrices for one batch, stored row-major in flat buffers.
+
+    ``token_ids``, ``tag_ids`` and ``mask`` each hold ``shape[0] * shape[1]``
+    items; ``mask`` is 1 for real tokens and 0 for padding. ``indices`` are the
+    dataset positions of the rows.
+    """
+
+    indices: array
+    token_ids: array
+    tag_ids: array
+    mask: array
+    shape: Tuple[int, int]
+
+    def __len__(self) -> int:
+        return self.shape[0]
+
+    def numpy(self) -> Tuple[Any, Any, Any]:  # pragma: no cover - optional convenience
+        """Return ``(token_ids, tag_ids, mask)`` as 2-D NumPy views (requires 'numpy')."""
+        try:  # local import to avoid hard dependency
+            import importlib
+
+            np = importlib.import_module("numpy")
+        except Exception as exc:
+            raise RuntimeError(
+                "The 'numpy' package is required for numpy(); install with 'pip install numpy'."
+            ) from exc
+        return tuple(
+            np.frombuffer(buf, dtype=np.dtype(buf.typecode)).reshape(self.shape)
+            for buf in (self.token_ids, self.tag_ids, self.mask)
+        )
+
+
+def _plan_batches(
+    lengths: array,
+    *,
+    max_tokens: int,
+    batch_size: Optional[int],
+    bucket_width: int,
+    shuffle: bool,
+    rng: random.Random,
+    drop_last: bool,
+) -> List[List[int]]:
+    order = list(range(len(lengths)))
+    if shuffle:
+        rng.shuffle(order)
+    # Stable sort keeps the shuffled order inside each length bucket.
+    order.sort(key=lambda i: lengths[i] // bucket_width)
+    batches: List[List[int]] = []
+    current: List[int] = []
+    longest = 0
+    for i in order:
+        length = max(lengths[i], 1)
+        new_longest = max(longest, length)
+        full = batch_size is not None and len(current) >= batch_size
+        if current and (full or (len(current) + 1) * new_longest > max_tokens):
+            batches.append(current)
+            current, new_longest = [], length
+        current.append(i)
+        longest = new_longest
+    if current and not (drop_last and batch_size is not None and len(current) < batch_size):
+        batches.append(current)
+    if shuffle:
+        rng.shuffle(batches)
+    return batches
+
+
+def iter_padded_batches(
+    dataset: MovaInstitutePOSDataset,
+    *,
+    max_tokens: int = 4096,
+    batch_size: Optional[int] = None,
+    bucket_width: int = 4,
+    shuffle: bool = True,
+    seed: int = 0,
+    epoch: int = 0,
+    pad_id: int = 0,
+    pad_tag_id: int = 0,
+    drop_last: bool = False,
+) -> Iterator[PaddedBatch]:
+    """Yield padded batches of an ``encoded=True`` POS dataset.
+
+    Parameters
+    ----------
+    dataset:
+        Dataset loaded with ``encoded=True``.
+    max_tokens:
+        Upper bound on ``rows * longest_row`` per batch (a single sentence longer
+        than the budget still forms its own batch).
+    batch_size:
+        Optional cap on rows per batch.
+    bucket_width:
+        Sentences whose lengths fall into the same ``length // bucket_width``
+        bucket are interchangeable; larger widths add randomness and padding.
+    shuffle:
+        Shuffle within buckets and the order of batches.
+    seed, epoch:
+        Together select the random stream, so every epoch is reproducible.
+    pad_id, pad_tag_id:
+        Fill values for padded token and tag positions.
+    drop_last:
+        With ``batch_size`` set, drop the final under-filled batch.
+    """
+    if not dataset.encoded:
+        raise ValueError("Padded batches require a dataset loaded with encoded=True")
+    if max_tokens < 1 or bucket_width < 1 or (batch_size is not None and batch_size < 1):
+        raise ValueError("max_tokens, bucket_width and batch_size must be positive")
+    rng = random.Random(f"{seed}:{epoch}")
+    lengths = dataset.sentence_lengths
+    plan = _plan_batches(
+        lengths,
+        max_tokens=max_tokens,
+        batch_size=batch_size,
+        bucket_width=bucket_width,
+        shuffle=shuffle,
+        rng=rng,
+        drop_last=drop_last,
+    )
+    for rows in plan:
+        width = max(lengths[i] for i in rows)
+        token_ids, tag_ids = dataset.ids(rows[0])
+        tokens_out = array(token_ids.format)
+        tags_out = array(tag_ids.format)
+        mask = array("B")
+        token_pad = array(token_ids.format, [pad_id]) * width
+        tag_pad = array(tag_ids.format, [pad_tag_id]) * width
+        ones, zeros = b"\x01" * width, bytes(width)
+        for i in rows:
+            token_ids, tag_ids = dataset.ids(i)
+            n = len(token_ids)
+            # frombytes copies the raw slice in C instead of iterating items.
+            tokens_out.frombytes(token_ids.cast("B"))
+            tokens_out.extend(token_pad[: width - n])
+            tags_out.frombytes(tag_ids.cast("B"))
+            tags_out.extend(tag_pad[: width - n])
+            mask.frombytes(ones[:n])
+            mask.frombytes(zeros[: width - n])
+        yield PaddedBatch(array("Q", rows), tokens_out, tags_out, mask, (len(rows), width))
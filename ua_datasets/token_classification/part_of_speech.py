@@ -11,12 +11,47 @@ Example
 >>> len(ds), len(tokens) == len(tags)
 """
 
+import io
+import mmap
+from array import array
+from bisect import bisect_right
+from collections import Counter
 from collections.abc import Sequence as ABCSequence
 from dataclasses import dataclass, field
+from itertools import pairwise
 from pathlib import Path
-from typing import Dict, Generic, Iterator, List, Set, Tuple, TypeVar
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    BinaryIO,
+    Callable,
+    Dict,
+    Generic,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Set,
+    SupportsIndex,
+    Tuple,
+    TypeVar,
+    Union,
+    overload,
+)
 
+from ua_datasets.bundle import Bundle, BundleError, FileRange, open_bundle
+from ua_datasets.instrumentation import memory_usage, span
+from ua_datasets.sharding import shard_indices, shard_view
 from ua_datasets.utils import DownloadFailure, atomic_write_text, download_text_with_retries
+from ua_datasets.views import DatasetView, IndexKey, as_position, resolve_indices
+
+if TYPE_CHECKING:
+    import asyncio
+
+    from ua_datasets.progress import ProgressReporter
+    from ua_datasets.shuffle import ShuffledIterable
+    from ua_datasets.token_classification.batching import PaddedBatch
+    from ua_datasets.vocab import Vocabulary
 
 __all__ = [
     "DownloadError",
@@ -26,6 +61,24 @@ __all__ = [
 
 Sentence = List[str]
 TagSequence = List[str]
+# Zero-copy (token ids, tag ids) slices of the encoded backend.
+IdSlices = Tuple[memoryview, memoryview]
+# What integer indexing returns: decoded (tokens, tags) or, with return_ids, id slices.
+Item = Union[Tuple[Sentence, TagSequence], IdSlices]
+# Raw values of the optional columns for one sentence (one list per requested field).
+ExtraColumns = List[List[str]]
+# Predicate over (tokens, tags) deciding whether a sentence is kept (``where=``).
+SentencePredicate = Callable[[Sentence, TagSequence], bool]
+
+CONLLU_COLUMNS = ("id", "form", "lemma", "upos", "xpos", "feats", "head", "deprel", "deps", "misc")
+# Columns that can be requested via ``fields=`` in addition to FORM/UPOS.
+OPTIONAL_FIELDS = ("lemma", "xpos", "feats", "head", "deprel", "deps", "misc")
+# Minimum bytes per parallel parsing chunk; smaller files form a single chunk.
+_MIN_CHUNK_BYTES = 4 * 1024 * 1024
+# Sidecar sentence index: magic, ``array('Q')`` [size, mtime_ns, n], then n start
+# offsets ('Q'), n end offsets ('Q') and n sentence lengths ('I').
+_INDEX_MAGIC = b"UAPOSIX1"
+_INDEX_SUFFIX = ".sentidx"
 
 
 S = TypeVar("S", bound=Sentence)
@@ -40,6 +93,227 @@ class ParseError(RuntimeError):
     """Raised when the dataset file cannot be parsed into any sentences."""
 
 
+def _iter_conllu(
+    lines: Iterable[str], extra_columns: Tuple[int, ...] = ()
+) -> Iterator[Tuple[Sentence, TagSequence, ExtraColumns]]:
+    """Yield ``(tokens, tags, extras)`` for each sentence in CoNLL-U ``lines``.
+
+    Comment lines, multiword token ranges (``3-4``), empty nodes and malformed
+    lines are skipped. ``extra_columns`` are CoNLL-U column indices collected
+    into ``extras`` (missing trailing columns read as ``"_"``); lines are split
+    only as far as the right-most requested column.
+    """
+    maxsplit = max((3, *extra_columns)) + 1
+    tokens: Sentence = []
+    tags: TagSequence = []
+    extras: ExtraColumns = [[] for _ in extra_columns]
+    for raw in lines:
+        line = raw.rstrip("\n")
+        stripped = line.strip()
+        if not stripped:  # sentence boundary
+            if tokens:
+                yield tokens, tags, extras
+                tokens, tags = [], []
+                extras = [[] for _ in extra_columns]
+            continue
+        if stripped.startswith("#"):
+            continue
+        parts = stripped.split("\t", maxsplit)
+        if len(parts) < 4:
+            continue
+        id_field = parts[0]
+        # Skip multiword tokens like '3-4'
+        if "-" in id_field:
+            continue
+        if not id_field.isdigit():
+            continue
+        tokens.append(parts[1])
+        tags.append(parts[3])
+        for values, col in zip(extras, extra_columns, strict=True):
+            values.append(parts[col] if col < len(parts) else "_")
+    # Flush final sentence if file lacks trailing newline/blank line
+    if tokens:
+        yield tokens, tags, extras
+
+
+def _find_sentence_boundaries(buf: mmap.mmap, targets: List[int]) -> List[int]:
+    """Return offsets just after the first blank line at or after each target.
+
+    Every returned offset starts a fresh sentence, so chunks cut there parse
+    exactly as they would in a single sequential pass.
+    """
+    bounds: List[int] = []
+    for target in targets:
+        start = max(target - 1, bounds[-1] if bounds else 0)
+        hits = [i for i in (buf.find(b"\n\n", start), buf.find(b"\n\r\n", start)) if i != -1]
+        if not hits:
+            break
+        pos = min(hits)
+        pos += 2 if buf[pos + 1 : pos + 2] == b"\n" else 3
+        if pos >= len(buf):
+            break
+        if not bounds or pos > bounds[-1]:
+            bounds.append(pos)
+    return bounds
+
+
+def _parse_conllu_chunk(
+    path: str, start: int, end: int, extra_columns: Tuple[int, ...]
+) -> List[Tuple[Sentence, TagSequence, ExtraColumns]]:
+    """Parse the byte range ``[start, end)`` of a CoNLL-U file (process pool worker)."""
+    with open(path, "rb") as fh:
+        fh.seek(start)
+        data = fh.read(end - start)
+    # newline=None mirrors the universal-newline handling of text-mode files.
+    return list(_iter_conllu(io.StringIO(data.decode("utf8"), newline=None), extra_columns))
+
+
+def _chunk_spans(path: Union[Path, FileRange], n_chunks: int) -> List[Tuple[int, int]]:
+    """Split a CoNLL-U file into at most ``n_chunks`` byte spans at sentence boundaries.
+
+    Spans are relative to the start of ``path`` (a bundle member's own offset
+    must be added before reading the underlying file).
+    """
+    source = FileRange.of(path)
+    size = source.size
+    n_chunks = min(n_chunks, size // _MIN_CHUNK_BYTES)
+    if n_chunks < 2:
+        return [(0, size)]
+    with source.map() as buf:  # type: ignore[union-attr]  # non-empty: an mmap
+        step = size // n_chunks
+        bounds = [0, *_find_sentence_boundaries(buf, [step * i for i in range(1, n_chunks)]), size]
+    return list(pairwise(bounds))
+
+
+@dataclass(slots=True)
+class _SentenceIndex:
+    """Byte range ``[starts[i], ends[i])`` and token count of every sentence in a file."""
+
+    starts: array
+    ends: array
+    lengths: array
+
+
+def _scan_sentence_index(fh: BinaryIO) -> _SentenceIndex:
+    """Build a :class:`_SentenceIndex` with the same sentence rules as :func:`_iter_conllu`.
+
+    Each range runs from the end of the previous sentence to the end of the
+    blank line closing this one, so parsing it yields exactly one sentence.
+    """
+    pos = 0
+
+    def lines() -> Iterator[str]:
+        nonlocal pos
+        for raw in fh:
+            pos += len(raw)
+            line = raw.decode("utf8")
+            if "\r" in line[:-2]:
+                raise ParseError("Indexing requires '\\n' or '\\r\\n' line endings")
+            yield line
+
+    index = _SentenceIndex(array("Q"), array("Q"), array("I"))
+    prev = 0
+    # _iter_conllu yields right after reading the closing blank line, so ``pos``
+    # is the end of this sentence's range at that point.
+    for tokens, _tags, _extras in _iter_conllu(lines()):
+        index.starts.append(prev)
+        index.ends.append(pos)
+        index.lengths.append(len(tokens))
+        prev = pos
+    return index
+
+
+def _read_sentence_index(fh: BinaryIO, header: array) -> Optional[_SentenceIndex]:
+    """Read a sidecar index whose stored header starts with ``header`` (else ``None``)."""
+    stored = array("Q")
+    try:
+        if fh.read(len(_INDEX_MAGIC)) == _INDEX_MAGIC:
+            stored.fromfile(fh, 3)
+        if stored[: len(header)] != header:
+            return None
+        n = stored[2]
+        index = _SentenceIndex(array("Q"), array("Q"), array("I"))
+        index.starts.fromfile(fh, n)
+        index.ends.fromfile(fh, n)
+        index.lengths.fromfile(fh, n)
+    except EOFError:  # truncated
+        return None
+    return index
+
+
+def _load_sentence_index(
+    path: Union[Path, FileRange], packed: Optional[FileRange] = None
+) -> _SentenceIndex:
+    """Read the sidecar index of ``path``, rebuilding it when size or mtime changed.
+
+    The index is written next to the data file; if that location is not
+    writable the freshly built index is used without being persisted. For a
+    bundle member, the index ``packed`` alongside it is used when its size
+    matches, and a rebuilt index is never persisted.
+    """
+    source = FileRange.of(path)
+    if not source.whole_file:
+        if packed is not None:
+            with packed.open() as fh:
+                index = _read_sentence_index(fh, array("Q", [source.size]))
+            if index is not None:
+                return index
+        with source.open() as fh:
+            return _scan_sentence_index(fh)
+    header = array("Q", [source.size, source.mtime_ns])
+    sidecar = source.path.with_name(source.path.name + _INDEX_SUFFIX)
+    try:
+        with sidecar.open("rb") as fh:
+            index = _read_sentence_index(fh, header)
+        if index is not None:
+            return index
+    except OSError:
+        pass  # missing or unreadable: rebuild below
+    with source.open() as fh:
+        index = _scan_sentence_index(fh)
+    tmp = sidecar.with_name(sidecar.name + ".tmp")
+    try:
+        with tmp.open("wb") as fh:
+            fh.write(_INDEX_MAGIC)
+            array("Q", [*header, len(index.lengths)]).tofile(fh)
+            index.starts.tofile(fh)
+            index.ends.tofile(fh)
+            index.lengths.tofile(fh)
+        tmp.replace(sidecar)
+    except OSError:
+        tmp.unlink(missing_ok=True)
+    return index
+
+
+def _shard_span(path: Union[Path, FileRange], num_shards: int, index: int) -> Tuple[int, int]:
+    """Byte range of shard ``index`` of a CoNLL-U file, cut at blank lines.
+
+    Cut points depend only on the file and ``num_shards``, so shards computed
+    independently by different ranks are disjoint and cover the whole file.
+    The range is relative to the start of ``path``.
+    """
+    source = FileRange.of(path)
+    size = source.size
+    if size == 0:
+        return 0, 0
+    with source.map() as buf:  # type: ignore[union-attr]  # non-empty: an mmap
+
+        def bound(k: int) -> int:
+            if k == 0:
+                return 0
+            if k == num_shards:
+                return size
+            found = _find_sentence_boundaries(buf, [size * k // num_shards])
+            return found[0] if found else size
+
+        return bound(index), bound(index + 1)
+
+
+def _map_file(path: Union[Path, FileRange]) -> Union[mmap.mmap, bytes]:
+    """Memory-map ``path`` read-only (empty files, which mmap rejects, map to ``b""``)."""
+    return FileRange.of(path).map()
+
+
 @dataclass(slots=True)
 class MovaInstitutePOSDataset(ABCSequence, Generic[S, T]):
     """Dataset wrapper for the Mova Institute POS tagging corpus.
@@ -54,6 +328,55 @@ class MovaInstitutePOSDataset(ABCSequence, Generic[S, T]):
         Local filename for the cached dataset (text format).
     data_file:
         Remote URL containing the dataset contents.
+    fields:
+        Optional CoNLL-U columns to parse besides FORM and UPOS (any of
+        ``lemma``, ``xpos``, ``feats``, ``head``, ``deprel``, ``deps``, ``misc``).
+        FEATS are stored as integer bitsets over :attr:`feats_vocabulary` and
+        HEAD as ``array('h')`` (``-1`` where unspecified). Retrieve them with
+        :meth:`annotations`.
+    encoded:
+        If True, tokens and tags are stored as integer ids in flat ``array``
+        buffers (``array('I')`` token ids, ``array('B')`` tag ids and a sentence
+        offsets array) with a vocabulary per side, instead of lists of strings.
+    return_ids:
+        With ``encoded=True``, make ``__getitem__`` return zero-copy
+        ``memoryview`` slices of ids instead of decoded string lists.
+    extra_files:
+        Further local CoNLL-U files (absolute, or relative to ``root``), e.g. UD
+        Ukrainian treebanks, concatenated after the main file into one dataset
+        with shared label/tag vocabularies. See :attr:`source_offsets`.
+    parse_workers:
+        If greater than 1, files are split at sentence boundaries and parsed by
+        a process pool of that size. Results are identical to the serial parser.
+    lazy:
+        If True, only a sentence byte-offset index is loaded (kept in a
+        ``<file>.sentidx`` sidecar and rebuilt when the file's size or mtime
+        change); the files are memory-mapped and sentences are parsed on
+        access. ``len()`` and random access are then available immediately.
+        Cannot be combined with ``encoded``, ``parse_workers`` or the ``feats``
+        field (whose bitsets need the whole corpus).
+    vocabulary:
+        With ``encoded=True``, a fixed token :class:`~ua_datasets.vocab.Vocabulary`
+        (or the path of a saved one) to encode with instead of growing a new
+        one; out-of-vocabulary tokens map to its ``unk_token``.
+    load_shard:
+        Optional ``(num_shards, index)``: load only this contiguous part of every
+        source file. Files are cut at sentence boundaries and only the shard's
+        bytes are read and parsed (``parse_workers`` is then ignored); with
+        ``lazy=True`` the sentence index is split by sentence count instead.
+        Shards are disjoint and together cover the corpus.
+    where:
+        Optional predicate ``where(tokens, tags)`` evaluated as each sentence is
+        parsed; rejected sentences are never encoded or stored, e.g.
+        ``lambda tokens, tags: 5 <= len(tokens) <= 40``. With ``parse_workers``
+        it runs in this process, so it need not be picklable. Cannot be
+        combined with ``lazy``. An empty result is not an error when filtering.
+    bundle:
+        Read the corpus (and its packed sentence indexes) from this
+        :mod:`bundle <ua_datasets.bundle>` (a :class:`~ua_datasets.bundle.Bundle`
+        or its path) instead of the file system; ``root`` is then the dataset's
+        name inside the bundle and nothing is downloaded. ``lazy=True`` maps the
+        bundled file in place. See :meth:`Bundle.load <ua_datasets.bundle.Bundle.load>`.
     """
 
     root: Path
@@ -64,43 +387,209 @@ class MovaInstitutePOSDataset(ABCSequence, Generic[S, T]):
     max_retries: int = 3
     timeout: int = 15  # seconds for individual HTTP attempt
     expected_sha256: str | None = None
-    show_progress: bool = True
+    show_progress: Union[bool, "ProgressReporter"] = True
+    fields: Tuple[str, ...] = ()
+    encoded: bool = False
+    return_ids: bool = False
+    extra_files: Tuple[Union[str, Path], ...] = ()
+    parse_workers: int = 0
+    lazy: bool = False
+    vocabulary: Union["Vocabulary", str, Path, None] = None
+    load_shard: Optional[Tuple[int, int]] = None
+    where: Optional[SentencePredicate] = None
+    bundle: Union[str, Path, "Bundle", None] = None
 
     dataset_path: Path = field(init=False)
     _samples: List[Sentence] = field(init=False, default_factory=list)
     _labels: List[TagSequence] = field(init=False, default_factory=list)
     _unique_labels_cache: Set[str] = field(init=False, default_factory=set)
+    _extras: Dict[str, List[Any]] = field(init=False, default_factory=dict)
+    _feats_vocab: List[str] = field(init=False, default_factory=list)
+    _feats_index: Dict[str, int] = field(init=False, default_factory=dict)
+    _feats_bits: Dict[str, int] = field(init=False, default_factory=dict)
+    _token_vocab: List[str] = field(init=False, default_factory=list)
+    _token_index: Dict[str, int] = field(init=False, default_factory=dict)
+    _unk_id: Optional[int] = field(init=False, default=None)
+    _tag_vocab: List[str] = field(init=False, default_factory=list)
+    _tag_index: Dict[str, int] = field(init=False, default_factory=dict)
+    _token_ids: array = field(init=False, default_factory=lambda: array("I"))
+    _tag_ids: array = field(init=False, default_factory=lambda: array("B"))
+    _offsets: array = field(init=False, default_factory=lambda: array("Q", [0]))
+    _lengths: array = field(init=False, default_factory=lambda: array("I"))
+    _source_paths: List[Path] = field(init=False, default_factory=list)
+    _bundle: Optional["Bundle"] = field(init=False, default=None)
+    _source_offsets: array = field(init=False, default_factory=lambda: array("Q", [0]))
+    _extra_columns: Tuple[int, ...] = field(init=False, default=())
+    _lazy_buffers: List[Union[mmap.mmap, bytes]] = field(init=False, default_factory=list)
+    _lazy_starts: array = field(init=False, default_factory=lambda: array("Q"))
+    _lazy_ends: array = field(init=False, default_factory=lambda: array("Q"))
+    _shared: Dict[str, Any] = field(init=False, default_factory=dict)
 
     def __post_init__(self) -> None:
         self.root = Path(self.root)
+        self.fields = tuple(self.fields)
+        unknown = [f for f in self.fields if f not in OPTIONAL_FIELDS]
+        if unknown or len(set(self.fields)) != len(self.fields):
+            raise ValueError(
+                f"Invalid fields {self.fields!r}. Expected distinct names from: {list(OPTIONAL_FIELDS)}"
+            )
+        if self.return_ids and not self.encoded:
+            raise ValueError("return_ids=True requires encoded=True")
+        if self.lazy and (self.encoded or self.parse_workers > 1):
+            raise ValueError("lazy=True cannot be combined with encoded=True or parse_workers")
+        if self.lazy and self.where is not None:
+            raise ValueError(
+                "where= requires parsing every sentence and cannot be used with lazy=True"
+            )
+        if self.lazy and "feats" in self.fields:
+            # Bits are assigned as FEATS values are first seen, which on lazy access
+            # depends on the order sentences are read in.
+            raise ValueError(
+                "fields=('feats',) requires parsing every sentence and cannot be used with lazy=True"
+            )
+        if self.load_shard is not None:
+            shard_indices(0, *self.load_shard)  # validate before any download
+        if self.vocabulary is not None:
+            if not self.encoded:
+                raise ValueError("vocabulary requires encoded=True")
+            from ua_datasets.vocab import _as_vocabulary
+
+            vocab, self._unk_id = _as_vocabulary(self.vocabulary)
+            self._token_vocab = list(vocab.tokens)
+            self._token_index = {tok: i for i, tok in enumerate(self._token_vocab)}
         self.dataset_path = self.root / self.file_name
-        if self.download:
+        if self.bundle is not None:
+            self._bundle = open_bundle(self.bundle)
+        elif self.download:
             self.download_dataset()
         if not self._check_exists():  # Fail early with a clear message.
             raise FileNotFoundError(
                 "Dataset not found. Use download=True to fetch it or ensure the file exists."
             )
-        self._samples, self._labels = self._load_data()
-        if not self._samples:
+        self._source_paths = [self.dataset_path]
+        for extra in self.extra_files:
+            path = Path(extra) if Path(extra).is_absolute() else self.root / extra
+            if not self._exists(path):
+                raise FileNotFoundError(f"Extra CoNLL-U file not found: '{path}'")
+            self._source_paths.append(path)
+        self._extra_columns = tuple(CONLLU_COLUMNS.index(name) for name in self.fields)
+        with span(
+            "index" if self.lazy else "parse",
+            dataset=type(self).__name__,
+            path=str(self.dataset_path),
+        ) as phase:
+            if self.lazy:
+                self._open_lazy()
+            else:
+                self._samples, self._labels = self._load_data()
+            if phase.enabled:
+                phase.set(
+                    records=len(self),
+                    tokens=sum(self._lengths),
+                    bytes=sum(self._file(path).size for path in self._source_paths),
+                )
+        if not len(self) and self.where is None:
             raise ParseError(
                 f"Parsed zero sentences from dataset file '{self.dataset_path}'. File may be empty or malformed."
             )
         # Cache unique labels (frozenset semantics but returning a set copy in property)
-        self._unique_labels_cache = {lab for seq in self._labels for lab in seq}
+        if self.encoded:
+            self._unique_labels_cache = set(self._tag_vocab)
+        elif not self.lazy:  # lazy mode collects labels on first use
+            with span("stats", dataset=type(self).__name__, records=len(self)):
+                self._unique_labels_cache = {lab for seq in self._labels for lab in seq}
 
     @property
     def labels(self) -> List[TagSequence]:
-        """Raw label sequences (parallel to `data`)."""
+        """Raw label sequences (parallel to `data`).
+
+        With ``encoded=True`` the sequences are decoded, and with ``lazy=True``
+        parsed, on every access.
+        """
+        if self.encoded:
+            return [self._decode(self._tag_vocab, self._tag_ids, i) for i in range(len(self))]
+        if self.lazy:
+            return [tags for _, tags in self._iter_lazy()]
         return self._labels
 
     @property
     def data(self) -> List[Sentence]:
-        """Raw token sequences."""
+        """Raw token sequences.
+
+        With ``encoded=True`` the sequences are decoded, and with ``lazy=True``
+        parsed, on every access.
+        """
+        if self.encoded:
+            return [self._decode(self._token_vocab, self._token_ids, i) for i in range(len(self))]
+        if self.lazy:
+            return [tokens for tokens, _ in self._iter_lazy()]
         return self._samples
 
+    @property
+    def token_vocabulary(self) -> List[str]:
+        """Token strings indexed by id (``encoded=True`` only)."""
+        return self._token_vocab
+
+    @property
+    def tag_vocabulary(self) -> List[str]:
+        """Tag strings indexed by id (``encoded=True`` only)."""
+        return self._tag_vocab
+
+    @property
+    def sentence_offsets(self) -> array:
+        """Start offset of every sentence in the flat id buffers, plus the total length."""
+        return self._offsets
+
+    @property
+    def sentence_lengths(self) -> array:
+        """Token count of every sentence (``array('I')``), recorded while parsing."""
+        return self._lengths
+
+    def iter_padded_batches(
+        self,
+        *,
+        max_tokens: int = 4096,
+        batch_size: int | None = None,
+        bucket_width: int = 4,
+        shuffle: bool = True,
+        seed: int = 0,
+        epoch: int = 0,
+        pad_id: int = 0,
+        pad_tag_id: int = 0,
+        drop_last: bool = False,
+    ) -> Iterator["PaddedBatch"]:
+        """Yield length-bucketed, padded id batches (``encoded=True`` only).
+
+        See :func:`ua_datasets.token_classification.batching.iter_padded_batches`.
+        """
+        from ua_datasets.token_classification.batching import iter_padded_batches
+
+        return iter_padded_batches(
+            self,
+            max_tokens=max_tokens,
+            batch_size=batch_size,
+            bucket_width=bucket_width,
+            shuffle=shuffle,
+            seed=seed,
+            epoch=epoch,
+            pad_id=pad_id,
+            pad_tag_id=pad_tag_id,
+            drop_last=drop_last,
+        )
+
+    def ids(self, idx: int) -> IdSlices:
+        """Return zero-copy ``(token_ids, tag_ids)`` slices of sentence ``idx``."""
+        if not self.encoded:
+            raise ValueError("ids() requires encoded=True")
+        start, end = self._span(idx)
+        return memoryview(self._token_ids)[start:end], memoryview(self._tag_ids)[start:end]
+
     @property
     def unique_labels(self) -> Set[str]:
         """Unique set of tag labels present in the corpus (cached)."""
+        if self.lazy and not self._unique_labels_cache:
+            with span("stats", dataset=type(self).__name__, records=len(self)):
+                self._unique_labels_cache = {lab for _, tags in self._iter_lazy() for lab in tags}
         return self._unique_labels_cache
 
     def label_frequencies(self) -> Dict[str, int]:
@@ -108,67 +597,458 @@ class MovaInstitutePOSDataset(ABCSequence, Generic[S, T]):
 
         Useful for quick exploratory statistics.
         """
+        if self.encoded:
+            return {self._tag_vocab[t]: n for t, n in Counter(self._tag_ids).items()}
         freqs: Dict[str, int] = {}
-        for seq in self._labels:
+        sequences = (tags for _, tags in self._iter_lazy()) if self.lazy else self._labels
+        for seq in sequences:
             for lab in seq:
                 freqs[lab] = freqs.get(lab, 0) + 1
         return freqs
 
-    def _iter_conllu_sentences(self) -> Iterator[Tuple[Sentence, TagSequence]]:
-        """Yield (tokens, tags) for each sentence in the dataset file."""
-        tokens: Sentence = []
-        tags: TagSequence = []
-        with self.dataset_path.open("r", encoding="utf8") as fh:
-            for raw in fh:
-                line = raw.rstrip("\n")
-                stripped = line.strip()
-                if not stripped:  # sentence boundary
-                    if tokens:
-                        yield tokens, tags
-                        tokens, tags = [], []
-                    continue
-                if stripped.startswith("#"):
-                    continue
-                parts = stripped.split("\t")
-                if len(parts) < 4:
-                    continue
-                id_field = parts[0]
-                # Skip multiword tokens like '3-4'
-                if "-" in id_field:
-                    continue
-                if not id_field.isdigit():
-                    continue
-                token = parts[1]
-                tag = parts[3]
-                tokens.append(token)
-                tags.append(tag)
-            # Flush final sentence if file lacks trailing newline/blank line
-            if tokens:
-                yield tokens, tags
+    def memory_usage(self) -> Dict[str, int]:
+        """Approximate bytes held per category and field; see :func:`ua_datasets.instrumentation.memory_usage`.
+
+        Memory-mapped corpora (``lazy=True``) and shared blocks are reported
+        under ``shared``, not ``total``.
+        """
+        return memory_usage(
+            self, caches=("_unique_labels_cache", "_token_index", "_tag_index", "_feats_index")
+        )
+
+    @property
+    def feats_vocabulary(self) -> List[str]:
+        """``Feature=Value`` strings; bit ``i`` of a FEATS bitset refers to entry ``i``."""
+        return self._feats_vocab
+
+    def decode_feats(self, bits: int) -> Dict[str, str]:
+        """Expand a FEATS bitset into a ``{feature: value}`` mapping."""
+        feats: Dict[str, str] = {}
+        i = 0
+        while bits:
+            if bits & 1:
+                name, _, value = self._feats_vocab[i].partition("=")
+                feats[name] = value
+            bits >>= 1
+            i += 1
+        return feats
+
+    def annotations(self, idx: int) -> Dict[str, Any]:
+        """Return the requested ``fields`` of sentence ``idx`` keyed by column name."""
+        if self.lazy:
+            _, _, extras = self._parse_lazy(idx)
+            return dict(zip(self.fields, self._convert_extras(extras), strict=True))
+        return {name: values[idx] for name, values in self._extras.items()}
+
+    def _encode_feats(self, raw: str) -> int:
+        bits = self._feats_bits.get(raw)
+        if bits is None:
+            bits = 0
+            if raw != "_":
+                for pair in raw.split("|"):
+                    pos = self._feats_index.get(pair)
+                    if pos is None:
+                        pos = self._feats_index[pair] = len(self._feats_vocab)
+                        self._feats_vocab.append(pair)
+                    bits |= 1 << pos
+            self._feats_bits[raw] = bits
+        return bits
+
+    def _convert_extras(self, extras: ExtraColumns) -> List[Any]:
+        converted: List[Any] = []
+        for name, values in zip(self.fields, extras, strict=True):
+            if name == "feats":
+                converted.append([self._encode_feats(v) for v in values])
+            elif name == "head":
+                converted.append(array("h", [int(v) if v.isdigit() else -1 for v in values]))
+            else:
+                converted.append(values)
+        return converted
+
+    def _store_extras(self, extras: ExtraColumns) -> None:
+        for name, values in zip(self.fields, self._convert_extras(extras), strict=True):
+            self._extras[name].append(values)
+
+    @property
+    def source_files(self) -> List[Path]:
+        """Parsed CoNLL-U files in concatenation order (main file first)."""
+        return self._source_paths
+
+    @property
+    def source_offsets(self) -> array:
+        """Index of the first sentence of every source file, plus the total count."""
+        return self._source_offsets
+
+    def sentence_source(self, idx: int) -> Path:
+        """Return the file sentence ``idx`` was read from."""
+        if idx < 0:
+            idx += len(self)
+        if not 0 <= idx < len(self):
+            raise IndexError("sentence index out of range")
+        return self._source_paths[bisect_right(self._source_offsets, idx) - 1]
+
+    def _iter_conllu_sentences(
+        self,
+    ) -> Iterator[Tuple[int, Sentence, TagSequence, ExtraColumns]]:
+        """Iterate (source index, tokens, tags, extras) over the sentences kept by :attr:`where`."""
+        sentences = self._read_sentences()
+        where = self.where
+        if where is None:
+            return sentences
+        return (sentence for sentence in sentences if where(sentence[1], sentence[2]))
+
+    def _read_sentences(self) -> Iterator[Tuple[int, Sentence, TagSequence, ExtraColumns]]:
+        """Yield (source index, tokens, tags, extras) for each sentence of every file."""
+        extra_columns = self._extra_columns
+        if self.load_shard is not None:
+            for src, path in enumerate(self._source_paths):
+                source = self._file(path)
+                start, end = _shard_span(source, *self.load_shard)
+                for tokens, tags, extras in _parse_conllu_chunk(
+                    str(source.path), source.offset + start, source.offset + end, extra_columns
+                ):
+                    yield src, tokens, tags, extras
+            return
+        if self.parse_workers > 1:
+            sources = [self._file(path) for path in self._source_paths]
+            spans = [
+                (src, str(source.path), source.offset + start, source.offset + end)
+                for src, source in enumerate(sources)
+                for start, end in _chunk_spans(source, self.parse_workers)
+            ]
+            if len(spans) > 1:
+                from concurrent.futures import (
+                    ProcessPoolExecutor,
+                )  # deferred: pulls in multiprocessing
+
+                with ProcessPoolExecutor(max_workers=min(self.parse_workers, len(spans))) as pool:
+                    chunks = pool.map(
+                        _parse_conllu_chunk,
+                        [s[1] for s in spans],
+                        [s[2] for s in spans],
+                        [s[3] for s in spans],
+                        [extra_columns] * len(spans),
+                    )
+                    for (src, *_), sentences in zip(spans, chunks, strict=True):
+                        for tokens, tags, extras in sentences:
+                            yield src, tokens, tags, extras
+                return
+        for src, path in enumerate(self._source_paths):
+            with self._file(path).open_text() as fh:
+                for tokens, tags, extras in _iter_conllu(fh, extra_columns):
+                    yield src, tokens, tags, extras
 
     def _load_data(self) -> Tuple[List[Sentence], List[TagSequence]]:
         samples: List[Sentence] = []
         labels: List[TagSequence] = []
-        for sent, tag_seq in self._iter_conllu_sentences():
-            samples.append(sent)
-            labels.append(tag_seq)
+        self._extras = {name: [] for name in self.fields}
+        self._lengths = array("I")
+        self._source_offsets = array("Q", [0] * (len(self._source_paths) + 1))
+        for src, sent, tag_seq, extras in self._iter_conllu_sentences():
+            self._source_offsets[src + 1] += 1
+            self._lengths.append(len(sent))
+            if self.encoded:
+                self._append_encoded(sent, tag_seq)
+            else:
+                samples.append(sent)
+                labels.append(tag_seq)
+            if extras:
+                self._store_extras(extras)
+        for i in range(1, len(self._source_offsets)):
+            self._source_offsets[i] += self._source_offsets[i - 1]
         return samples, labels
 
-    def __getitem__(self, idx: int) -> Tuple[Sentence, TagSequence]:  # type: ignore[override]
+    def _open_lazy(self) -> None:
+        """Load (or build) the sentence index of every file and memory-map the files."""
+        self._source_offsets = array("Q", [0])
+        for path in self._source_paths:
+            index = self._sentence_index(path)
+            block = slice(None)
+            if self.load_shard is not None:
+                rows = shard_indices(len(index.starts), *self.load_shard, contiguous=True)
+                block = slice(rows.start, rows.stop)
+            self._lazy_starts.extend(index.starts[block])
+            self._lazy_ends.extend(index.ends[block])
+            self._lengths.extend(index.lengths[block])
+            self._source_offsets.append(len(self._lengths))
+            self._lazy_buffers.append(_map_file(self._file(path)))
+
+    def _parse_lazy(self, idx: int) -> Tuple[Sentence, TagSequence, ExtraColumns]:
+        """Parse sentence ``idx`` from its memory-mapped byte range."""
+        n = len(self._lazy_starts)
+        if idx < 0:
+            idx += n
+        if not 0 <= idx < n:
+            raise IndexError("sentence index out of range")
+        buf = self._lazy_buffers[bisect_right(self._source_offsets, idx) - 1]
+        text = buf[self._lazy_starts[idx] : self._lazy_ends[idx]].decode("utf8")
+        return next(_iter_conllu(io.StringIO(text, newline=None), self._extra_columns))
+
+    def _iter_lazy(self) -> Iterator[Tuple[Sentence, TagSequence]]:
+        """Parse the indexed sentences in order: exactly those ``len()`` and indexing see."""
+        starts, ends, extra_columns = self._lazy_starts, self._lazy_ends, self._extra_columns
+        for src, buf in enumerate(self._lazy_buffers):
+            for idx in range(self._source_offsets[src], self._source_offsets[src + 1]):
+                text = buf[starts[idx] : ends[idx]].decode("utf8")
+                tokens, tags, _ = next(_iter_conllu(io.StringIO(text, newline=None), extra_columns))
+                yield tokens, tags
+
+    def shard(self, num_shards: int, index: int, *, contiguous: bool = False) -> DatasetView[Item]:
+        """Return shard ``index`` of ``num_shards`` disjoint, deterministic subsets.
+
+        Round-robin by default; ``contiguous=True`` gives consecutive blocks.
+        With ``lazy=True`` only the shard's sentences are ever parsed.
+        """
+        return shard_view(self, num_shards, index, contiguous=contiguous)
+
+    def shuffled(
+        self, *, seed: int = 0, block_size: int = 256, buffer_size: int = 4096
+    ) -> "ShuffledIterable[Item]":
+        """Near-random, reproducible iteration reading blocks of consecutive items.
+
+        Blocks are visited in a shuffled order and mixed through a bounded
+        buffer; call ``set_epoch`` on the result between epochs. Shards are
+        detected per rank and loader worker, see :mod:`ua_datasets.shuffle`.
+        With ``lazy=True`` each block is a sequential run through the mapped file.
+        """
+        from ua_datasets.shuffle import ShuffledIterable
+
+        return ShuffledIterable(self, seed=seed, block_size=block_size, buffer_size=buffer_size)
+
+    def share_memory(self) -> None:
+        """Move the parsed corpus into shared memory (see :mod:`ua_datasets.shared`).
+
+        Pickled copies then reattach to the same memory instead of carrying the
+        sentences, and forked workers no longer copy them on access. With
+        ``encoded=True`` the id buffers become ``memoryview`` objects over the
+        shared blocks. Optional ``fields`` annotations are not shared. Lazy
+        datasets need no sharing: they reopen their memory maps when unpickled.
+        """
+        if self._shared:
+            return
+        from ua_datasets.shared import SharedArray, SharedStringGroups, SharedStringTable
+
+        shared = self._shared
+        if self.lazy:
+            arrays: Tuple[str, ...] = ("_lazy_starts", "_lazy_ends", "_lengths")
+        elif self.encoded:
+            arrays = ("_token_ids", "_tag_ids", "_offsets", "_lengths")
+            for name in ("_token_vocab", "_tag_vocab"):
+                shared[name] = SharedStringTable.from_strings(getattr(self, name))
+            self._token_index = {}  # only needed while encoding
+        else:
+            arrays = ("_lengths",)
+            for name in ("_samples", "_labels"):
+                shared[name] = SharedStringGroups.from_groups(getattr(self, name))
+        for name in arrays:
+            shared[name] = SharedArray.from_array(getattr(self, name))
+        for name, value in shared.items():
+            setattr(self, name, value.view if isinstance(value, SharedArray) else value)
+
+    def __reduce_ex__(self, protocol: SupportsIndex) -> Any:
+        if self._shared or self.lazy or self.where is not None:
+            from ua_datasets.shared import _reduce_dataset
+
+            # Memory maps are reopened by _reattach in the receiving process; the
+            # sentences are already filtered and predicates are often lambdas.
+            return _reduce_dataset(self, {**self._shared, "_lazy_buffers": [], "where": None})
+        return object.__reduce_ex__(self, protocol)
+
+    def _reattach(self) -> None:
+        if self.lazy and not self._lazy_buffers:
+            for path in self._source_paths:
+                self._lazy_buffers.append(_map_file(self._file(path)))
+
+    def close(self) -> None:
+        """Release the memory maps held by a ``lazy=True`` dataset."""
+        for buf in self._lazy_buffers:
+            if isinstance(buf, mmap.mmap):
+                buf.close()
+        self._lazy_buffers = []
+
+    def _append_encoded(self, tokens: Sentence, tags: TagSequence) -> None:
+        token_index, tag_index = self._token_index, self._tag_index
+        token_ids, tag_ids = self._token_ids, self._tag_ids
+        for tok in tokens:
+            tid = token_index.get(tok)
+            if tid is None:
+                if self._unk_id is not None:  # fixed vocabulary
+                    tid = self._unk_id
+                else:
+                    tid = token_index[tok] = len(self._token_vocab)
+                    self._token_vocab.append(tok)
+            token_ids.append(tid)
+        for tag in tags:
+            gid = tag_index.get(tag)
+            if gid is None:
+                gid = tag_index[tag] = len(self._tag_vocab)
+                self._tag_vocab.append(tag)
+                if gid == 256 and tag_ids.typecode == "B":
+                    # More than 256 distinct tags: widen the tag buffer once.
+                    tag_ids = self._tag_ids = array("H", tag_ids)
+            tag_ids.append(gid)
+        self._offsets.append(len(token_ids))
+
+    def _span(self, idx: int) -> Tuple[int, int]:
+        """Bounds of sentence ``idx`` in the flat id buffers (negative indices allowed)."""
+        n = len(self._offsets) - 1
+        if idx < 0:
+            idx += n
+        if not 0 <= idx < n:
+            raise IndexError("sentence index out of range")
+        return self._offsets[idx], self._offsets[idx + 1]
+
+    def _decode(self, vocab: List[str], ids: array, idx: int) -> List[str]:
+        start, end = self._span(idx)
+        return [vocab[i] for i in ids[start:end]]
+
+    @overload  # type: ignore[override]
+    def __getitem__(self, idx: int) -> Item: ...
+
+    @overload
+    def __getitem__(self, idx: IndexKey) -> DatasetView[Item]: ...
+
+    def __getitem__(self, idx: Union[int, IndexKey]) -> Union[Item, DatasetView[Item]]:
+        pos = as_position(idx)
+        if pos is None:
+            return self.select(idx)  # type: ignore[arg-type]
+        idx = pos
+        if self.encoded:
+            if self.return_ids:
+                return self.ids(idx)
+            return (
+                self._decode(self._token_vocab, self._token_ids, idx),
+                self._decode(self._tag_vocab, self._tag_ids, idx),
+            )
+        if self.lazy:
+            tokens, tags, _ = self._parse_lazy(idx)
+            return tokens, tags
         return self._samples[idx], self._labels[idx]
 
+    def select(self, indices: IndexKey) -> DatasetView[Item]:
+        """Return a view over ``indices`` (a slice or integer positions) without copying."""
+        return DatasetView(self, resolve_indices(len(self), indices))
+
+    @overload
+    def prefetch(
+        self, n: int = ..., *, batch_size: None = ..., num_workers: int = ...
+    ) -> Iterator[Item]: ...
+
+    @overload
+    def prefetch(
+        self, n: int = ..., *, batch_size: int, num_workers: int = ...
+    ) -> Iterator[List[Item]]: ...
+
+    def prefetch(
+        self, n: int = 64, *, batch_size: Optional[int] = None, num_workers: int = 0
+    ) -> Union[Iterator[Item], Iterator[List[Item]]]:
+        """Iterate with up to ``n`` items (or batches) loaded ahead in the background.
+
+        A producer thread reads (and, with ``lazy=True``, parses) ahead of the caller; with ``num_workers > 1``
+        index ranges are fetched by a process pool instead. See
+        :func:`ua_datasets.prefetch.prefetch`.
+        """
+        from ua_datasets.prefetch import prefetch
+
+        return prefetch(self, n, batch_size=batch_size, num_workers=num_workers)
+
     def __len__(self) -> int:
+        if self.lazy:
+            return len(self._lazy_starts)
+        if self.encoded:
+            return len(self._offsets) - 1
         return len(self._samples)
 
-    def __iter__(self) -> Iterator[Tuple[Sentence, TagSequence]]:
+    def __iter__(self) -> Iterator[Item]:
+        if self.encoded:
+            for i in range(len(self)):
+                yield self[i]
+            return
+        if self.lazy:
+            yield from self._iter_lazy()
+            return
         for sample, label in zip(self._samples, self._labels, strict=True):
             yield sample, label
 
     def __repr__(self) -> str:
+        if self.lazy:  # counting labels would parse the whole corpus
+            return f"{self.__class__.__name__}(n_sentences={len(self)}, lazy=True)"
         return f"{self.__class__.__name__}(n_sentences={len(self)}, unique_labels={len(self.unique_labels)})"
 
     def _check_exists(self) -> bool:
-        return self.dataset_path.exists()
+        return self._exists(self.dataset_path)
+
+    def _exists(self, path: Path) -> bool:
+        return path in self._bundle if self._bundle is not None else path.exists()
+
+    def _file(self, path: Path) -> FileRange:
+        """``path`` as a byte range of the file system or of :attr:`bundle`."""
+        return FileRange.of(path) if self._bundle is None else self._bundle.file(path)
+
+    def _sentence_index(self, path: Path) -> _SentenceIndex:
+        if self._bundle is None:
+            return _load_sentence_index(path)
+        sidecar = path.with_name(path.name + _INDEX_SUFFIX)
+        packed = self._bundle.file(sidecar) if sidecar in self._bundle else None
+        return _load_sentence_index(self._bundle.file(path), packed)
+
+    def _bundle_entry(self) -> Tuple[Dict[str, Any], Dict[str, FileRange]]:
+        """Options and files that :func:`ua_datasets.bundle.write_bundle` stores for this corpus.
+
+        Every source file is packed together with its sentence index (built
+        now if missing), so ``lazy=True`` opens from the bundle without a scan.
+        """
+        files: Dict[str, FileRange] = {}
+        names: List[str] = []
+        for path in self._source_paths:
+            try:
+                name = path.relative_to(self.root).as_posix()
+            except ValueError:  # absolute extra file outside root
+                name = path.name
+            if name in files:
+                raise BundleError(f"Two source files would be bundled as '{name}'")
+            names.append(name)
+            files[name] = self._file(path)
+            sidecar = path.with_name(path.name + _INDEX_SUFFIX)
+            if self._bundle is None:
+                try:
+                    _load_sentence_index(path)  # writes the sidecar when possible
+                except ParseError:
+                    continue  # '\r'-only line endings cannot be indexed
+            if self._exists(sidecar):
+                files[name + _INDEX_SUFFIX] = self._file(sidecar)
+        return {"file_name": names[0], "extra_files": names[1:]}, files
+
+    @classmethod
+    async def aload(
+        cls,
+        root: Union[str, Path],
+        *,
+        limiter: Optional["asyncio.Semaphore"] = None,
+        executor: Any = None,
+        **kwargs: Any,
+    ) -> "MovaInstitutePOSDataset[S, T]":
+        """Asynchronous constructor: download with non-blocking I/O, parse in ``executor``.
+
+        Accepts the constructor's arguments. A missing corpus file is fetched
+        with :func:`ua_datasets.aio.adownload_text_with_retries` (``limiter``
+        bounds concurrent downloads) and ``DownloadError`` is raised if that
+        fails; parsing (or index building) runs in ``executor`` (default: the
+        loop's thread pool).
+        """
+        from ua_datasets.aio import aload_dataset
+
+        def sources(options: Dict[str, Any]) -> List[Tuple[Path, str]]:
+            return [(Path(root) / options["file_name"], options["data_file"])]
+
+        return await aload_dataset(
+            cls,
+            {**kwargs, "root": root},
+            sources,
+            error=DownloadError,
+            limiter=limiter,
+            executor=executor,
+        )
 
     def download_dataset(self) -> None:
         """Download the raw dataset file if needed using shared retry helper."""
@@ -7,24 +7,126 @@ multiple dataset loaders.
 
 from __future__ import annotations
 
-from hashlib import sha256
+import sys
 from pathlib import Path
 from time import sleep
-from typing import Any, Callable, Optional
-from urllib.error import HTTPError, URLError
-from urllib.request import urlopen
+from typing import TYPE_CHECKING, Any, Callable, Optional, Tuple, Type, Union
+
+from ua_datasets.instrumentation import span
+
+if TYPE_CHECKING:
+    from ua_datasets.progress import ProgressReporter
 
 __all__ = [
     "DownloadFailure",
     "atomic_write_text",
     "download_text_with_retries",
+    "urlopen",
+    "verify_payload",
 ]
 
 
+def urlopen(url: Any, *args: Any, **kwargs: Any) -> Any:
+    """Open ``url`` over a pooled keep-alive connection (``urllib`` semantics).
+
+    Plain ``http(s)`` URLs go through :func:`ua_datasets.http_pool.default_pool`,
+    so repeated downloads from one host (retries, fallback file names, further
+    splits, redirect targets) reuse connections instead of paying a new
+    TCP/TLS handshake each time. ``Request`` objects, extra arguments and
+    environments with proxies configured fall back to ``urllib.request.urlopen``.
+    Everything is imported on first call, which keeps ``import ua_datasets``
+    cheap for processes that never download. Loader modules bind this name as
+    their ``urlopen`` so tests can still monkeypatch it per module.
+    """
+    plain = isinstance(url, str) and url.startswith(("http://", "https://"))
+    if plain and not args and set(kwargs) <= {"timeout"}:
+        from urllib.request import getproxies
+
+        if not getproxies():
+            from ua_datasets.http_pool import default_pool
+
+            return default_pool().urlopen(url, **kwargs)
+    from urllib.request import urlopen as _urlopen
+
+    return _urlopen(url, *args, **kwargs)
+
+
 class DownloadFailure(RuntimeError):
     """Raised when a download ultimately fails after retries."""
 
 
+def _retryable_errors() -> Tuple[Type[Exception], ...]:
+    """Errors worth another attempt; evaluated only once an exception is raised."""
+    # urllib errors can only have been raised if urllib.error was imported.
+    error = sys.modules.get("urllib.error")
+    network = () if error is None else (error.HTTPError, error.URLError)
+    return (*network, TimeoutError, DownloadFailure)
+
+
+def _read_with_progress(resp: Any, url: str, reporter: ProgressReporter, chunk_size: int) -> bytes:
+    """Read ``resp`` in chunks, reporting each one to ``reporter``."""
+    try:
+        total: Optional[int] = int(getattr(resp, "headers", {}).get("Content-Length", "0")) or None
+    except Exception:
+        total = None
+    buf = bytearray()
+    reporter.start(url, total)
+    try:
+        while True:
+            # Some mocked/monkeypatched responses (in tests) provide a read()
+            # method that does NOT accept a size argument OR return the full
+            # payload on every call (no internal cursor). We:
+            #   1. Attempt sized reads
+            #   2. Fallback to a single full read if TypeError is raised
+            #   3. Stop right after a fallback full read to avoid an infinite
+            #      loop continually re-appending identical bytes.
+            try:
+                chunk = resp.read(chunk_size)
+                fallback_full_read = False
+            except TypeError:  # signature read() -> bytes (no size param)
+                chunk = resp.read()
+                fallback_full_read = True
+            if not chunk:
+                break
+            buf.extend(chunk)
+            reporter.advance(url, len(chunk))
+            if fallback_full_read:
+                break
+    finally:
+        reporter.finish(url)
+    return bytes(buf)
+
+
+def verify_payload(
+    url: str,
+    data: bytes,
+    *,
+    expected_sha256: str | None = None,
+    validate: Optional[Callable[[str], bool]] = None,
+) -> str:
+    """Check a downloaded payload and return it decoded as UTF-8.
+
+    Raises ``DownloadFailure`` on a checksum mismatch, empty content or a
+    rejecting ``validate`` predicate, and ``UnicodeDecodeError`` for non-UTF-8
+    data. Shared by the blocking and the asyncio download paths.
+    """
+    with span("verify", url=url, bytes=len(data), sha256=expected_sha256 is not None):
+        if expected_sha256 is not None:
+            from hashlib import sha256
+
+            digest = sha256(data).hexdigest()
+            if digest.lower() != expected_sha256.lower():
+                raise DownloadFailure(
+                    f"SHA256 mismatch for {url}: expected {expected_sha256} got {digest}"
+                )
+        text = data.decode("utf8")
+        if not text.strip():
+            raise DownloadFailure("Downloaded content empty/whitespace.")
+        if validate and not validate(text):
+            raise DownloadFailure("Validation predicate rejected content.")
+    return text
+
+
 def download_text_with_retries(
     url: str,
     *,
@@ -34,13 +136,14 @@ def download_text_with_retries(
     backoff_factor: float = 0.5,
     validate: Optional[Callable[[str], bool]] = None,
     opener: Callable[..., Any] = urlopen,
-    show_progress: bool = False,
-    chunk_size: int = 8192,
+    show_progress: Union[bool, ProgressReporter] = False,
+    chunk_size: int = 1 << 16,
 ) -> str:
     """Download URL returning decoded UTF-8 text with retries & optional integrity.
 
-    Enhanced with an optional streaming progress bar (stdout) using only the
-    standard library to preserve the project's minimal dependency footprint.
+    Progress can be streamed to a pluggable reporter (see :mod:`ua_datasets.progress`)
+    using only the standard library to preserve the project's minimal dependency
+    footprint.
 
     Parameters
     ----------
@@ -58,77 +161,35 @@ def download_text_with_retries(
         Optional predicate applied to decoded text; must return True for success.
     opener : Callable[..., Any]
         Function used to open the URL (injected for test monkeypatching).
-    show_progress : bool
-        If True, prints a simple ASCII progress indicator while streaming.
+    show_progress : bool | ProgressReporter
+        A :class:`~ua_datasets.progress.ProgressReporter` receiving the
+        transfer's progress, or ``True`` for the shared console display, which
+        stays silent when stdout is not a terminal.
     chunk_size : int
-        Byte size for streaming chunks when show_progress is enabled.
+        Byte size for streaming chunks when progress is reported.
     """
+    reporter = None
+    if show_progress:
+        from ua_datasets.progress import resolve_reporter
+
+        reporter = resolve_reporter(show_progress)
     attempt = 0
     last_exc: Exception | None = None
     while attempt < max_retries:
         attempt += 1
         try:
             # Use provided opener (enables test monkeypatching at call sites)
-            with opener(url, timeout=timeout) as resp:  # nosec - caller controls domain
-                if show_progress:
-                    # Attempt to read content length for percentage; fallback to 0 (unknown)
-                    try:
-                        total_size = int(getattr(resp, "headers", {}).get("Content-Length", "0"))
-                    except Exception:
-                        total_size = 0
-                    downloaded = 0
-                    buf = bytearray()
-                    while True:
-                        # Some mocked/monkeypatched responses (in tests) provide a
-                        # read() method that does NOT accept a size argument OR return
-                        # the full payload on every call (no internal cursor). We:
-                        #   1. Attempt sized reads
-                        #   2. Fallback to a single full read if TypeError is raised
-                        #   3. Break immediately after a fallback full read to avoid
-                        #      an infinite loop continually re-appending identical bytes.
-                        try:
-                            chunk = resp.read(chunk_size)
-                            fallback_full_read = False
-                        except TypeError:  # signature read() -> bytes (no size param)
-                            chunk = resp.read()
-                            fallback_full_read = True
-                        if not chunk:
-                            break
-                        buf.extend(chunk)
-                        downloaded += len(chunk)
-                        if total_size > 0:
-                            pct = downloaded / total_size * 100
-                            bar_width = 30
-                            filled = int(bar_width * downloaded / total_size)
-                            bar = "#" * filled + "-" * (bar_width - filled)
-                            print(
-                                f"\rDownloading {url} [{bar}] {pct:5.1f}% ({downloaded}/{total_size} bytes)",
-                                end="",
-                                flush=True,
-                            )
-                        else:
-                            print(f"\rDownloading {url} {downloaded} bytes", end="", flush=True)
-                        if fallback_full_read:
-                            # Prevent infinite loop when mock returns whole content each call
-                            break
-                    data = bytes(buf)
-                    # Ensure newline after completion for clean subsequent output
-                    print()
+            with (
+                span("download", url=url, attempt=attempt) as phase,
+                opener(url, timeout=timeout) as resp,  # nosec - caller controls domain
+            ):
+                if reporter is not None:
+                    data = _read_with_progress(resp, url, reporter, chunk_size)
                 else:
                     data = resp.read()
-            if expected_sha256 is not None:
-                digest = sha256(data).hexdigest()
-                if digest.lower() != expected_sha256.lower():
-                    raise DownloadFailure(
-                        f"SHA256 mismatch for {url}: expected {expected_sha256} got {digest}"
-                    )
-            text = data.decode("utf8")
-            if not text.strip():
-                raise DownloadFailure("Downloaded content empty/whitespace.")
-            if validate and not validate(text):
-                raise DownloadFailure("Validation predicate rejected content.")
-            return text
-        except (HTTPError, URLError, TimeoutError, DownloadFailure) as exc:
+                phase.set(bytes=len(data))
+            return verify_payload(url, data, expected_sha256=expected_sha256, validate=validate)
+        except _retryable_errors() as exc:
             last_exc = exc
             if attempt < max_retries:
                 sleep(backoff_factor * attempt)
@@ -148,6 +209,9 @@ def atomic_write_text(path: Path, text: str, *, encoding: str = "utf8") -> None:
 
     Ensures readers do not observe a partially written file.
     """
-    tmp = path.with_suffix(path.suffix + ".tmp")
-    tmp.write_text(text, encoding=encoding)
-    tmp.replace(path)
+    with span("write", path=str(path)) as phase:
+        tmp = path.with_suffix(path.suffix + ".tmp")
+        tmp.write_text(text, encoding=encoding)
+        tmp.replace(path)
+        if phase.enabled:
+            phase.set(bytes=path.stat().st_size)
@@ -0,0 +1,174 @@
+"""Lightweight index views over loaded datasets.
+
+A :class:`DatasetView` holds a reference to its parent dataset and a sequence of
+row indices; items are fetched from the parent on access, so creating a view
+never copies rows. Dataset classes return views from slicing (``ds[a:b]``),
+index sequences (``ds[[3, 1, 4]]``) and ``ds.select(indices)``.
+"""
+
+from __future__ import annotations
+
+import operator
+from array import array
+from typing import (
+    TYPE_CHECKING,
+    Generic,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Protocol,
+    Sequence,
+    TypeVar,
+    Union,
+    overload,
+)
+
+if TYPE_CHECKING:
+    from ua_datasets.shuffle import ShuffledIterable
+
+__all__ = ["DatasetView", "Indexable"]
+
+T_co = TypeVar("T_co", covariant=True)
+
+# Anything accepted as a subset: a slice or a sequence/iterable of integer positions.
+IndexKey = Union[slice, Iterable[int]]
+
+
+class Indexable(Protocol[T_co]):
+    """Minimal protocol shared by all dataset classes: ``len()`` and integer indexing."""
+
+    def __len__(self) -> int: ...
+
+    def __getitem__(self, idx: int, /) -> T_co: ...
+
+
+def as_position(key: object) -> Optional[int]:
+    """Return ``key`` as an ``int`` if it is a single integer (incl. NumPy scalars), else ``None``."""
+    if isinstance(key, int):
+        return key
+    try:
+        return operator.index(key)  # type: ignore[arg-type]
+    except TypeError:
+        return None
+
+
+def resolve_indices(n: int, key: IndexKey) -> Sequence[int]:
+    """Turn a slice or index sequence over ``n`` items into non-negative positions.
+
+    Slices become ``range`` objects (no allocation); other keys are validated
+    and stored as ``array('Q')``.
+    """
+    if isinstance(key, slice):
+        return range(*key.indices(n))
+    if isinstance(key, range) and (not key or (min(key) >= 0 and max(key) < n)):
+        return key
+    if isinstance(key, (str, bytes)):
+        raise TypeError("Dataset indices must be integers, slices or integer sequences")
+    positions = array("Q")
+    for i in key:
+        i = int(i)
+        if i < 0:
+            i += n
+        if not 0 <= i < n:
+            raise IndexError("dataset index out of range")
+        positions.append(i)
+    return positions
+
+
+class DatasetView(Generic[T_co]):
+    """Read-only subset of ``parent`` addressed through ``indices``.
+
+    Views support ``len()``, iteration, integer indexing and further slicing or
+    index selection, which yields a new view over the same parent, as well as
+    ``shard``, ``prefetch`` and ``shuffled`` over the view's own items. Other
+    dataset attributes (column names, vocabularies, statistics) describe the
+    full dataset and are only available through :attr:`parent`.
+
+    Parameters
+    ----------
+    parent:
+        Any object supporting ``len()`` and integer indexing (all dataset classes).
+    indices:
+        Positions in ``parent`` exposed by the view, in view order.
+    """
+
+    __slots__ = ("_indices", "_parent")
+
+    def __init__(self, parent: Indexable[T_co], indices: Sequence[int]) -> None:
+        self._parent = parent
+        self._indices = indices
+
+    @property
+    def parent(self) -> Indexable[T_co]:
+        return self._parent
+
+    @property
+    def indices(self) -> Sequence[int]:
+        return self._indices
+
+    def __len__(self) -> int:
+        return len(self._indices)
+
+    @overload
+    def __getitem__(self, idx: int) -> T_co: ...
+
+    @overload
+    def __getitem__(self, idx: IndexKey) -> DatasetView[T_co]: ...
+
+    def __getitem__(self, idx: Union[int, IndexKey]) -> Union[T_co, DatasetView[T_co]]:
+        pos = as_position(idx)
+        if pos is not None:
+            return self._parent[self._indices[pos]]
+        return self.select(idx)  # type: ignore[arg-type]
+
+    def select(self, indices: IndexKey) -> DatasetView[T_co]:
+        """View over the given positions of this view (still backed by the parent)."""
+        positions = resolve_indices(len(self), indices)
+        own = self._indices
+        if isinstance(positions, range) and isinstance(own, range):
+            # A range of positions within a range is again a range.
+            step = own.step * positions.step
+            start = own.start + own.step * positions.start if positions else 0
+            return DatasetView(self._parent, range(start, start + step * len(positions), step))
+        return DatasetView(self._parent, array("Q", (own[i] for i in positions)))
+
+    def __iter__(self) -> Iterator[T_co]:
+        parent = self._parent
+        for i in self._indices:
+            yield parent[i]
+
+    def shard(self, num_shards: int, index: int, *, contiguous: bool = False) -> DatasetView[T_co]:
+        """Shard ``index`` of ``num_shards`` disjoint subsets of this view (see ``Dataset.shard``)."""
+        from ua_datasets.sharding import shard_indices
+
+        return self.select(shard_indices(len(self), num_shards, index, contiguous=contiguous))
+
+    @overload
+    def prefetch(
+        self, n: int = ..., *, batch_size: None = ..., num_workers: int = ...
+    ) -> Iterator[T_co]: ...
+
+    @overload
+    def prefetch(
+        self, n: int = ..., *, batch_size: int, num_workers: int = ...
+    ) -> Iterator[List[T_co]]: ...
+
+    def prefetch(
+        self, n: int = 64, *, batch_size: Optional[int] = None, num_workers: int = 0
+    ) -> Union[Iterator[T_co], Iterator[List[T_co]]]:
+        """Iterate over the view with items loaded ahead (see :func:`ua_datasets.prefetch.prefetch`)."""
+        from ua_datasets.prefetch import prefetch
+
+        return prefetch(self, n, batch_size=batch_size, num_workers=num_workers)
+
+    def shuffled(
+        self, *, seed: int = 0, block_size: int = 256, buffer_size: int = 4096
+    ) -> ShuffledIterable[T_co]:
+        """Block + buffer shuffled iteration over the view (see :mod:`ua_datasets.shuffle`)."""
+        from ua_datasets.shuffle import ShuffledIterable
+
+        return ShuffledIterable(self, seed=seed, block_size=block_size, buffer_size=buffer_size)
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}(parent={self._parent.__class__.__name__}, n={len(self)})"
@@ -0,0 +1,420 @@
+"""Streaming token vocabularies for the news, POS and SQuAD corpora.
+
+:class:`VocabularyBuilder` counts tokens either exactly (a ``Counter``) or in
+bounded memory with a count-min sketch plus a capped set of heavy-hitter
+candidates. Builders from different shards can be merged, which is how
+:func:`build_vocabulary` counts in parallel. The resulting :class:`Vocabulary`
+is saved as JSON and can be passed to ``MovaInstitutePOSDataset(encoded=True,
+vocabulary=...)`` so that ids stay stable across runs and corpora.
+
+Example
+-------
+>>> vocab = build_vocabulary(news, field="text", mode="sketch", min_freq=5, top_k=50_000)
+>>> vocab.save("vocab.json")
+>>> ids = vocab.encode(["київ", "столиця"])
+"""
+
+from __future__ import annotations
+
+import json
+from array import array
+from collections import Counter, deque
+from concurrent.futures import Future, ProcessPoolExecutor
+from hashlib import blake2b
+from pathlib import Path
+from typing import (
+    Any,
+    Callable,
+    Deque,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+    Union,
+)
+
+from ua_datasets.utils import atomic_write_text
+
+__all__ = [
+    "CountMinSketch",
+    "Vocabulary",
+    "VocabularyBuilder",
+    "build_vocabulary",
+    "iter_token_sequences",
+]
+
+Tokenizer = Callable[[str], Sequence[str]]
+MODES = ("exact", "sketch")
+_FORMAT_VERSION = 1
+
+
+class CountMinSketch:
+    """Count-min sketch: ``depth`` rows of ``width`` counters, estimates never undercount."""
+
+    __slots__ = ("_table", "depth", "width")
+
+    def __init__(self, width: int = 2**18, depth: int = 4) -> None:
+        if width < 1 or depth < 1:
+            raise ValueError("width and depth must be positive")
+        self.width = width
+        self.depth = depth
+        self._table = array("Q", bytes(8 * width * depth))
+
+    def _cells(self, token: str) -> List[int]:
+        # Two 64-bit halves of one stable digest give ``depth`` hashes via double hashing.
+        digest = blake2b(token.encode("utf8"), digest_size=16).digest()
+        h1 = int.from_bytes(digest[:8], "little")
+        h2 = int.from_bytes(digest[8:], "little") | 1
+        width = self.width
+        return [row * width + (h1 + row * h2) % width for row in range(self.depth)]
+
+    def add(self, token: str, count: int = 1) -> int:
+        """Add ``count`` occurrences of ``token`` and return its new estimate."""
+        table = self._table
+        estimate = None
+        for cell in self._cells(token):
+            value = table[cell] + count
+            table[cell] = value
+            estimate = value if estimate is None else min(estimate, value)
+        assert estimate is not None
+        return estimate
+
+    def estimate(self, token: str) -> int:
+        return min(self._table[cell] for cell in self._cells(token))
+
+    def merge(self, other: CountMinSketch) -> None:
+        """Add the counters of a sketch with the same dimensions."""
+        if (other.width, other.depth) != (self.width, self.depth):
+            raise ValueError("Cannot merge sketches of different dimensions")
+        table = self._table
+        for i, value in enumerate(other._table):
+            if value:
+                table[i] += value
+
+
+class Vocabulary:
+    """Immutable token <-> id mapping with optional counts and unknown token.
+
+    Parameters
+    ----------
+    tokens:
+        Distinct tokens in id order.
+    counts:
+        Optional corpus frequency of every token (``0`` for special tokens).
+    unk_token:
+        Token returned for out-of-vocabulary lookups; must be in ``tokens``.
+        ``None`` makes :meth:`lookup` raise ``KeyError`` instead.
+    """
+
+    __slots__ = ("_counts", "_index", "_tokens", "unk_token")
+
+    def __init__(
+        self,
+        tokens: Sequence[str],
+        counts: Optional[Sequence[int]] = None,
+        *,
+        unk_token: Optional[str] = "<unk>",
+    ) -> None:
+        self._tokens = list(tokens)
+        self._index = {tok: i for i, tok in enumerate(self._tokens)}
+        if len(self._index) != len(self._tokens):
+            raise ValueError("Vocabulary tokens must be distinct")
+        if counts is not None and len(counts) != len(self._tokens):
+            raise ValueError("counts must have one entry per token")
+        if unk_token is not None and unk_token not in self._index:
+            raise ValueError(f"unk_token {unk_token!r} is not in the vocabulary")
+        self._counts = array("Q", counts if counts is not None else bytes(8 * len(self._tokens)))
+        self.unk_token = unk_token
+
+    @property
+    def tokens(self) -> List[str]:
+        """Tokens indexed by id."""
+        return self._tokens
+
+    @property
+    def counts(self) -> array:
+        """Frequency of every token (``array('Q')``), parallel to :attr:`tokens`."""
+        return self._counts
+
+    @property
+    def unk_id(self) -> Optional[int]:
+        return None if self.unk_token is None else self._index[self.unk_token]
+
+    def __len__(self) -> int:
+        return len(self._tokens)
+
+    def __contains__(self, token: object) -> bool:
+        return token in self._index
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._tokens)
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, Vocabulary):
+            return NotImplemented
+        return (self._tokens, self._counts, self.unk_token) == (
+            other._tokens,
+            other._counts,
+            other.unk_token,
+        )
+
+    def lookup(self, token: str) -> int:
+        """Id of ``token``, falling back to the unknown token's id."""
+        tid = self._index.get(token)
+        if tid is None:
+            if self.unk_token is None:
+                raise KeyError(token)
+            return self._index[self.unk_token]
+        return tid
+
+    def encode(self, tokens: Iterable[str]) -> array:
+        """Map tokens to an ``array('I')`` of ids."""
+        return array("I", map(self.lookup, tokens))
+
+    def decode(self, ids: Iterable[int]) -> List[str]:
+        return [self._tokens[i] for i in ids]
+
+    def save(self, path: Union[str, Path]) -> None:
+        """Write the vocabulary as JSON (atomically)."""
+        payload = {
+            "version": _FORMAT_VERSION,
+            "unk_token": self.unk_token,
+            "tokens": self._tokens,
+            "counts": self._counts.tolist(),
+        }
+        atomic_write_text(Path(path), json.dumps(payload, ensure_ascii=False))
+
+    @classmethod
+    def load(cls, path: Union[str, Path]) -> Vocabulary:
+        """Read a vocabulary written by :meth:`save`."""
+        payload = json.loads(Path(path).read_text(encoding="utf8"))
+        if payload.get("version") != _FORMAT_VERSION:
+            raise ValueError(f"Unsupported vocabulary format in '{path}'")
+        return cls(payload["tokens"], payload["counts"], unk_token=payload["unk_token"])
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}(size={len(self)}, unk_token={self.unk_token!r})"
+
+
+class VocabularyBuilder:
+    """Incremental token counter with an exact and a bounded-memory mode.
+
+    Parameters
+    ----------
+    mode:
+        ``"exact"`` keeps every distinct token in a ``Counter``. ``"sketch"``
+        counts into a :class:`CountMinSketch` and tracks only the most frequent
+        candidates, so memory is fixed regardless of corpus size; counts may be
+        slightly overestimated and rare tokens are not retained.
+    width, depth:
+        Sketch dimensions (``"sketch"`` only); memory is ``8 * width * depth`` bytes.
+    max_candidates:
+        Heavy-hitter candidates kept in ``"sketch"`` mode. Should comfortably
+        exceed the ``top_k`` passed to :meth:`build`.
+    """
+
+    def __init__(
+        self,
+        *,
+        mode: str = "exact",
+        width: int = 2**18,
+        depth: int = 4,
+        max_candidates: int = 100_000,
+    ) -> None:
+        if mode not in MODES:
+            raise ValueError(f"Unknown mode {mode!r}. Expected one of: {list(MODES)}")
+        if max_candidates < 1:
+            raise ValueError("max_candidates must be positive")
+        self.mode = mode
+        self.max_candidates = max_candidates
+        self.total = 0
+        self._exact: Counter[str] = Counter()
+        self._sketch = CountMinSketch(width, depth) if mode == "sketch" else None
+        self._candidates: Dict[str, int] = {}
+        self._floor = 0
+
+    def update(self, tokens: Iterable[str]) -> None:
+        """Count one sequence of tokens."""
+        if self._sketch is None:
+            tokens = list(tokens)
+            self._exact.update(tokens)
+            self.total += len(tokens)
+            return
+        sketch, candidates = self._sketch, self._candidates
+        for tok in tokens:
+            self.total += 1
+            estimate = sketch.add(tok)
+            if tok in candidates or estimate > self._floor:
+                candidates[tok] = estimate
+                if len(candidates) >= 2 * self.max_candidates:
+                    self._prune()
+
+    def _prune(self) -> None:
+        """Keep the ``max_candidates`` best candidates; newcomers must beat the floor."""
+        ranked = sorted(self._candidates.items(), key=lambda kv: (-kv[1], kv[0]))
+        self._candidates = dict(ranked[: self.max_candidates])
+        self._floor = (
+            ranked[self.max_candidates - 1][1] if len(ranked) >= self.max_candidates else 0
+        )
+
+    def merge(self, other: VocabularyBuilder) -> None:
+        """Fold in the counts of a builder over a different shard of the corpus."""
+        if other.mode != self.mode:
+            raise ValueError("Cannot merge builders with different modes")
+        self.total += other.total
+        if self._sketch is None:
+            self._exact.update(other._exact)
+            return
+        assert other._sketch is not None
+        self._sketch.merge(other._sketch)
+        sketch = self._sketch
+        for tok in {*self._candidates, *other._candidates}:
+            self._candidates[tok] = sketch.estimate(tok)
+        if len(self._candidates) > self.max_candidates:
+            self._prune()
+
+    def counts(self) -> Dict[str, int]:
+        """Token counts (exact, or sketch estimates of the retained candidates)."""
+        if self._sketch is None:
+            return dict(self._exact)
+        return dict(self._candidates)
+
+    def build(
+        self,
+        *,
+        min_freq: int = 1,
+        top_k: Optional[int] = None,
+        specials: Sequence[str] = ("<pad>", "<unk>"),
+        unk_token: Optional[str] = "<unk>",
+    ) -> Vocabulary:
+        """Create a :class:`Vocabulary`: ``specials`` first, then tokens by falling count.
+
+        Ties are broken alphabetically so the result is deterministic.
+        """
+        ranked = sorted(
+            ((tok, n) for tok, n in self.counts().items() if n >= min_freq and tok not in specials),
+            key=lambda kv: (-kv[1], kv[0]),
+        )
+        if top_k is not None:
+            ranked = ranked[:top_k]
+        tokens = [*specials, *(tok for tok, _ in ranked)]
+        counts = [0] * len(specials) + [n for _, n in ranked]
+        return Vocabulary(tokens, counts, unk_token=unk_token)
+
+
+def iter_token_sequences(
+    dataset: Any, field: Optional[str] = None, tokenizer: Optional[Tokenizer] = None
+) -> Iterator[Sequence[str]]:
+    """Yield token sequences from a text field of any of the three datasets.
+
+    Fields: ``"tokens"`` (default) or ``"tags"`` for POS; a CSV column (default
+    ``"text"``) for news; ``"context"``, ``"question"`` (default) or ``"title"``
+    for SQuAD. Raw text is split with ``tokenizer`` (``str.split`` by default);
+    POS sequences are already tokenized.
+    """
+    from ua_datasets.question_answering.uasquad_question_answering import UaSquadDataset
+    from ua_datasets.text_classification.news_classification import NewsClassificationDataset
+    from ua_datasets.token_classification.part_of_speech import MovaInstitutePOSDataset
+
+    split = tokenizer if tokenizer is not None else str.split
+    if isinstance(dataset, MovaInstitutePOSDataset):
+        if field not in (None, "tokens", "tags"):
+            raise ValueError(f"Unknown POS field {field!r}; expected 'tokens' or 'tags'")
+        yield from dataset.labels if field == "tags" else dataset.data
+    elif isinstance(dataset, NewsClassificationDataset):
+        field = field or "text"
+        if field not in dataset.column_names:
+            raise ValueError(f"Unknown field {field!r}; expected one of {dataset.column_names}")
+        col = dataset.column_names.index(field)
+        for row in dataset.data:
+            yield split(row[col])
+    elif isinstance(dataset, UaSquadDataset):
+        field = field or "question"
+        if field not in ("context", "question", "title"):
+            raise ValueError(f"Unknown field {field!r}; expected 'context', 'question' or 'title'")
+        for example in dataset:
+            yield split(example[field])
+    else:
+        raise TypeError(f"Unsupported dataset type: {type(dataset).__name__}")
+
+
+def _count_chunk(sequences: List[Sequence[str]], options: Dict[str, Any]) -> VocabularyBuilder:
+    """Count one shard of token sequences (process pool worker)."""
+    builder = VocabularyBuilder(**options)
+    for tokens in sequences:
+        builder.update(tokens)
+    return builder
+
+
+def _chunked(items: Iterable[Sequence[str]], size: int) -> Iterator[List[Sequence[str]]]:
+    chunk: List[Sequence[str]] = []
+    for item in items:
+        chunk.append(item)
+        if len(chunk) == size:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+
+def build_vocabulary(
+    dataset: Any,
+    *,
+    field: Optional[str] = None,
+    tokenizer: Optional[Tokenizer] = None,
+    mode: str = "exact",
+    min_freq: int = 1,
+    top_k: Optional[int] = None,
+    specials: Sequence[str] = ("<pad>", "<unk>"),
+    unk_token: Optional[str] = "<unk>",
+    num_workers: int = 0,
+    chunk_size: int = 10_000,
+    **builder_options: Any,
+) -> Vocabulary:
+    """Count tokens of a dataset field and build a pruned :class:`Vocabulary`.
+
+    Parameters
+    ----------
+    dataset, field, tokenizer:
+        See :func:`iter_token_sequences`. ``tokenizer`` must be picklable when
+        ``num_workers > 1``.
+    mode:
+        ``"exact"`` or ``"sketch"`` (see :class:`VocabularyBuilder`).
+    min_freq, top_k, specials, unk_token:
+        See :meth:`VocabularyBuilder.build`.
+    num_workers:
+        If greater than 1, chunks of ``chunk_size`` sequences are counted in a
+        process pool (at most ``2 * num_workers`` in flight) and merged.
+    builder_options:
+        Extra :class:`VocabularyBuilder` arguments (``width``, ``depth``,
+        ``max_candidates``).
+    """
+    if chunk_size < 1:
+        raise ValueError("chunk_size must be positive")
+    options = {"mode": mode, **builder_options}
+    total = VocabularyBuilder(**options)
+    sequences = iter_token_sequences(dataset, field, tokenizer)
+    if num_workers > 1:
+        with ProcessPoolExecutor(max_workers=num_workers) as pool:
+            pending: Deque[Future[VocabularyBuilder]] = deque()
+            for chunk in _chunked(sequences, chunk_size):
+                pending.append(pool.submit(_count_chunk, chunk, options))
+                if len(pending) >= 2 * num_workers:
+                    total.merge(pending.popleft().result())
+            while pending:
+                total.merge(pending.popleft().result())
+    else:
+        for tokens in sequences:
+            total.update(tokens)
+    return total.build(min_freq=min_freq, top_k=top_k, specials=specials, unk_token=unk_token)
+
+
+def _as_vocabulary(value: Union[Vocabulary, str, Path]) -> Tuple[Vocabulary, int]:
+    """Resolve a vocabulary argument and its unknown-token id (for fixed-vocab encoding)."""
+    vocab = value if isinstance(value, Vocabulary) else Vocabulary.load(value)
+    if vocab.unk_id is None:
+        raise ValueError("A vocabulary used for encoding needs an unk_token")
+    return vocab, vocab.unk_id